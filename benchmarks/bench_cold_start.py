@@ -0,0 +1,174 @@
+"""Cold-start cost of every exercise entry point.
+
+Each exercise module is imported in fresh interpreters. For every module the
+report shows the median import time, peak RSS, the time of the first
+``graph.invoke(default_input)`` and the cumulative import time of the heavy
+dependencies it pulls in. A dependency is charged to whichever import loaded it
+first, so nested packages (e.g. langchain_core under langgraph) only show up
+when they are imported directly.
+
+    python -m benchmarks.bench_cold_start                  # compare to baseline
+    python -m benchmarks.bench_cold_start --save-baseline  # record a new baseline
+    python -m benchmarks.bench_cold_start --check          # exit 1 on regression
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from benchmarks.common import (
+    ROOT,
+    load_baseline,
+    parse_importtime,
+    print_table,
+    run_python,
+    save_baseline,
+)
+
+BASELINE_NAME = "cold_start"
+
+HEAVY_DEPENDENCIES = [
+    "langchain_community",
+    "langchain_openai",
+    "pydantic_settings",
+    "langgraph",
+    "langchain_core",
+]
+
+# Metrics compared against the baseline, lower is better
+TRACKED_METRICS = ["import_ms", "peak_rss_mb", "first_invoke_ms"]
+
+CHILD_SNIPPET = """
+import json, resource, sys, time
+
+result = {{}}
+start = time.perf_counter()
+try:
+    module = __import__({module!r}, fromlist=["*"])
+except Exception as exc:
+    result["error"] = f"import: {{type(exc).__name__}}: {{exc}}"
+    module = None
+result["import_ms"] = (time.perf_counter() - start) * 1000
+
+graph = getattr(module, "graph", None)
+default_input = getattr(module, "default_input", None)
+if module is not None and hasattr(graph, "invoke") and default_input is not None:
+    start = time.perf_counter()
+    try:
+        graph.invoke(default_input)
+        result["first_invoke_ms"] = (time.perf_counter() - start) * 1000
+    except Exception as exc:
+        result["error"] = f"invoke: {{type(exc).__name__}}: {{exc}}"
+
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+result["peak_rss_mb"] = rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+print(json.dumps(result))
+"""
+
+
+def discover_modules() -> list[str]:
+    """Return the dotted names of every exercise module."""
+    paths = sorted((ROOT / "src" / "exercises").glob("unit*/exercise*.py"))
+    return [
+        ".".join(path.relative_to(ROOT).with_suffix("").parts) for path in paths
+    ]
+
+
+def measure(module: str, runs: int) -> dict:
+    """Measure one module over several fresh interpreters."""
+    samples = []
+    for _ in range(runs):
+        process = run_python(CHILD_SNIPPET.format(module=module))
+        samples.append(json.loads(process.stdout.strip().splitlines()[-1]))
+
+    result: dict = {}
+    for metric in TRACKED_METRICS:
+        values = [sample[metric] for sample in samples if metric in sample]
+        if values:
+            result[metric] = statistics.median(values)
+    errors = {sample["error"] for sample in samples if "error" in sample}
+    if errors:
+        result["error"] = sorted(errors)[0]
+
+    try:
+        process = run_python(f"import {module}", xoptions=["importtime"])
+        timings = parse_importtime(process.stderr)
+    except subprocess.CalledProcessError as exc:
+        timings = parse_importtime(exc.stderr)
+    result["dependencies_ms"] = {
+        dep: timings[dep][1] / 1000 for dep in HEAVY_DEPENDENCIES if dep in timings
+    }
+    return result
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """List the tracked metrics that got worse than the baseline by > tolerance."""
+    regressions = []
+    for module, metrics in current.items():
+        for metric in TRACKED_METRICS:
+            before = baseline.get(module, {}).get(metric)
+            after = metrics.get(metric)
+            if before and after and after > before * (1 + tolerance):
+                regressions.append(
+                    f"{module} {metric}: {before:.1f} -> {after:.1f} "
+                    f"(+{(after / before - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def _fmt(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    results = {module: measure(module, args.runs) for module in discover_modules()}
+
+    print(f"Cold start, median of {args.runs} fresh interpreters (ms / MB)\n")
+    print_table(
+        ["module", "import", "peak RSS", "first invoke", *HEAVY_DEPENDENCIES],
+        [
+            [
+                module,
+                _fmt(metrics.get("import_ms")),
+                _fmt(metrics.get("peak_rss_mb")),
+                _fmt(metrics.get("first_invoke_ms")),
+                *(_fmt(metrics["dependencies_ms"].get(d)) for d in HEAVY_DEPENDENCIES),
+            ]
+            for module, metrics in results.items()
+        ],
+    )
+    errors = {m: r["error"] for m, r in results.items() if "error" in r}
+    for module, error in errors.items():
+        print(f"note: {module}: {error}")
+
+    if args.save_baseline:
+        print(f"\nBaseline saved to {save_baseline(BASELINE_NAME, results)}")
+        return
+
+    baseline = load_baseline(BASELINE_NAME)
+    if baseline is None:
+        print("\nNo baseline yet; record one with --save-baseline")
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    if not regressions:
+        print(f"\nNo regressions beyond {args.tolerance:.0%} of the baseline")
+        return
+    print("\nRegressions:")
+    for line in regressions:
+        print(f"  {line}")
+    if args.check:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Checkpoint blob size and time with and without a trained dictionary.
+
+Trains a dictionary on states from shorter runs of each graph, then serializes
+every channel of a longer run the way a checkpointer does. zstd rows are only
+shown when zstandard is installed.
+
+    python -m benchmarks.bench_compression
+"""
+
+import argparse
+import time
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from benchmarks.common import median_ms, print_table
+from benchmarks.states import exercise21_state, exercise23_state
+from src.compression import CompressedSerializer, train_dictionary, zstandard
+
+GRAPHS = {
+    "exercise 2.1": (exercise21_state, range(1, 9), 10),
+    "exercise 2.3": (exercise23_state, range(1, 9), 10),
+}
+
+
+def channel_blobs(serde, states) -> list[bytes]:
+    return [serde.dumps_typed(value)[1] for state in states for value in state.values()]
+
+
+def measure(serde, state: dict, repeat: int) -> tuple[int, float, float]:
+    """Return (total bytes, median dump ms, median load ms) for all channels."""
+    blobs = [serde.dumps_typed(value) for value in state.values()]
+    dumps, loads = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in state.values():
+            serde.dumps_typed(value)
+        dumps.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        for blob in blobs:
+            serde.loads_typed(blob)
+        loads.append(time.perf_counter() - start)
+    return sum(len(blob) for _, blob in blobs), median_ms(dumps), median_ms(loads)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    codecs = ["zlib"] + (["zstd"] if zstandard is not None else [])
+    rows = []
+    for name, (build, training_sizes, size) in GRAPHS.items():
+        base = JsonPlusSerializer()
+        samples = channel_blobs(base, [build(n) for n in training_sizes])
+        state = build(size)
+        serializers = {"none": base}
+        for codec in codecs:
+            dictionary = train_dictionary(samples, codec=codec)
+            serializers[codec] = CompressedSerializer(base, codec=codec)
+            serializers[f"{codec}+dict"] = CompressedSerializer(
+                base, codec=codec, dictionary=dictionary
+            )
+
+        baseline_size = None
+        for label, serde in serializers.items():
+            total, dump_ms, load_ms = measure(serde, state, args.repeat)
+            baseline_size = baseline_size or total
+            rows.append(
+                [
+                    name,
+                    label,
+                    total,
+                    f"{baseline_size / total:.2f}x",
+                    f"{dump_ms:.3f}",
+                    f"{load_ms:.3f}",
+                ]
+            )
+
+    print(f"Bytes per checkpoint (all channels), median of {args.repeat} runs\n")
+    print_table(["graph", "codec", "bytes", "ratio", "dump ms", "load ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Import-time cost of settings loading for exercise 2.2.
+
+Compares importing ``src.exercises.unit2.exercise2`` as it is now (settings are
+resolved lazily) against forcing ``get_settings()`` before the import, which is
+what the old module-level ``settings = Settings()`` did for every importer.
+
+    python -m benchmarks.bench_import_time --runs 20
+"""
+
+import argparse
+
+from benchmarks.common import (
+    median_ms,
+    parse_importtime,
+    print_table,
+    run_python,
+    timed_import_snippet,
+)
+
+SCENARIOS = {
+    "lazy settings": "",
+    "eager settings": "import src.config; src.config.get_settings()",
+}
+
+REPORTED_MODULES = ["pydantic_settings", "src.config"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="src.exercises.unit2.exercise2")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    rows = []
+    for name, setup in SCENARIOS.items():
+        snippet = timed_import_snippet(setup, args.module)
+        samples = [float(run_python(snippet).stdout) for _ in range(args.runs)]
+        timings = parse_importtime(run_python(snippet, xoptions=["importtime"]).stderr)
+        rows.append(
+            [
+                name,
+                f"{median_ms(samples):.1f}",
+                *(
+                    f"{timings.get(module, (0, 0))[1] / 1000:.1f}"
+                    for module in REPORTED_MODULES
+                ),
+            ]
+        )
+
+    print(f"Import of {args.module}, median of {args.runs} fresh interpreters\n")
+    print_table(
+        ["scenario", "wall ms", *(f"{m} cum ms" for m in REPORTED_MODULES)], rows
+    )
+    saving = float(rows[1][1]) - float(rows[0][1])
+    print(f"\nSaving from lazy settings: {saving:.1f} ms per cold start")
+
+
+if __name__ == "__main__":
+    main()
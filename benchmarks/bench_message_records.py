@@ -0,0 +1,83 @@
+"""Per-conversation memory of BaseMessage vs MessageRecord state.
+
+Each session holds the three-turn scripted conversation from exercise 1.2
+(human, AI, human, each with timestamp metadata). Memory is measured with
+tracemalloc while every session is alive at once.
+
+    python -m benchmarks.bench_message_records --sessions 100000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from benchmarks.common import print_table
+from src.message_records import MessageRecord
+
+TURNS = (("human", "Hello!"), ("ai", "How are you?"), ("human", "Goodbye!"))
+
+
+def message_session(session: int) -> list:
+    return [
+        (HumanMessage if role == "human" else AIMessage)(
+            content=text,
+            id=f"{session}-{turn}",
+            metadata={"timestamp": turn},
+        )
+        for turn, (role, text) in enumerate(TURNS)
+    ]
+
+
+def record_session(session: int) -> list:
+    return [
+        MessageRecord(role, text, f"{session}-{turn}", None, {"timestamp": turn})
+        for turn, (role, text) in enumerate(TURNS)
+    ]
+
+
+def measure(build: Callable[[int], list], sessions: int) -> tuple[float, float]:
+    """Return (bytes per session, seconds to build all sessions)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    alive = [build(session) for session in range(sessions)]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del alive
+    return current / sessions, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=100_000)
+    args = parser.parse_args()
+
+    baseline_bytes, baseline_time = measure(message_session, args.sessions)
+    record_bytes, record_time = measure(record_session, args.sessions)
+
+    rows = [
+        [
+            "BaseMessage",
+            f"{baseline_bytes:.0f}",
+            f"{baseline_bytes * args.sessions / 2**20:.1f}",
+            f"{baseline_time:.2f}",
+        ],
+        [
+            "MessageRecord",
+            f"{record_bytes:.0f}",
+            f"{record_bytes * args.sessions / 2**20:.1f}",
+            f"{record_time:.2f}",
+        ],
+    ]
+    print(f"{args.sessions} concurrent sessions, {len(TURNS)} messages each\n")
+    print_table(["representation", "bytes/session", "total MiB", "build s"], rows)
+    print(f"\nReduction: {baseline_bytes / record_bytes:.1f}x less memory per session")
+
+
+if __name__ == "__main__":
+    main()
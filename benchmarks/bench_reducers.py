@@ -0,0 +1,72 @@
+"""Per-update cost of add_messages vs indexed_messages on long histories.
+
+Each scenario applies single-message updates (appends, then replacements of a
+random existing ID) to a history of the given size, the way a node returning
+``{"messages": [...]}`` does on every step.
+
+    python -m benchmarks.bench_reducers --sizes 100 10000 100000
+"""
+
+import argparse
+import random
+import time
+
+from langchain_core.messages import AIMessage
+from langgraph.graph.message import add_messages
+
+from benchmarks.common import print_table
+from src.reducers import indexed_messages
+
+
+def history(size: int) -> list:
+    return [AIMessage(content=f"message {i}", id=f"id-{i}") for i in range(size)]
+
+
+def time_updates(reducer, size: int, updates: int, replace: bool) -> float:
+    """Average seconds per reducer call."""
+    rng = random.Random(0)
+    value = reducer([], history(size))
+    batches = [
+        [
+            AIMessage(
+                content="edited" if replace else f"new {i}",
+                id=f"id-{rng.randrange(size)}" if replace else f"new-{i}",
+            )
+        ]
+        for i in range(updates)
+    ]
+    start = time.perf_counter()
+    for batch in batches:
+        value = reducer(value, batch)
+    return (time.perf_counter() - start) / updates
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--updates", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        for operation, replace in (("append", False), ("replace", True)):
+            baseline = time_updates(add_messages, size, args.updates, replace)
+            indexed = time_updates(indexed_messages, size, args.updates, replace)
+            rows.append(
+                [
+                    size,
+                    operation,
+                    f"{baseline * 1e6:.1f}",
+                    f"{indexed * 1e6:.1f}",
+                    f"{baseline / indexed:.0f}x",
+                ]
+            )
+
+    print(f"Microseconds per single-message update ({args.updates} updates)\n")
+    print_table(
+        ["history", "operation", "add_messages", "indexed_messages", "speedup"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
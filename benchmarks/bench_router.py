@@ -0,0 +1,159 @@
+"""Throughput and per-route latency of the exercise 1.3 router graph.
+
+Drives the graph with a synthetic corpus (see benchmarks.workloads), once with
+sequential graph.invoke calls and once with graph.abatch. Reports messages/sec
+for both, p50/p99 latency per generated intent for invoke, and p50/p99 batch
+latency for abatch (abatch does not expose per-message timings). Messages the
+router sent somewhere other than their generated intent are counted as
+mismatches. Uses the exercise graph when it is implemented, otherwise a
+reference router built from the exercise's routing table.
+
+    python -m benchmarks.bench_router --messages 5000 --repetition 0.7
+"""
+
+import argparse
+import asyncio
+import time
+from collections import defaultdict
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, START, StateGraph
+
+from benchmarks.common import percentile, print_table
+from benchmarks.workloads import WorkloadSpec, generate_messages
+from src.exercises.unit1 import exercise3
+from src.routing import RouteSpec, compile_routes
+
+RESPONSES = {
+    "greeting": "Hello there!",
+    "help": "How can I help you?",
+    "unknown": "I don't understand.",
+}
+
+
+def reference_graph():
+    """Keyword classifier plus a compiled routing table, as in exercise 1.3."""
+
+    def classifier(state: exercise3.State) -> dict:
+        text = state["messages"][-1].content
+        label = exercise3.classification_cache.get_or_compute(
+            text, lambda t: exercise3.keyword_matcher.classify(t, "unknown")
+        )
+        confidence = 0.1 if label == "unknown" else 0.9
+        return {"classification": label, "confidence": confidence}
+
+    def respond(label: str):
+        return lambda state: {"messages": [AIMessage(content=RESPONSES[label])]}
+
+    builder = StateGraph(exercise3.State)
+    builder.add_node("classifier", classifier)
+    for label in RESPONSES:
+        builder.add_node(f"{label}_response", respond(label))
+        builder.add_edge(f"{label}_response", END)
+    builder.add_edge(START, "classifier")
+    router = compile_routes(
+        RouteSpec(
+            key="classification",
+            routes={"greeting": "greeting_response", "help": "help_response"},
+            default="unknown_response",
+        ),
+        builder,
+    )
+    builder.add_conditional_edges("classifier", router, router.path_map)
+    return builder.compile()
+
+
+def make_input(text: str) -> dict:
+    return {**exercise3.default_input, "messages": [HumanMessage(content=text)]}
+
+
+def run_invoke(graph, corpus) -> tuple[float, dict[str, list[float]], int]:
+    """Sequential invoke.
+
+    Returns:
+        (elapsed seconds, latencies per generated intent, mismatches)
+    """
+    latencies = defaultdict(list)
+    mismatches = 0
+    start = time.perf_counter()
+    for intent, text in corpus:
+        began = time.perf_counter()
+        result = graph.invoke(make_input(text))
+        latencies[intent].append(time.perf_counter() - began)
+        mismatches += result["classification"] != intent
+    return time.perf_counter() - start, latencies, mismatches
+
+
+async def run_abatch(
+    graph, corpus, batch_size: int
+) -> tuple[float, dict[str, list[float]], int]:
+    """abatch in chunks.
+
+    Returns:
+        (elapsed seconds, {"batch": latency of each batch}, mismatches)
+    """
+    batches = []
+    mismatches = 0
+    start = time.perf_counter()
+    for offset in range(0, len(corpus), batch_size):
+        chunk = corpus[offset : offset + batch_size]
+        began = time.perf_counter()
+        results = await graph.abatch([make_input(text) for _, text in chunk])
+        batches.append(time.perf_counter() - began)
+        mismatches += sum(
+            result["classification"] != intent
+            for (intent, _), result in zip(chunk, results, strict=True)
+        )
+    return time.perf_counter() - start, {"batch": batches}, mismatches
+
+
+def rows_for(
+    mode: str, messages: int, elapsed: float, latencies: dict, mismatches: int
+) -> list[list]:
+    rows = [[mode, "all", messages, mismatches, f"{messages / elapsed:.0f}", "", ""]]
+    for group, samples in sorted(latencies.items()):
+        rows.append(
+            [
+                mode,
+                group,
+                len(samples),
+                "",
+                "",
+                f"{percentile(samples, 50) * 1000:.3f}",
+                f"{percentile(samples, 99) * 1000:.3f}",
+            ]
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--repetition", type=float, default=0.5)
+    parser.add_argument("--mean-words", type=float, default=6.0)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    spec = WorkloadSpec(
+        mean_words=args.mean_words, repetition_rate=args.repetition, seed=args.seed
+    )
+    corpus = generate_messages(args.messages, spec)
+    graph = exercise3.graph or reference_graph()
+    graph.invoke(make_input("warmup"))
+
+    count = len(corpus)
+    rows = rows_for("invoke", count, *run_invoke(graph, corpus))
+    abatch = asyncio.run(run_abatch(graph, corpus, args.batch_size))
+    rows += rows_for("abatch", count, *abatch)
+
+    source = "exercise" if exercise3.graph is not None else "reference"
+    print(f"{args.messages} messages, {source} router graph\n")
+    print_table(
+        ["mode", "intent", "messages", "mismatched", "msg/s", "p50 ms", "p99 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
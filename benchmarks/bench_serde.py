@@ -0,0 +1,66 @@
+"""Checkpoint serialization: JsonPlusSerializer vs MessagePackSerializer.
+
+Serializes each channel of the exercise 2.3 state the way a checkpointer does
+(one dumps_typed call per channel value) and reports size and round-trip time.
+
+    python -m benchmarks.bench_serde --tools 5 50
+"""
+
+import argparse
+import time
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from benchmarks.common import median_ms, print_table
+from benchmarks.states import exercise23_state
+from src.serde import MessagePackSerializer
+
+
+def measure(serde, state: dict, repeat: int) -> tuple[int, float, float]:
+    """Return (total bytes, median dump ms, median load ms) for all channels."""
+    blobs = {key: serde.dumps_typed(value) for key, value in state.items()}
+    for key, blob in blobs.items():
+        if serde.loads_typed(blob) != state[key]:
+            raise AssertionError(f"{type(serde).__name__} did not round-trip {key}")
+
+    dumps, loads = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in state.values():
+            serde.dumps_typed(value)
+        dumps.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        for blob in blobs.values():
+            serde.loads_typed(blob)
+        loads.append(time.perf_counter() - start)
+    size = sum(len(payload) for _, payload in blobs.values())
+    return size, median_ms(dumps), median_ms(loads)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tools", type=int, nargs="+", default=[5, 50])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = []
+    for tools in args.tools:
+        state = exercise23_state(tools)
+        for serde in (JsonPlusSerializer(), MessagePackSerializer()):
+            size, dump_ms, load_ms = measure(serde, state, args.repeat)
+            rows.append(
+                [
+                    tools,
+                    type(serde).__name__,
+                    size,
+                    f"{dump_ms:.3f}",
+                    f"{load_ms:.3f}",
+                ]
+            )
+
+    print(f"Exercise 2.3 state, median of {args.repeat} checkpoints\n")
+    print_table(["tools", "serializer", "bytes", "dump ms", "load ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Allocations per superstep: ``{**state, ...}`` copies vs delta-only updates.
+
+A superstep is simulated as one exercise 2.2 style node (bump a tool_usage
+counter, set tool_name) followed by applying its update to every channel it
+returned, the way LangGraph does. Allocation is measured with tracemalloc as
+the peak traced memory during the step.
+
+    python -m benchmarks.bench_state_updates --history 10 1000 10000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from langchain_core.messages import HumanMessage
+from langgraph.graph.message import add_messages
+
+from benchmarks.common import print_table
+from src.state_updates import merge_maps
+
+TOOLS = ("calculator", "check_weather", "search")
+
+
+def make_state(history: int) -> dict:
+    return {
+        "messages": add_messages(
+            [], [HumanMessage(content=f"turn {i}", id=str(i)) for i in range(history)]
+        ),
+        "available_tools": list(TOOLS),
+        "tool_usage": dict.fromkeys(TOOLS, 0),
+        "rate_limits": dict.fromkeys(TOOLS, 100),
+        "tool_name": None,
+        "tool_outputs": [],
+    }
+
+
+def copying_node(state: dict, tool: str) -> dict:
+    usage = {**state["tool_usage"], tool: state["tool_usage"][tool] + 1}
+    return {**state, "tool_usage": usage, "tool_name": tool}
+
+
+def delta_node(state: dict, tool: str) -> dict:
+    return {"tool_usage": {tool: state["tool_usage"][tool] + 1}, "tool_name": tool}
+
+
+REDUCERS = {"messages": add_messages}
+
+
+def apply(state: dict, update: dict, reducers: dict) -> dict:
+    """Apply an update channel by channel (reducer or last value)."""
+    for key, value in update.items():
+        reducer = reducers.get(key)
+        state[key] = reducer(state[key], value) if reducer else value
+    return state
+
+
+def measure(node, reducers: dict, history: int, steps: int) -> tuple[float, float]:
+    """Return (peak KiB allocated per step, microseconds per step)."""
+    state = make_state(history)
+    peaks = []
+    start = time.perf_counter()
+    for step in range(steps):
+        tracemalloc.start()
+        apply(state, node(state, TOOLS[step % len(TOOLS)]), reducers)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    elapsed = time.perf_counter() - start
+    return sum(peaks) / steps / 1024, elapsed / steps * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--history", type=int, nargs="+", default=[10, 1000, 10_000])
+    parser.add_argument("--steps", type=int, default=100)
+    args = parser.parse_args()
+
+    rows = []
+    for history in args.history:
+        copy_kib, copy_us = measure(copying_node, REDUCERS, history, args.steps)
+        delta_kib, delta_us = measure(
+            delta_node, {**REDUCERS, "tool_usage": merge_maps}, history, args.steps
+        )
+        rows.append(
+            [
+                history,
+                f"{copy_kib:.1f}",
+                f"{delta_kib:.1f}",
+                f"{copy_us:.0f}",
+                f"{delta_us:.0f}",
+            ]
+        )
+
+    print(f"Per superstep, averaged over {args.steps} steps\n")
+    print_table(["messages", "copy KiB", "delta KiB", "copy us", "delta us"], rows)
+
+
+if __name__ == "__main__":
+    main()
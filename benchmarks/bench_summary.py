@@ -0,0 +1,74 @@
+"""Full-history summary rebuild vs incremental fold over long conversations.
+
+Both build the summary once per turn; the table shows total time and the final
+summary length.
+
+    python -m benchmarks.bench_summary --turns 10000
+"""
+
+import argparse
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from benchmarks.common import print_table
+from src.summary import SEPARATOR, SUMMARY_PREFIX, fold_summary
+
+
+def make_messages(turns: int) -> list:
+    return [
+        (HumanMessage if turn % 2 == 0 else AIMessage)(
+            content=f"turn {turn}: some message text", id=f"msg-{turn}"
+        )
+        for turn in range(turns)
+    ]
+
+
+def rebuild(messages: list) -> tuple[float, int]:
+    """The reference pattern: join every message on every turn."""
+    start = time.perf_counter()
+    summary = ""
+    for end in range(1, len(messages) + 1):
+        summary = SUMMARY_PREFIX + SEPARATOR.join(m.content for m in messages[:end])
+    return time.perf_counter() - start, len(summary)
+
+
+def fold(messages: list, window: int, max_chars: int) -> tuple[float, int]:
+    """Incremental fold over a sliding window of recent messages."""
+    start = time.perf_counter()
+    summary, cursor = "", None
+    for end in range(1, len(messages) + 1):
+        summary, cursor = fold_summary(
+            summary, cursor, messages[max(0, end - window) : end], max_chars=max_chars
+        )
+    return time.perf_counter() - start, len(summary)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=10_000)
+    parser.add_argument("--window", type=int, default=3)
+    parser.add_argument("--max-chars", type=int, default=2000)
+    args = parser.parse_args()
+
+    messages = make_messages(args.turns)
+    rows = []
+    for name, (seconds, length) in {
+        "rebuild every turn": rebuild(messages),
+        "incremental fold": fold(messages, args.window, args.max_chars),
+    }.items():
+        rows.append(
+            [
+                name,
+                f"{seconds * 1000:.1f}",
+                f"{seconds / args.turns * 1e6:.2f}",
+                length,
+            ]
+        )
+
+    print(f"Summary generation over {args.turns} turns\n")
+    print_table(["strategy", "total ms", "us / turn", "final chars"], rows)
+
+
+if __name__ == "__main__":
+    main()
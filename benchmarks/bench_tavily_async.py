@@ -0,0 +1,94 @@
+"""Concurrent Tavily searches: asyncio.to_thread(invoke) vs native ainvoke.
+
+Runs N concurrent searches through the shared TavilySearchResults setup
+(PooledTavilySearchAPIWrapper) against the local stand-in server
+(src.tavily_server) answering after a fixed latency. The server runs on its
+own thread and event loop, so it does not compete with the client's loop.
+Reports wall time, throughput and p50/p99 per-call latency for each mode and
+concurrency level.
+
+    python -m benchmarks.bench_tavily_async --concurrency 10 100 1000
+"""
+
+import argparse
+import asyncio
+import time
+
+from langchain_community.tools import TavilySearchResults
+
+from benchmarks.common import percentile, print_table
+from src.clients import POOL_SIZE, registry
+from src.tavily import PooledTavilySearchAPIWrapper
+from src.tavily_server import ServerProfile, StandInServer
+
+
+async def timed(call) -> float:
+    began = time.perf_counter()
+    await call
+    return time.perf_counter() - began
+
+
+async def run(tool, mode: str, concurrency: int) -> tuple[float, list[float]]:
+    """Issue concurrency searches at once; returns (wall seconds, latencies)."""
+
+    def call(i: int):
+        args = {"query": f"query {i}"}
+        if mode == "to_thread":
+            return asyncio.to_thread(tool.invoke, args)
+        return tool.ainvoke(args)
+
+    began = time.perf_counter()
+    latencies = await asyncio.gather(*(timed(call(i)) for i in range(concurrency)))
+    return time.perf_counter() - began, latencies
+
+
+async def bench(tool, levels: list[int], repeat: int) -> list[list]:
+    rows = []
+    try:
+        for concurrency in levels:
+            for mode in ("to_thread", "ainvoke"):
+                await run(tool, mode, min(concurrency, 32))  # warm up connections
+                walls, latencies = [], []
+                for _ in range(repeat):
+                    wall, samples = await run(tool, mode, concurrency)
+                    walls.append(wall)
+                    latencies += samples
+                wall = min(walls)
+                rows.append(
+                    [
+                        concurrency,
+                        mode,
+                        f"{wall * 1000:.0f}",
+                        f"{concurrency / wall:.0f}",
+                        f"{percentile(latencies, 50) * 1000:.1f}",
+                        f"{percentile(latencies, 99) * 1000:.1f}",
+                    ]
+                )
+    finally:
+        # Close this loop's aiohttp session, or it is reported as unclosed
+        await registry.aclose()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--latency", type=float, default=0.05, help="server seconds")
+    parser.add_argument("--pool-size", type=int, default=POOL_SIZE)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Applies to the sessions the registry creates from here on
+    registry.pool_size = args.pool_size
+    with StandInServer(ServerProfile(latency_ms=args.latency * 1000)) as server:
+        wrapper = PooledTavilySearchAPIWrapper(
+            tavily_api_key="tvly-benchmark", api_url=server.url
+        )
+        tool = TavilySearchResults(api_wrapper=wrapper)
+        rows = asyncio.run(bench(tool, args.concurrency, args.repeat))
+    print(f"server latency {args.latency * 1000:.0f} ms, pool size {args.pool_size}\n")
+    print_table(["concurrency", "mode", "wall ms", "calls/s", "p50 ms", "p99 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
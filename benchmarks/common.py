@@ -0,0 +1,129 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks are run from the repository root, e.g.:
+
+    python -m benchmarks.bench_import_time
+"""
+
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_DIR = ROOT / "benchmarks" / "baselines"
+
+# Placeholder keys so modules that resolve secrets can be imported offline
+DUMMY_KEYS = {
+    "OPENAI_API_KEY": "sk-benchmark",
+    "TAVILY_API_KEY": "tvly-benchmark",
+}
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)")
+
+
+def run_python(
+    code: str,
+    *,
+    env: dict[str, str] | None = None,
+    xoptions: Sequence[str] = (),
+) -> subprocess.CompletedProcess[str]:
+    """Run a snippet in a fresh interpreter rooted at the repository.
+
+    Args:
+        code: Python source passed to ``-c``
+        env: Extra environment variables for the child process
+        xoptions: Values for ``-X`` (e.g. "importtime")
+
+    Returns:
+        The completed process with captured text output
+    """
+    args = [sys.executable]
+    for option in xoptions:
+        args += ["-X", option]
+    args += ["-c", code]
+
+    child_env = {**os.environ, **DUMMY_KEYS, **(env or {})}
+    child_env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(ROOT), child_env.get("PYTHONPATH")])
+    )
+    return subprocess.run(
+        args, cwd=ROOT, env=child_env, capture_output=True, text=True, check=True
+    )
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Parse ``-X importtime`` output.
+
+    Args:
+        stderr: Standard error of an interpreter run with ``-X importtime``
+
+    Returns:
+        Mapping of module name to (self, cumulative) time in microseconds.
+        Only the first (outermost) import of each module is kept.
+    """
+    timings: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, module = match.groups()
+            timings.setdefault(module, (int(self_us), int(cumulative_us)))
+    return timings
+
+
+def timed_import_snippet(setup: str, module: str) -> str:
+    """Build a snippet that prints the wall time of ``setup`` + ``import module``."""
+    return (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{setup}\n"
+        f"import {module}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+
+
+def median_ms(samples: Sequence[float]) -> float:
+    """Median of samples given in seconds, in milliseconds."""
+    return statistics.median(samples) * 1000
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of samples (pct in 0..100)."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[object]]) -> None:
+    """Print rows as a left-aligned plain text table."""
+    cells = [[str(h) for h in headers], *[[str(c) for c in row] for row in rows]]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for index, row in enumerate(cells):
+        line = "  ".join(
+            cell.ljust(width) for cell, width in zip(row, widths, strict=True)
+        )
+        print(line.rstrip())
+        if index == 0:
+            print("  ".join("-" * width for width in widths))
+
+
+def load_baseline(name: str) -> dict | None:
+    """Load a stored baseline by name, or None if none has been saved."""
+    path = BASELINE_DIR / f"{name}.json"
+    if not path.is_file():
+        return None
+    return json.loads(path.read_text())
+
+
+def save_baseline(name: str, data: dict) -> Path:
+    """Store a baseline by name and return its path."""
+    BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+    path = BASELINE_DIR / f"{name}.json"
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+    return path
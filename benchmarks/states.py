@@ -0,0 +1,98 @@
+"""Representative channel values of the exercise graphs for the benchmarks.
+
+The exercises are skeletons, so these mirror the state their solutions
+checkpoint: search tool calls, JSON-encoded Tavily payloads and the messages
+built from them.
+"""
+
+import json
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+CITIES = ("Paris", "London", "Berlin", "Madrid", "Rome", "Vienna", "Lisbon")
+
+
+def tavily_results(query: str, count: int = 3) -> list[dict]:
+    """Search results in the shape TavilySearchResults returns."""
+    return [
+        {
+            "url": f"https://example.com/{query.replace(' ', '-').lower()}/{rank}",
+            "content": (
+                f"{query}: result {rank}. The city is the capital and largest city "
+                "of the country, with an estimated population of several million "
+                "residents in its metropolitan area."
+            ),
+            "score": round(0.9 - rank * 0.1, 2),
+        }
+        for rank in range(count)
+    ]
+
+
+def exercise21_state(turns: int = 5) -> dict:
+    """Exercise 2.1 state after the given number of search turns."""
+    messages = []
+    for turn in range(turns):
+        city = CITIES[turn % len(CITIES)]
+        query = f"capital of the country where {city} is"
+        messages += [
+            HumanMessage(content=f"What is the capital of the country with {city}?"),
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "tavily_search_results_json",
+                        "args": {"query": query},
+                        "id": f"call-{turn}",
+                    }
+                ],
+            ),
+            HumanMessage(content=json.dumps(tavily_results(query))),
+            AIMessage(content="Thanks for the information!"),
+        ]
+    return {
+        "messages": messages,
+        "tool_calls": [],
+        "tool_outputs": [json.dumps(tavily_results("last query"))],
+    }
+
+
+def exercise23_state(tools: int = 5) -> dict:
+    """Exercise 2.3 state after a fan-out over the given number of searches."""
+    pending = [
+        {
+            "id": f"call-{i}",
+            "tool_name": "search",
+            "args": {"query": f"capital city {CITIES[i % len(CITIES)]} {i}"},
+        }
+        for i in range(tools)
+    ]
+    results = {
+        call["id"]: tavily_results(call["args"]["query"]) for call in pending[1:]
+    }
+    errors = {pending[0]["id"]: "Tool execution failed: rate limit exceeded"}
+    messages = [
+        HumanMessage(content="Research the capitals"),
+        AIMessage(
+            content="",
+            tool_calls=[
+                {"name": "search", "args": call["args"], "id": call["id"]}
+                for call in pending
+            ],
+            usage_metadata={
+                "input_tokens": 120,
+                "output_tokens": 48,
+                "total_tokens": 168,
+            },
+        ),
+        *[
+            ToolMessage(content=json.dumps(result), tool_call_id=call_id)
+            for call_id, result in results.items()
+        ],
+        AIMessage(content=f"Found results for {len(results)} of {tools} searches"),
+    ]
+    return {
+        "messages": messages,
+        "pending_tools": pending,
+        "results": results,
+        "errors": errors,
+    }
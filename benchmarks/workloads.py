@@ -0,0 +1,121 @@
+"""Synthetic message corpora for the router benchmarks.
+
+Messages are drawn from an intent mix, padded to a length sampled from a
+log-normal word-count distribution, and repeated from a small "hot set" at a
+configurable rate. Popular hot messages repeat more often (Zipf-like), as
+"hello" and "help" do in real traffic. Generation is deterministic for a seed.
+
+Every phrase contains a routing keyword of its intent (see exercise 1.3's
+ROUTING_KEYWORDS) and no filler word does, so a keyword router should send
+each message to its generated intent.
+
+    from benchmarks.workloads import WorkloadSpec, generate_messages
+    corpus = generate_messages(10_000, WorkloadSpec(repetition_rate=0.7))
+"""
+
+import math
+import random
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+INTENT_PHRASES: Mapping[str, tuple[str, ...]] = {
+    "greeting": ("hello", "hi", "hey", "hello there", "hi, good morning", "hey you"),
+    "help": (
+        "help",
+        "i need help",
+        "can you help me",
+        "please help",
+        "i need support",
+        "help me with my order",
+    ),
+    "unknown": (
+        "foo bar",
+        "the weather is nice",
+        "bananas",
+        "tell me about trains",
+        "what is the meaning of life",
+        "blue",
+    ),
+}
+
+FILLER_WORDS = (
+    "today",
+    "please",
+    "my",
+    "account",
+    "quickly",
+    "the",
+    "order",
+    "again",
+    "with",
+    "thanks",
+    "now",
+    "later",
+)
+
+
+@dataclass(frozen=True)
+class WorkloadSpec:
+    """Shape of a generated corpus.
+
+    Attributes:
+        intent_mix: Relative weight of each intent
+        mean_words: Mean message length in words
+        length_sigma: Spread of the log-normal length distribution
+        repetition_rate: Probability that a message repeats a hot message
+        hot_set_size: Number of distinct messages that get repeated
+        seed: Random seed
+    """
+
+    intent_mix: Mapping[str, float] = field(
+        default_factory=lambda: {"greeting": 0.4, "help": 0.4, "unknown": 0.2}
+    )
+    mean_words: float = 6.0
+    length_sigma: float = 0.6
+    repetition_rate: float = 0.5
+    hot_set_size: int = 20
+    seed: int = 0
+
+
+def _message(rng: random.Random, intent: str, spec: WorkloadSpec) -> str:
+    mu = math.log(spec.mean_words) - spec.length_sigma**2 / 2
+    length = max(1, round(rng.lognormvariate(mu, spec.length_sigma)))
+    words = rng.choice(INTENT_PHRASES[intent]).split()
+    words += rng.choices(FILLER_WORDS, k=max(0, length - len(words)))
+    return " ".join(words)
+
+
+def generate_messages(
+    count: int, spec: WorkloadSpec | None = None
+) -> list[tuple[str, str]]:
+    """Generate (intent, text) pairs.
+
+    Args:
+        count: Number of messages
+        spec: Corpus shape (default: WorkloadSpec())
+
+    Returns:
+        The corpus, in arrival order
+    """
+    spec = spec or WorkloadSpec()
+    unknown = set(spec.intent_mix) - set(INTENT_PHRASES)
+    if unknown:
+        raise ValueError(f"No phrases for intents: {sorted(unknown)}")
+    rng = random.Random(spec.seed)
+    intents = list(spec.intent_mix)
+    weights = list(spec.intent_mix.values())
+
+    hot = []
+    for _ in range(spec.hot_set_size):
+        intent = rng.choices(intents, weights)[0]
+        hot.append((intent, _message(rng, intent, spec)))
+    hot_weights = [1 / (rank + 1) for rank in range(len(hot))]
+
+    corpus = []
+    for _ in range(count):
+        if hot and rng.random() < spec.repetition_rate:
+            corpus.append(rng.choices(hot, hot_weights)[0])
+        else:
+            intent = rng.choices(intents, weights)[0]
+            corpus.append((intent, _message(rng, intent, spec)))
+    return corpus
@@ -11,10 +11,10 @@ import json
 from typing import Annotated, Any, TypedDict
 # Import the necessary message type from langchain_core.messages
 from langchain_core.messages import BaseMessage
-# Import the TavilySearchResults tool from langchain_community.tools
-from langchain_community.tools import TavilySearchResults
 # Import the add_messages function from langgraph.graph.message
 from langgraph.graph.message import add_messages
+# Import the shared tool accessor from src.clients
+from src.clients import get_tavily_tool
 
 
 # Define the State class as before
@@ -35,8 +35,9 @@ def tool_executor(state: State) -> State:
 
     # Get the last tool call from the tool_calls list
     tool_call = state["tool_calls"][-1]
-    # Create an instance of the TavilySearchResults tool
-    tavily_tool = TavilySearchResults()
+    # Reuse the process-wide TavilySearchResults tool instead of building one
+    # (and opening a new connection) on every call
+    tavily_tool = get_tavily_tool()
 
     try:
         # If the tool name is "TavilySearchResults", execute the tool with the given arguments
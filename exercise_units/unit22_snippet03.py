@@ -32,23 +32,21 @@ def check_rate_limit(state: State, tool_name: str) -> bool:
     return usage < limit
 
 # Define a function called update_usage that takes in the current state and a tool name
-# and returns an updated state with the tool usage count incremented
-def update_usage(state: State, tool_name: str) -> State:
+# and returns only the state keys that change (LangGraph merges them into the state)
+def update_usage(state: State, tool_name: str) -> dict:
     """Update tool usage counts."""
     # If the tool has not exceeded its rate limit
     if check_rate_limit(state, tool_name):
-        # Return an updated state with the tool usage count incremented
+        # Return just the updated tool_usage dictionary with the count incremented
         return {
-            **state,  # Keep the existing state
-            "tool_usage": {  # Update the tool_usage dictionary
+            "tool_usage": {
                 **state["tool_usage"],  # Keep the existing tool usage counts
                 tool_name: state["tool_usage"].get(tool_name, 0) + 1  # Increment the count for the given tool
             }
         }
-    # Otherwise, return a new state with a rate limit exceeded message
+    # Otherwise, return just the new rate limit exceeded message (add_messages appends it)
     return {
-        **state,  # Keep the existing state
-        "messages": [AIMessage(content=f"Rate limit exceeded for {tool_name}")]  # Add a rate limit exceeded message
+        "messages": [AIMessage(content=f"Rate limit exceeded for {tool_name}")]
     }
 
 # Example usage:
@@ -23,12 +23,12 @@ class State(TypedDict):
 
 
 # Define a function called execute_direct_tool that takes in the current state and a tool
-# and returns an updated state with the tool execution result
-def execute_direct_tool(state: State, tool: Any) -> State:
+# and returns only the state keys that change (the tool execution result)
+def execute_direct_tool(state: State, tool: Any) -> dict:
     """Execute a tool directly."""
     # If there is no tool name in the state, return an empty list of tool outputs
     if not state.get("tool_name"):
-        return {**state, "tool_outputs": []}
+        return {"tool_outputs": []}
 
     # Get the content of the last message in the messages list
     message = state["messages"][-1].content
@@ -41,8 +41,8 @@ def execute_direct_tool(state: State, tool: Any) -> State:
     else:
         output = "Tool not found"  # Return an error message if the tool is not found
 
-    # Return an updated state with the tool output in the tool_outputs list
-    return {**state, "tool_outputs": [output]}
+    # Return just the tool output in the tool_outputs list
+    return {"tool_outputs": [output]}
 
 
 # Example usage with calculator tool:
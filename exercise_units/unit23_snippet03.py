@@ -7,10 +7,8 @@ Key Concepts:
 - Single tool execution
 - Error handling
 """
-import asyncio  # Import the asyncio library for asynchronous operations
+
 from typing import Any  # Import Any for type hinting
-# Import the TavilySearchResults tool from langchain_community.tools
-from langchain_community.tools import TavilySearchResults
 
 # Reference to previously defined components
 # Assuming the mock_tool function is defined in a separate file called snippets.py
@@ -18,8 +16,11 @@ from snippets import (  # Normally from your implementation
     mock_tool,  # Import the mock_tool function
 )
 
-# Initialize the real TavilySearchResults tool
-tavily_tool = TavilySearchResults()
+# Import the shared tool registry from src.clients
+from src.clients import registry
+
+# Reuse the process-wide TavilySearchResults tool (built on first use)
+tavily_tool = registry.lazy("tavily")
 
 
 # Define an asynchronous function to execute a single tool
@@ -35,29 +36,30 @@ async def execute_tool(tool_call: dict) -> tuple[str, Any]:
         # If the tool is the mock tool, call it directly
         if tool_call["tool_name"] == "mock_tool":
             result = mock_tool(tool_call["args"].get("query", "mock query"))
-            return tool_call["id"], result["results"]["mock_tool"]  # Return the mock result
-        # Otherwise, execute the Tavily tool in a separate thread
+            # Return the mock result
+            return tool_call["id"], result["results"]["mock_tool"]
+        # Otherwise, execute the Tavily tool natively on the event loop
         else:
-            result = await asyncio.to_thread(  # Use asyncio.to_thread to run the synchronous tool in a separate thread
-                tavily_tool.invoke,  # The synchronous tool to execute
-                tool_call["args"]  # The arguments to the tool
-            )
+            # ainvoke sends the request through the shared aiohttp connection
+            # pool, so no thread-pool worker is held while waiting for Tavily
+            result = await tavily_tool.ainvoke(tool_call["args"])
             return tool_call["id"], result[0]  # Return the result
     except Exception as e:  # Handle any exceptions during tool execution
-        return tool_call["id"], f"Error: {str(e)}"  # Return the error message
+        return tool_call["id"], f"Error: {e!s}"  # Return the error message
 
 
 # Example usage of the execute_tool function
 async def example():
     # Define a tool call for the mock tool
-    tool_call = {
-        "id": "mock_1",
-        "tool_name": "mock_tool",
-        "args": {"query": "test"}
-    }
-    # Execute the tool asynchronously and get the result
-    tool_id, result = await execute_tool(tool_call)
-    # Print the tool ID and the result
-    print(f"{tool_id}: {result}")  # Output: mock_1: mock_value
-
-# Run the example function using asyncio.run(example())
\ No newline at end of file
+    tool_call = {"id": "mock_1", "tool_name": "mock_tool", "args": {"query": "test"}}
+    try:
+        # Execute the tool asynchronously and get the result
+        tool_id, result = await execute_tool(tool_call)
+        # Print the tool ID and the result
+        print(f"{tool_id}: {result}")  # Output: mock_1: mock_value
+    finally:
+        # Close this event loop's pooled aiohttp session before the loop ends
+        await registry.aclose()
+
+
+# Run the example function using asyncio.run(example())
@@ -0,0 +1,130 @@
+# src/classification_cache.py
+"""Bounded LRU cache for message classifications.
+
+Router traffic is dominated by a few short, repeated messages ("hello",
+"help", "thanks"). ClassificationCache maps normalized message text to the
+classification result, so a repeated intent skips the classifier entirely.
+Entries beyond maxsize are evicted least recently used first, and hits, misses
+and evictions are counted.
+
+The cache is guarded by a lock that is only held for dictionary operations,
+never while the classifier runs. That makes it safe for sync nodes running in
+LangGraph's thread pool and for async nodes. Two concurrent misses on the same
+text may both classify it; the result is the same either way.
+
+Example:
+    cache = ClassificationCache(maxsize=1024)
+    label, confidence = cache.get_or_compute(text, classifier.classify)
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAXSIZE = 1024
+
+_WHITESPACE = re.compile(r"\s+")
+
+_MISSING = object()
+
+
+def normalize_text(text: str) -> str:
+    """Build the cache key for a message.
+
+    Case-folds, collapses whitespace and drops trailing sentence punctuation,
+    so "Hello!" and " hello" share a key.
+    """
+    return _WHITESPACE.sub(" ", text.casefold()).strip().rstrip(".!?").rstrip()
+
+
+class ClassificationCache:
+    """Thread-safe LRU cache from normalized text to classification.
+
+    Args:
+        maxsize: Maximum number of entries
+        normalize: Function mapping message text to the cache key
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        normalize: Callable[[str], str] = normalize_text,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.normalize = normalize
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, text: str, default: Any = None) -> Any:
+        """Return the cached classification for text, counting a hit or miss."""
+        key = self.normalize(text)
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, text: str, value: Any) -> None:
+        """Store a classification, evicting the least recently used entry."""
+        key = self.normalize(text)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, text: str, classify: Callable[[str], T]) -> T:
+        """Return the cached classification, or classify text and cache it."""
+        value = self.get(text, _MISSING)
+        if value is _MISSING:
+            value = classify(text)
+            self.put(text, value)
+        return value
+
+    async def aget_or_compute(
+        self, text: str, classify: Callable[[str], Awaitable[T]]
+    ) -> T:
+        """Async variant of get_or_compute for async classifiers."""
+        value = self.get(text, _MISSING)
+        if value is _MISSING:
+            value = await classify(text)
+            self.put(text, value)
+        return value
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Counters for logging or metrics."""
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,311 @@
+# src/classifier.py
+"""Vectorized batch message classifier with calibrated probabilities.
+
+Messages are turned into fixed-size feature vectors with the hashing trick
+(word unigrams and character trigrams hashed into n_features signed columns,
+L2-normalized), scored by a linear softmax model, and converted to
+probabilities with a fitted temperature. Scoring a batch is a handful of NumPy
+operations over all messages at once, so one call can classify thousands of
+messages.
+
+default_classifier() returns a small model for the exercise 1.3 intents
+("greeting", "help", "unknown"), trained on the built-in SEED_EXAMPLES. Its
+temperature is fitted on cross-validated (out-of-fold) scores, so it is never
+calibrated on examples the scoring model was trained on.
+
+Example:
+    classifier = default_classifier()
+    label, confidence = classifier.classify("Hello there")
+    labels = classifier.predict(messages)  # [(label, probability), ...]
+
+    # Offline triage over a large corpus, in fixed-size batches
+    for label, probability in classify_batches(lines): ...
+"""
+
+import functools
+import itertools
+import math
+import re
+import zlib
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
+
+DEFAULT_FEATURES = 2**12
+DEFAULT_BATCH_SIZE = 4096
+
+# Always present, so every message has at least one feature (acts as a bias)
+_BIAS_TOKEN = "\x00bias"
+_WORD = re.compile(r"\w+|[^\w\s]")
+
+# Temperatures tried by calibrate(), log-spaced
+_TEMPERATURES = np.logspace(-1.5, 1.5, 121)
+
+SEED_EXAMPLES: Mapping[str, Sequence[str]] = {
+    "greeting": (
+        "hello",
+        "hi",
+        "hey",
+        "hello there",
+        "hi there",
+        "hey there",
+        "good morning",
+        "good evening",
+        "greetings",
+        "howdy",
+        "hello, how are you?",
+        "hi! nice to meet you",
+    ),
+    "help": (
+        "help",
+        "i need help",
+        "can you help me?",
+        "please help",
+        "i need support",
+        "could you assist me",
+        "help me with this",
+        "how do i do this?",
+        "i have a problem",
+        "support please",
+        "can you assist with my account",
+        "i need some help",
+    ),
+    "unknown": (
+        "foo bar",
+        "the sky is blue",
+        "bananas",
+        "random text",
+        "lorem ipsum dolor",
+        "purple monkey dishwasher",
+        "42",
+        "table and chair",
+        "the quick brown fox",
+        "trains are nice",
+        "asdf qwerty",
+        "it rained yesterday",
+    ),
+}
+
+
+def tokenize(text: str) -> list[str]:
+    """Return the hashed feature tokens: bias, words and character trigrams."""
+    words = _WORD.findall(text.lower())
+    padded = f" {' '.join(words)} "
+    return [
+        _BIAS_TOKEN,
+        *(f"w:{word}" for word in words),
+        *(f"c:{padded[i : i + 3]}" for i in range(len(padded) - 2)),
+    ]
+
+
+class HashingFeaturizer:
+    """Map texts to sparse, L2-normalized signed hashing features.
+
+    Args:
+        n_features: Number of hash columns
+    """
+
+    def __init__(self, n_features: int = DEFAULT_FEATURES) -> None:
+        if not 0 < n_features <= 2**31:
+            raise ValueError("n_features must be between 1 and 2**31")
+        self.n_features = n_features
+
+    def transform(
+        self, texts: Iterable[str]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Featurize a batch in CSR layout.
+
+        Returns:
+            (offsets, columns, values): the features of text i are
+            columns[offsets[i]:offsets[i + 1]] with matching values
+        """
+        offsets = [0]
+        columns: list[int] = []
+        values: list[float] = []
+        for text in texts:
+            row: dict[int, float] = {}
+            for token in tokenize(text):
+                digest = zlib.crc32(token.encode())
+                column = digest % self.n_features
+                row[column] = row.get(column, 0.0) + (
+                    1.0 if digest & 0x80000000 else -1.0
+                )
+            norm = math.sqrt(sum(value * value for value in row.values())) or 1.0
+            columns.extend(row)
+            values.extend(value / norm for value in row.values())
+            offsets.append(len(columns))
+        return (
+            np.asarray(offsets, dtype=np.intp),
+            np.asarray(columns, dtype=np.intp),
+            np.asarray(values, dtype=np.float64),
+        )
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    shifted = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+def _fit_temperature(logits: np.ndarray, targets: np.ndarray) -> float:
+    """Return the temperature in _TEMPERATURES with the lowest log loss."""
+    mask = targets.astype(bool)
+    losses = [
+        -np.log(_softmax(logits / temperature)[mask] + 1e-12).mean()
+        for temperature in _TEMPERATURES
+    ]
+    return float(_TEMPERATURES[int(np.argmin(losses))])
+
+
+class BatchClassifier:
+    """Linear softmax classifier over hashing features.
+
+    Args:
+        labels: Class labels, in column order
+        n_features: Number of hash columns
+        temperature: Softmax temperature applied to the logits
+    """
+
+    def __init__(
+        self,
+        labels: Sequence[str],
+        n_features: int = DEFAULT_FEATURES,
+        *,
+        temperature: float = 1.0,
+    ) -> None:
+        if len(set(labels)) != len(labels) or len(labels) < 2:
+            raise ValueError("labels must contain at least two distinct labels")
+        self.labels = tuple(labels)
+        self.featurizer = HashingFeaturizer(n_features)
+        self.weights = np.zeros((n_features, len(self.labels)))
+        self.temperature = temperature
+
+    def _logits(self, features: tuple[np.ndarray, ...]) -> np.ndarray:
+        offsets, columns, values = features
+        if len(offsets) == 1:
+            return np.empty((0, len(self.labels)))
+        contributions = self.weights[columns] * values[:, None]
+        return np.add.reduceat(contributions, offsets[:-1], axis=0)
+
+    def _targets(self, labels: Sequence[str]) -> np.ndarray:
+        index = {label: i for i, label in enumerate(self.labels)}
+        try:
+            columns = [index[label] for label in labels]
+        except KeyError as error:
+            raise ValueError(f"Unknown label {error.args[0]!r}") from None
+        targets = np.zeros((len(columns), len(self.labels)))
+        targets[np.arange(len(columns)), columns] = 1.0
+        return targets
+
+    def fit(
+        self,
+        texts: Sequence[str],
+        labels: Sequence[str],
+        *,
+        epochs: int = 300,
+        learning_rate: float = 2.0,
+        l2: float = 1e-4,
+    ) -> "BatchClassifier":
+        """Train from scratch with full-batch gradient descent on log loss.
+
+        Resets the temperature to 1; call calibrate() afterwards, or use
+        fit_calibrated() instead.
+        """
+        if len(texts) != len(labels):
+            raise ValueError("texts and labels must have the same length")
+        features = self.featurizer.transform(texts)
+        offsets, columns, values = features
+        rows = np.repeat(np.arange(len(texts)), np.diff(offsets))
+        targets = self._targets(labels)
+        self.weights = np.zeros_like(self.weights)
+        self.temperature = 1.0
+
+        for _ in range(epochs):
+            error = (_softmax(self._logits(features)) - targets) / len(texts)
+            gradient = l2 * self.weights
+            np.add.at(gradient, columns, values[:, None] * error[rows])
+            self.weights -= learning_rate * gradient
+        return self
+
+    def calibrate(self, texts: Sequence[str], labels: Sequence[str]) -> float:
+        """Fit the temperature that minimizes log loss on held-out examples.
+
+        Returns:
+            The fitted temperature
+        """
+        logits = self._logits(self.featurizer.transform(texts))
+        self.temperature = _fit_temperature(logits, self._targets(labels))
+        return self.temperature
+
+    def fit_calibrated(
+        self, texts: Sequence[str], labels: Sequence[str], *, folds: int = 4
+    ) -> "BatchClassifier":
+        """Train on every example, with a cross-validated temperature.
+
+        Each example is scored by a model trained on the other folds, the
+        temperature is fitted on those out-of-fold scores, and the final model
+        is then trained on everything. Folds take every folds-th example, so
+        they are stratified when the examples are grouped by label.
+
+        Raises:
+            ValueError: If folds is less than 2 or more than the examples
+        """
+        if not 2 <= folds <= len(texts):
+            raise ValueError("folds must be between 2 and the number of examples")
+        if len(texts) != len(labels):
+            raise ValueError("texts and labels must have the same length")
+        logits = np.empty((len(texts), len(self.labels)))
+        for fold in range(folds):
+            held_out = np.arange(fold, len(texts), folds)
+            train = np.setdiff1d(np.arange(len(texts)), held_out)
+            model = BatchClassifier(self.labels, self.featurizer.n_features)
+            model.fit([texts[i] for i in train], [labels[i] for i in train])
+            held_out_texts = [texts[i] for i in held_out]
+            logits[held_out] = model._logits(model.featurizer.transform(held_out_texts))
+
+        self.fit(texts, labels)
+        self.temperature = _fit_temperature(logits, self._targets(labels))
+        return self
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """Return an (n_texts, n_labels) array of calibrated probabilities."""
+        logits = self._logits(self.featurizer.transform(texts))
+        return _softmax(logits / self.temperature)
+
+    def predict(self, texts: Sequence[str]) -> list[tuple[str, float]]:
+        """Return the most likely label and its probability for each text."""
+        probabilities = self.predict_proba(texts)
+        best = probabilities.argmax(axis=1)
+        return [
+            (self.labels[column], float(probabilities[row, column]))
+            for row, column in enumerate(best)
+        ]
+
+    def classify(self, text: str) -> tuple[str, float]:
+        """Classify a single message; returns (label, confidence)."""
+        return self.predict([text])[0]
+
+
+@functools.cache
+def default_classifier() -> BatchClassifier:
+    """Return the shared classifier for the exercise 1.3 intents."""
+    examples = [
+        (text, label) for label, texts in SEED_EXAMPLES.items() for text in texts
+    ]
+    texts, labels = zip(*examples, strict=True)
+    return BatchClassifier(tuple(SEED_EXAMPLES)).fit_calibrated(texts, labels)
+
+
+def classify_batches(
+    texts: Iterable[str],
+    classifier: BatchClassifier | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[tuple[str, float]]:
+    """Classify a stream of messages in batches, yielding (label, probability).
+
+    Memory stays bounded by batch_size however long the stream is.
+    """
+    classifier = classifier or default_classifier()
+    iterator = iter(texts)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield from classifier.predict(batch)
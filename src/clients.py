@@ -0,0 +1,259 @@
+# src/clients.py
+"""Process-wide registry of lazily created API clients.
+
+The chat model and the Tavily search tool are created on first use and shared by
+every graph in the process. Tools that talk HTTP send their requests through one
+pooled requests.Session (and one aiohttp.ClientSession per event loop), so
+connections and TLS sessions are reused across tool invocations.
+
+Set TAVILY_API_URL (environment or .env) to send searches somewhere other than
+the Tavily API, e.g. the local stand-in from src.tavily_server.
+
+Example:
+    from src.clients import get_tavily_tool
+
+    results = get_tavily_tool().invoke({"query": "capital of France"})
+"""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from src.config import get_secret
+
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+
+# Maximum number of pooled connections per host
+POOL_SIZE = 32
+
+# Seconds before an HTTP request to an external tool is abandoned
+HTTP_TIMEOUT = 30.0
+
+
+class ClientRegistry:
+    """Thread-safe registry that builds each named client once, on first use.
+
+    Factories run under a lock, so concurrent threads (or async tasks that call
+    get() from the event loop) never build the same client twice. Lookups of
+    clients that already exist do not take the lock.
+    """
+
+    def __init__(self, pool_size: int = POOL_SIZE) -> None:
+        self.pool_size = pool_size
+        self._factories: dict[str, Callable[[], Any]] = {}
+        self._clients: dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._http_session: requests.Session | None = None
+        self._async_sessions: dict[
+            asyncio.AbstractEventLoop, aiohttp.ClientSession
+        ] = {}
+
+    def register(
+        self, name: str, factory: Callable[[], Any], *, replace: bool = False
+    ) -> None:
+        """Register a factory for a named client.
+
+        Args:
+            name: Client name used with get()
+            factory: Zero-argument callable that builds the client
+            replace: Allow overriding an existing factory. Any client already
+                built by the old factory is discarded.
+
+        Raises:
+            ValueError: If the name is taken and replace is False
+        """
+        with self._lock:
+            if name in self._factories and not replace:
+                raise ValueError(f"Client {name!r} is already registered")
+            self._factories[name] = factory
+            self._clients.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """Return the named client, building it on first use.
+
+        Raises:
+            KeyError: If no factory is registered under the name
+        """
+        try:
+            return self._clients[name]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if name not in self._clients:
+                if name not in self._factories:
+                    raise KeyError(f"No client registered as {name!r}")
+                self._clients[name] = self._factories[name]()
+            return self._clients[name]
+
+    def lazy(self, name: str) -> "LazyClient":
+        """Return a proxy that resolves the named client on first attribute access."""
+        return LazyClient(self, name)
+
+    def http_session(self) -> "requests.Session":
+        """Return the shared, connection-pooled requests session."""
+        if self._http_session is not None:
+            return self._http_session
+
+        with self._lock:
+            if self._http_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_size, pool_maxsize=self.pool_size
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._http_session = session
+            return self._http_session
+
+    def async_http_session(self) -> "aiohttp.ClientSession":
+        """Return the shared aiohttp session for the running event loop.
+
+        aiohttp sessions are bound to the loop that created them, so one session
+        is kept per loop. Sessions of loops that have been closed are dropped.
+
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is not None and not session.closed:
+            return session
+
+        with self._lock:
+            for stale in [other for other in self._async_sessions if other.is_closed()]:
+                del self._async_sessions[stale]
+
+            session = self._async_sessions.get(loop)
+            if session is None or session.closed:
+                import aiohttp
+
+                session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit_per_host=self.pool_size),
+                    timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+                )
+                self._async_sessions[loop] = session
+            return session
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session that belongs to the running event loop."""
+        session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    def reset(self) -> None:
+        """Drop every built client and close the shared HTTP sessions.
+
+        Factories stay registered, so clients are rebuilt on next use. Each
+        aiohttp session is closed on its own loop: scheduled there if the loop
+        is running (this one or another thread's), run to completion if it is
+        idle, and detached if the loop is already closed, since its
+        connections went with it.
+        """
+        with self._lock:
+            self._clients.clear()
+            sessions, self._async_sessions = self._async_sessions, {}
+            if self._http_session is not None:
+                self._http_session.close()
+                self._http_session = None
+
+        for loop, session in sessions.items():
+            if session.closed:
+                continue
+            if loop.is_closed():
+                session.detach()
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+            else:
+                loop.run_until_complete(session.close())
+
+
+class LazyClient:
+    """Stand-in for a registry client that defers building it until used.
+
+    Lets modules keep a module-level name such as ``tavily_tool`` without
+    paying for the client at import. Attribute access, calls and ``|``
+    composition are forwarded to the client, and ``__class__`` reports the
+    client's class, so isinstance checks pass. That is enough for LangChain
+    and LangGraph APIs that expect the real object, e.g. ``prompt | llm``,
+    ``llm.bind_tools([tavily_tool])`` and ``ToolNode([tavily_tool])``; each
+    builds the client on first use. Call resolve() for the object itself.
+    """
+
+    __slots__ = ("_name", "_registry")
+
+    def __init__(self, registry: ClientRegistry, name: str) -> None:
+        self._registry = registry
+        self._name = name
+
+    def resolve(self) -> Any:
+        """Return the underlying client, building it if needed."""
+        return self._registry.get(self._name)
+
+    @property
+    def __class__(self) -> type:  # type: ignore[override]
+        return type(self.resolve())
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __or__(self, other: Any) -> Any:
+        return self.resolve() | other
+
+    def __ror__(self, other: Any) -> Any:
+        return other | self.resolve()
+
+    def __repr__(self) -> str:
+        return f"LazyClient({self._name!r})"
+
+
+def _create_llm() -> Any:
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(
+        model="gpt-3.5-turbo", temperature=0, api_key=get_secret("openai_api_key")
+    )
+
+
+def _create_tavily_tool() -> Any:
+    from langchain_community.tools import TavilySearchResults
+
+    from src.tavily import PooledTavilySearchAPIWrapper
+
+    options = {}
+    try:
+        api_url = get_secret("tavily_api_url").strip()
+    except KeyError:
+        api_url = ""
+    # An empty TAVILY_API_URL= (as in .env.template) means the default API
+    if api_url:
+        options["api_url"] = api_url
+    wrapper = PooledTavilySearchAPIWrapper(
+        tavily_api_key=get_secret("tavily_api_key"), **options
+    )
+    return TavilySearchResults(api_wrapper=wrapper)
+
+
+# Shared registry for the whole process
+registry = ClientRegistry()
+registry.register("llm", _create_llm)
+registry.register("tavily", _create_tavily_tool)
+
+
+def get_llm() -> Any:
+    """Return the shared ChatOpenAI model."""
+    return registry.get("llm")
+
+
+def get_tavily_tool() -> Any:
+    """Return the shared TavilySearchResults tool."""
+    return registry.get("tavily")
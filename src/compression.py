@@ -0,0 +1,214 @@
+# src/compression.py
+"""Compressed checkpoint blobs with a trained dictionary.
+
+Checkpoint blobs are small (one per channel value) and repeat the same
+boilerplate: message class names, field names and Tavily result keys.
+Compressing each blob on its own barely helps. With a dictionary trained on a
+sample of stored states, that shared boilerplate costs a few bytes per blob.
+
+CompressedSerializer wraps any checkpoint serializer. Blobs are compressed
+with zstandard when it is installed and with zlib otherwise. The codec and
+dictionary ID are recorded in the blob's type string, so loading is
+transparent. Checkpoints written before compression was enabled, or with an
+older dictionary that was passed to add_dictionary, still load.
+
+Example:
+    samples = collect_samples(saver)
+    serde = CompressedSerializer(dictionary=train_dictionary(samples))
+    saver = MemorySaver(serde=serde)
+"""
+
+import zlib
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+try:
+    import zstandard
+except ImportError:  # optional, zlib is used instead
+    zstandard = None
+
+DEFAULT_DICTIONARY_SIZE = 16 * 1024
+
+# Blobs smaller than this are stored uncompressed
+DEFAULT_MIN_SIZE = 128
+
+# zlib preset dictionaries are limited to its 32 KiB window
+ZLIB_MAX_DICTIONARY_SIZE = 32 * 1024
+
+_SEPARATOR = "+"
+
+
+def default_codec() -> str:
+    """Return "zstd" if zstandard is installed, else "zlib"."""
+    return "zstd" if zstandard is not None else "zlib"
+
+
+def dictionary_id(dictionary: bytes) -> str:
+    """Short stable identifier for a dictionary, stored with each blob."""
+    return f"{zlib.crc32(dictionary):08x}"
+
+
+def _check_codec(codec: str) -> str:
+    if codec == "zstd" and zstandard is None:
+        raise ImportError("zstd compression requires the zstandard package")
+    if codec not in ("zstd", "zlib"):
+        raise ValueError(f"Unknown codec: {codec!r}")
+    return codec
+
+
+def train_dictionary(
+    samples: Iterable[bytes],
+    size: int = DEFAULT_DICTIONARY_SIZE,
+    codec: str | None = None,
+) -> bytes:
+    """Build a compression dictionary from sample blobs.
+
+    With zstd this uses zstandard's trainer. zlib has no trainer, so its
+    dictionary is the raw content of the samples cut to size, keeping the last
+    samples (zlib encodes matches near the end of the dictionary most cheaply).
+    zstd also falls back to raw content when there are too few samples to
+    train on.
+
+    Args:
+        samples: Serialized checkpoint blobs, e.g. from collect_samples
+        size: Maximum dictionary size in bytes
+        codec: "zstd" or "zlib" (default: default_codec())
+
+    Returns:
+        The dictionary bytes
+
+    Raises:
+        ImportError: If codec is "zstd" and zstandard is not installed
+        ValueError: If codec is unknown or there are no non-empty samples
+    """
+    codec = _check_codec(codec or default_codec())
+    samples = [sample for sample in samples if sample]
+    if not samples:
+        raise ValueError("At least one non-empty sample is required")
+
+    if codec == "zstd":
+        try:
+            return zstandard.train_dictionary(size, samples).as_bytes()
+        except zstandard.ZstdError:
+            pass
+    else:
+        size = min(size, ZLIB_MAX_DICTIONARY_SIZE)
+    return b"".join(samples)[-size:]
+
+
+def collect_samples(
+    checkpointer: BaseCheckpointSaver,
+    serde: SerializerProtocol | None = None,
+    limit: int = 1000,
+) -> Iterator[bytes]:
+    """Serialize channel values of stored checkpoints as training samples.
+
+    Args:
+        checkpointer: Saver holding representative threads
+        serde: Serializer whose output will be compressed (default:
+            JsonPlusSerializer)
+        limit: Maximum number of checkpoints to sample
+    """
+    serde = serde or JsonPlusSerializer()
+    for checkpoint_tuple in checkpointer.list(None, limit=limit):
+        for value in checkpoint_tuple.checkpoint["channel_values"].values():
+            yield serde.dumps_typed(value)[1]
+
+
+class CompressedSerializer(SerializerProtocol):
+    """Serializer that compresses the blobs of another serializer.
+
+    Args:
+        serde: Serializer producing the blobs (default: JsonPlusSerializer)
+        dictionary: Trained dictionary used for new blobs
+        codec: "zstd" or "zlib" (default: default_codec())
+        level: Compression level (default: the codec's default)
+        min_size: Blobs smaller than this are stored uncompressed
+    """
+
+    def __init__(
+        self,
+        serde: SerializerProtocol | None = None,
+        *,
+        dictionary: bytes | None = None,
+        codec: str | None = None,
+        level: int | None = None,
+        min_size: int = DEFAULT_MIN_SIZE,
+    ) -> None:
+        self.serde = serde or JsonPlusSerializer()
+        self.codec = _check_codec(codec or default_codec())
+        self.level = level if level is not None else (3 if self.codec == "zstd" else 6)
+        self.min_size = min_size
+        self._dictionaries: dict[str, bytes] = {}
+        self._zstd_dictionaries: dict[str, Any] = {}
+        self.dictionary_id: str | None = None
+        if dictionary is not None:
+            self.dictionary_id = self.add_dictionary(dictionary)
+
+    def add_dictionary(self, dictionary: bytes) -> str:
+        """Register a dictionary for loading blobs written with it.
+
+        Returns:
+            The dictionary ID
+        """
+        key = dictionary_id(dictionary)
+        self._dictionaries[key] = dictionary
+        return key
+
+    def _dictionary(self, key: str) -> bytes:
+        try:
+            return self._dictionaries[key]
+        except KeyError:
+            raise ValueError(f"Unknown compression dictionary {key!r}") from None
+
+    def _zstd_dictionary(self, key: str) -> Any:
+        compiled = self._zstd_dictionaries.get(key)
+        if compiled is None:
+            compiled = zstandard.ZstdCompressionDict(self._dictionary(key))
+            self._zstd_dictionaries[key] = compiled
+        return compiled
+
+    def _compress(self, data: bytes) -> bytes:
+        key = self.dictionary_id
+        if self.codec == "zstd":
+            dict_data = self._zstd_dictionary(key) if key else None
+            compressor = zstandard.ZstdCompressor(level=self.level, dict_data=dict_data)
+            return compressor.compress(data)
+        if key:
+            compressor = zlib.compressobj(self.level, zdict=self._dictionary(key))
+        else:
+            compressor = zlib.compressobj(self.level)
+        return compressor.compress(data) + compressor.flush()
+
+    def _decompress(self, codec: str, key: str, data: bytes) -> bytes:
+        if codec == "zstd":
+            if zstandard is None:
+                raise ImportError("Loading zstd checkpoints requires zstandard")
+            dict_data = self._zstd_dictionary(key) if key else None
+            return zstandard.ZstdDecompressor(dict_data=dict_data).decompress(data)
+        if codec == "zlib":
+            if key:
+                decompressor = zlib.decompressobj(zdict=self._dictionary(key))
+            else:
+                decompressor = zlib.decompressobj()
+            return decompressor.decompress(data) + decompressor.flush()
+        raise ValueError(f"Unknown codec: {codec!r}")
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = self.serde.dumps_typed(obj)
+        if len(data) < self.min_size:
+            return type_, data
+        spec = f"{self.codec}:{self.dictionary_id or ''}"
+        return f"{type_}{_SEPARATOR}{spec}", self._compress(data)
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, payload = data
+        inner, separator, spec = type_.rpartition(_SEPARATOR)
+        if separator and ":" in spec:
+            codec, _, key = spec.partition(":")
+            type_, payload = inner, self._decompress(codec, key, payload)
+        return self.serde.loads_typed((type_, payload))
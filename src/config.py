@@ -1,8 +1,20 @@
 # src/config.py
+"""Settings for the LangGraph exercises.
 
+Nothing is read from the environment or the .env file at import time. Use
+get_settings() for the validated settings model, or get_secret() to resolve a
+single key without validating the others.
+"""
+
+import functools
+import os
+from pathlib import Path
+from typing import Any
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+ENV_FILE = ".env"
+
 
 class Settings(BaseSettings):
     """Settings for the LangGraph exercises.
@@ -16,6 +28,8 @@ class Settings(BaseSettings):
 
     # Tavily API configuration
     tavily_api_key: str
+    # Base URL of the search API, e.g. a local stand-in (src.tavily_server)
+    tavily_api_url: str | None = None
 
     # Optional LangSmith configuration
     langsmith_api_key: str | None = None
@@ -25,9 +39,85 @@ class Settings(BaseSettings):
     environment: str = "development"
 
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore"
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
     )
 
 
-# Create settings instance
-settings = Settings()
+@functools.cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, loading them on first use.
+
+    Returns:
+        The validated Settings instance. Later calls return the same object
+        until reload_settings() is called.
+    """
+    return Settings()
+
+
+def clear_settings_cache() -> None:
+    """Forget the cached settings and secrets without loading them again."""
+    get_settings.cache_clear()
+    get_secret.cache_clear()
+    _env_file_values.cache_clear()
+
+
+def reload_settings() -> Settings:
+    """Discard every cached value and load the settings again.
+
+    Returns:
+        The freshly loaded Settings instance
+    """
+    clear_settings_cache()
+    return get_settings()
+
+
+@functools.cache
+def _env_file_values() -> dict[str, str]:
+    """Read the .env file once, with keys lower-cased like Settings does."""
+    path = Path(ENV_FILE)
+    if not path.is_file():
+        return {}
+
+    # python-dotenv is installed with pydantic-settings
+    from dotenv import dotenv_values
+
+    values = dotenv_values(path, encoding="utf-8")
+    return {key.lower(): value for key, value in values.items() if value is not None}
+
+
+@functools.cache
+def get_secret(name: str) -> str:
+    """Resolve a single setting without validating the whole Settings model.
+
+    Lookup follows the same precedence as Settings: the environment first
+    (case-insensitive), then the .env file. The result is cached until
+    reload_settings() is called.
+
+    Args:
+        name: Field name, e.g. "tavily_api_key"
+
+    Returns:
+        The configured value
+
+    Raises:
+        KeyError: If the value is set neither in the environment nor in .env
+    """
+    key = name.lower()
+    for env_key, value in os.environ.items():
+        if env_key.lower() == key:
+            return value
+
+    value = _env_file_values().get(key)
+    if value is None:
+        raise KeyError(f"{name.upper()} is not set in the environment or {ENV_FILE}")
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from src.config import settings` working without eager loading
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -80,6 +80,9 @@ def should_end(state: State) -> bool:
         True if the conversation should end, False otherwise
     """
     # TODO: Implement the ending condition
+    # Hint: keep this a plain predicate and route on it with a compiled
+    # src.routing.RouteSpec(key=should_end, routes={True: END}, default=...),
+    # passing compile_routes(spec, graph_builder) to add_conditional_edges
     pass
 
 
@@ -95,6 +98,7 @@ graph_builder.add_node("llm", llm_node)
 # 2. Conditional edges to either continue or end the conversation
 
 # TODO: Compile the graph
+# Hint: graphs.get(graph_builder) from src.graph_factory compiles once and caches
 graph = None  # Replace with proper compilation
 
 # Default input for testing
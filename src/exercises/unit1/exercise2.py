@@ -27,7 +27,7 @@ Requirements:
    - Connect nodes in the correct order
 """
 
-from typing import Annotated, TypedDict
+from typing import Annotated, NotRequired, TypedDict
 
 from langchain_core.messages import BaseMessage
 from langgraph.graph import StateGraph
@@ -42,11 +42,15 @@ class State(TypedDict):
         messages: List of conversation messages with metadata
         summary: Current conversation summary
         window_size: Maximum number of messages to keep
+        summary_cursor: ID of the last message folded into the summary
+        token_budget: Optional token budget for the window instead of a count
     """
 
     messages: Annotated[list[BaseMessage], add_messages]
     summary: str
     window_size: int
+    summary_cursor: NotRequired[str | None]
+    token_budget: NotRequired[int]
 
 
 def llm_response(state: State) -> State:
@@ -77,6 +81,17 @@ def message_windowing(state: State) -> State:
 
     Returns:
         State with message history trimmed to window size
+
+    Notes:
+        - Slicing state["messages"] does not shrink the add_messages channel.
+          Return RemoveMessage deltas for evicted messages instead (see
+          src.trimming.make_trim_node), or declare the channel with a bounded
+          reducer (see src.reducers.windowed_messages).
+        - A single long message (e.g. a search result) can outweigh the rest
+          of the window; src.trimming.make_token_trim_node windows by
+          token_budget instead, with token counts cached per message.
+        - To keep evicted messages without holding them in state, pass
+          on_evict=TranscriptStore(...).spill (see src.transcripts).
     """
     # TODO: Implement sliding window logic
     pass
@@ -91,6 +106,12 @@ def summary_generation(state: State) -> State:
 
     Returns:
         State with updated summary if needed
+
+    Notes:
+        - Fold in only the messages added since the last summary instead of
+          re-joining the whole history (see src.summary.fold_summary)
+        - Older history spilled by the window can be read lazily with
+          TranscriptStore.read(thread_id_from(config), ...)
     """
     # TODO: Implement summary generation
     pass
@@ -107,6 +128,9 @@ def should_end(state: State) -> bool:
         True if the conversation should end, False otherwise
     """
     # TODO: Implement ending condition
+    # Hint: keep this a plain predicate and route on it with a compiled
+    # src.routing.RouteSpec(key=should_end, routes={True: END}, default=...),
+    # passing compile_routes(spec, graph_builder) to add_conditional_edges
     pass
 
 
@@ -124,6 +148,7 @@ graph_builder = StateGraph(State)
 # 4. Decide whether to continue or end
 
 # TODO: Compile the graph
+# Hint: graphs.get(graph_builder) from src.graph_factory compiles once and caches
 graph = None  # Replace with proper compilation
 
 # Default input for testing
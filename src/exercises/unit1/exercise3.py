@@ -38,6 +38,21 @@ from langchain_core.messages import BaseMessage
 from langgraph.graph import StateGraph
 from langgraph.graph.message import add_messages
 
+from src.classification_cache import ClassificationCache
+from src.keywords import compile_keywords
+
+# Routing table: classification -> keywords (whole words; ties go to the first match)
+ROUTING_KEYWORDS = {
+    "greeting": ["hello", "hi", "hey"],
+    "help": ["help", "support", "assist"],
+}
+
+# Compiled once; classifies a message in a single pass
+keyword_matcher = compile_keywords(ROUTING_KEYWORDS)
+
+# Repeated messages ("hello", "help") skip classification entirely
+classification_cache = ClassificationCache()
+
 
 class State(TypedDict):
     """
@@ -70,6 +85,10 @@ def classifier_node(state: State) -> State:
     # TODO: Implement message classification
     # 1. Get the last message from state
     # 2. Classify it based on content
+    #    Hint: keyword_matcher.classify(text, default="unknown"), or
+    #    src.classifier.default_classifier().classify(text) for a label with a
+    #    calibrated probability to use as the confidence. Wrap the call in
+    #    classification_cache.get_or_compute(text, classify) to cache it.
     # 3. Return state with classification and confidence
     pass
 
@@ -107,6 +126,9 @@ def get_next_node(state: State) -> str:
     """
     # TODO: Implement routing logic
     # Return appropriate response node name based on classification
+    # Hint: instead of an if/else chain, declare a src.routing.RouteSpec
+    # (classification -> node, confidence thresholds, default) and pass
+    # compile_routes(spec, graph_builder) to add_conditional_edges
     pass
 
 
@@ -123,6 +145,7 @@ graph_builder = StateGraph(State)
 # 3. Response nodes to END
 
 # TODO: Compile the graph
+# Hint: graphs.get(graph_builder) from src.graph_factory compiles once and caches
 graph = None  # Replace with proper compilation
 
 # Default input for testing
@@ -25,21 +25,25 @@ Tips:
 - Use conditional edges to end the conversation properly
 """
 
-import os
 from typing import Annotated, Any, TypedDict
 
-from langchain_community.tools import TavilySearchResults
 from langchain_core.messages import BaseMessage
 from langgraph.graph import StateGraph
 from langgraph.graph.message import add_messages
 
-from src.config import settings
+from src.clients import registry
+from src.graph_factory import graphs
+from src.retry import Retrier, error_from_result
+from src.tool_cache import ToolResultCache
 
-# Set Tavily API key in environment
-os.environ["TAVILY_API_KEY"] = settings.tavily_api_key
+# Shared search tool, created on first use and reused across calls
+tavily_tool = registry.lazy("tavily")
 
-# Initialize tool once at module level
-tavily_tool = TavilySearchResults()
+# Repeated searches ("capital of France") are answered without a network call
+search_cache = ToolResultCache()
+
+# Retries transient search failures with backoff; fails fast during outages
+tool_retrier = Retrier(result_error=error_from_result)
 
 
 class State(TypedDict):
@@ -87,6 +91,11 @@ def tool_executor(state: State) -> State:
     2. Execute TavilySearchResults tool with proper args
     3. Convert tool output to JSON string
     4. Handle any execution errors properly
+
+    Hint: search_cache.invoke(tavily_tool, args) returns a cached result for a
+    query seen before and calls the tool otherwise. For the retry logic, run
+    it as tool_retrier.call("tavily", search_cache.invoke, tavily_tool, args)
+    and JSON-encode whatever error is finally raised.
     """
     pass  # Your implementation here
 
@@ -120,8 +129,8 @@ graph_builder = StateGraph(State)
 #    - If False: go back to llm
 
 # After implementing the TODOs above:
-# 1. Compile the graph
-graph = graph_builder.compile()
+# 1. Compile the graph (graphs.get compiles each builder once per process)
+graph = graphs.get(graph_builder)
 
 # 2. Define default input
 default_input = {"messages": [], "tool_calls": [], "tool_outputs": []}
@@ -73,19 +73,28 @@ result = await graph.ainvoke(state)
 print(result)
 """
 
-import os
 from typing import Annotated, Any, TypedDict
 
-from langchain_community.tools import TavilySearchResults
 from langchain_core.messages import BaseMessage
 from langgraph.graph import StateGraph
 from langgraph.graph.message import add_messages
 
-from src.config import settings
+from src.clients import registry
+from src.retry import Retrier, error_from_result
+from src.single_flight import SingleFlight
+from src.tool_cache import ToolResultCache
 
-# Set up tools
-os.environ["TAVILY_API_KEY"] = settings.tavily_api_key
-tavily_tool = TavilySearchResults()
+# Set up tools (created on first use and shared with the other exercises)
+tavily_tool = registry.lazy("tavily")
+
+# Repeated searches are answered without a network call
+search_cache = ToolResultCache()
+
+# Identical tool calls running at the same time share one execution
+tool_flight = SingleFlight()
+
+# Retries transient search failures with backoff; fails fast during outages
+tool_retrier = Retrier(result_error=error_from_result)
 
 
 def dict_reducer(a: dict, b: dict | None) -> dict:
@@ -124,12 +133,20 @@ def init_state(state: dict) -> State:
 async def execute_tool(tool_call: dict) -> tuple[str, Any]:
     """Execute a single tool call asynchronously."""
     # TODO: Implement tool execution
+    # Hint: await search_cache.ainvoke(tavily_tool, tool_call["args"]) serves
+    # repeated queries from the cache. It awaits tavily_tool.ainvoke, which
+    # uses the shared aiohttp pool; asyncio.to_thread(tavily_tool.invoke)
+    # would hold a thread-pool worker for every request in flight. Wrap the
+    # call in await tool_retrier.acall("tavily", ...) to retry transient
+    # failures, and return f"Error: {e}" for whatever is finally raised.
     pass
 
 
 async def parallel_executor(state: State) -> State:
     """Execute multiple tools in parallel with fan-out."""
     # TODO: Implement parallel execution
+    # Hint: src.single_flight.coalesced(execute_tool, tool_flight) runs
+    # duplicate pending tools once while returning each tool's own ID
     pass
 
 
@@ -148,12 +165,15 @@ def error_handler(state: State) -> State:
 def route_results(state: State) -> str:
     """Route to appropriate handler based on state."""
     # TODO: Implement result routing
+    # Hint: a src.routing.RouteSpec with a key function (e.g. whether
+    # state["errors"] is non-empty) compiles to a dict-dispatch router
     pass
 
 
 # TODO: Initialize and configure the graph
 graph = StateGraph(State)
 # Add nodes, edges, and compile the graph
+# Hint: graphs.get(graph) from src.graph_factory compiles once and caches
 
 # TODO: Set up default input state
 default_input = get_initial_state()
@@ -0,0 +1,193 @@
+# src/graph_factory.py
+"""Compile-once cache for the exercise graphs.
+
+Graphs are compiled the first time they are requested and cached by builder and
+configuration, so long-lived servers and test sessions pay the compile cost once
+per distinct configuration. Builders and unhashable configuration values (tools,
+checkpointers) are keyed by identity, and the cache keeps them alive so their
+IDs cannot be reused. warmup() and awarmup() run one synthetic invocation to
+prime lazy imports, clients and connection pools before real traffic arrives.
+
+Example:
+    graph = graphs.get(build_graph, window_size=3)
+    graphs.warmup(graph, default_input)
+    await graphs.awarmup(async_graph, default_input)  # inside an event loop
+
+    @cached_graph
+    def create_agent() -> CompiledStateGraph: ...
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from collections.abc import Callable, Hashable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from langgraph.graph import StateGraph
+from langgraph.graph.state import CompiledStateGraph
+
+logger = logging.getLogger(__name__)
+
+GraphBuilder = StateGraph | Callable[..., StateGraph | CompiledStateGraph]
+
+
+class _Identity:
+    """Hashable by identity; holds a reference so the ID is never reused."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Identity) and other.value is self.value
+
+
+def freeze(value: Any) -> Hashable:
+    """Turn a configuration value into a hashable cache key.
+
+    Mappings and sequences are frozen recursively. Other unhashable objects
+    (tools, checkpointers) are keyed by identity: two tools with the same name
+    but different settings get different keys.
+    """
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(k), freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return _Identity(value)
+    return value
+
+
+class GraphFactory:
+    """Thread-safe cache of compiled graphs keyed by builder and configuration."""
+
+    def __init__(self) -> None:
+        self._graphs: dict[Hashable, CompiledStateGraph] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        builder: GraphBuilder,
+        /,
+        *,
+        compile_kwargs: Mapping[str, Any] | None = None,
+        **config: Any,
+    ) -> CompiledStateGraph:
+        """Return the compiled graph for a builder and configuration.
+
+        Args:
+            builder: A StateGraph, or a callable that takes the configuration as
+                keyword arguments and returns a StateGraph or compiled graph
+            compile_kwargs: Arguments for StateGraph.compile (e.g. checkpointer)
+            **config: Builder configuration such as window_size or tools
+
+        Returns:
+            The cached compiled graph
+        """
+        key = (_Identity(builder), freeze(config), freeze(compile_kwargs or {}))
+        graph = self._graphs.get(key)
+        if graph is not None:
+            self.hits += 1
+            return graph
+
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is None:
+                self.misses += 1
+                built = builder
+                if not isinstance(built, StateGraph):
+                    built = builder(**config)
+                if isinstance(built, StateGraph):
+                    built = built.compile(**(compile_kwargs or {}))
+                graph = self._graphs[key] = built
+            else:
+                self.hits += 1
+            return graph
+
+    def warmup(
+        self, graph: CompiledStateGraph, input: Any, *, use_async: bool = False
+    ) -> bool:
+        """Run one synthetic invocation to prime lazy imports and pools.
+
+        Args:
+            graph: Compiled graph to warm up
+            input: Synthetic input, usually the exercise's default_input
+            use_async: Use ainvoke (for graphs with async nodes). If an event
+                loop is already running in this thread, the invocation runs on
+                a worker thread with its own loop; use awarmup() instead to
+                prime the caller's loop.
+
+        Returns:
+            True if the invocation succeeded. Failures are logged, not raised,
+            so a failed warmup never prevents startup.
+        """
+        try:
+            if not use_async:
+                graph.invoke(input)
+            elif _loop_running():
+                with ThreadPoolExecutor(1) as executor:
+                    executor.submit(asyncio.run, graph.ainvoke(input)).result()
+            else:
+                asyncio.run(graph.ainvoke(input))
+        except Exception:
+            logger.warning("Graph warmup failed", exc_info=True)
+            return False
+        return True
+
+    async def awarmup(self, graph: CompiledStateGraph, input: Any) -> bool:
+        """Async warmup() on the running loop, priming its connection pools.
+
+        Returns:
+            True if the invocation succeeded; failures are logged, not raised
+        """
+        try:
+            await graph.ainvoke(input)
+        except Exception:
+            logger.warning("Graph warmup failed", exc_info=True)
+            return False
+        return True
+
+    def clear(self) -> None:
+        """Drop every cached graph."""
+        with self._lock:
+            self._graphs.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._graphs)
+
+
+def _loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+# Shared factory for the whole process
+graphs = GraphFactory()
+
+
+def cached_graph(
+    builder: Callable[..., StateGraph | CompiledStateGraph],
+) -> Callable[..., CompiledStateGraph]:
+    """Decorate a graph builder so each configuration is compiled only once."""
+
+    @functools.wraps(builder)
+    def wrapper(**config: Any) -> CompiledStateGraph:
+        return graphs.get(builder, **config)
+
+    return wrapper
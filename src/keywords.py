@@ -0,0 +1,232 @@
+# src/keywords.py
+"""Single-pass keyword matching for message routing.
+
+Routing by ``any(k in text.lower() for k in keywords)`` scans the message once
+per keyword, so the cost grows with message length times keyword count.
+KeywordMatcher compiles a routing table (label to keywords) into an
+Aho-Corasick automaton and finds every keyword of every label in one pass over
+the text. Matching is case-insensitive and, by default, whole-word: "hi" does
+not match inside "this" or "which", and "-" does not match inside "Saint-Denis"
+(symbols only match when they do not touch a letter, so "5-3" still counts).
+Pass whole_words=False for plain substring matching, as with ``in``.
+
+compile_keywords() caches matchers by table, so nodes can share one matcher
+per routing table. ReloadableMatcher watches a JSON table file and swaps in a
+recompiled matcher when the file changes.
+
+Example:
+    matcher = compile_keywords({"greeting": ["hello", "hi"], "help": ["help"]})
+    matcher.classify("Hello, I need help")  # "greeting" (ties go to the first match)
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+RoutingTable = Mapping[str, Iterable[str]]
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over the keywords of a routing table.
+
+    Args:
+        table: Mapping of label to keywords
+        whole_words: Only match keywords at word boundaries (see module docs)
+
+    Raises:
+        ValueError: If a keyword is empty
+    """
+
+    def __init__(self, table: RoutingTable, whole_words: bool = True) -> None:
+        self.table = {label: tuple(keywords) for label, keywords in table.items()}
+        self.labels = tuple(self.table)
+        self.whole_words = whole_words
+        self._goto: list[dict[str, int]] = [{}]
+        self._outputs: list[tuple[tuple[int, str], ...]] = [()]
+
+        for index, keywords in enumerate(self.table.values()):
+            for keyword in keywords:
+                self._add(index, keyword.lower())
+        self._fail = self._link()
+
+    def _add(self, label_index: int, keyword: str) -> None:
+        if not keyword:
+            raise ValueError(f"Empty keyword for label {self.labels[label_index]!r}")
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._outputs.append(())
+                self._goto[state][char] = next_state
+            state = next_state
+        self._outputs[state] += ((label_index, keyword),)
+
+    def _link(self) -> list[int]:
+        """Compute failure links breadth-first and merge outputs along them."""
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = self._goto[fallback].get(char, 0)
+                self._outputs[next_state] += self._outputs[fail[next_state]]
+        return fail
+
+    def iter_matches(self, text: str) -> Iterator[tuple[str, str, int]]:
+        """Yield (label, keyword, end index) for every keyword occurrence."""
+        goto, fail, outputs, labels = self._goto, self._fail, self._outputs, self.labels
+        text = text.lower()
+        whole_words = self.whole_words
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for label_index, keyword in outputs[state]:
+                end = position + 1
+                start = end - len(keyword)
+                if whole_words and not _on_boundaries(text, start, end):
+                    continue
+                yield labels[label_index], keyword, end
+
+    def counts(self, text: str) -> dict[str, int]:
+        """Count keyword occurrences per label (labels without hits omitted)."""
+        counts: dict[str, int] = {}
+        for label, _, _ in self.iter_matches(text):
+            counts[label] = counts.get(label, 0) + 1
+        return counts
+
+    def matches(self, text: str) -> set[str]:
+        """Return the labels with at least one keyword in text."""
+        return {label for label, _, _ in self.iter_matches(text)}
+
+    def classify(self, text: str, default: str | None = None) -> str | None:
+        """Return the label with the most keyword hits, or default if none.
+
+        Ties go to the label whose first keyword starts earliest in the text.
+        """
+        counts: dict[str, int] = {}
+        first: dict[str, int] = {}
+        for label, keyword, end in self.iter_matches(text):
+            counts[label] = counts.get(label, 0) + 1
+            first[label] = min(first.get(label, end), end - len(keyword))
+        if not counts:
+            return default
+        return max(counts, key=lambda label: (counts[label], -first[label]))
+
+
+def _touches(edge: str, neighbour: str) -> bool:
+    """Whether a keyword's edge character runs on into its neighbour."""
+    if not neighbour:
+        return False
+    if edge.isalnum() or edge == "_":
+        return neighbour.isalnum() or neighbour == "_"
+    return neighbour.isalpha()
+
+
+def _on_boundaries(text: str, start: int, end: int) -> bool:
+    before = text[start - 1] if start else ""
+    after = text[end] if end < len(text) else ""
+    return not (_touches(text[start], before) or _touches(text[end - 1], after))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile(
+    frozen: tuple[tuple[str, tuple[str, ...]], ...], whole_words: bool
+) -> KeywordMatcher:
+    return KeywordMatcher(dict(frozen), whole_words)
+
+
+def compile_keywords(table: RoutingTable, whole_words: bool = True) -> KeywordMatcher:
+    """Return the shared compiled matcher for a routing table."""
+    frozen = tuple((label, tuple(words)) for label, words in table.items())
+    return _compile(frozen, whole_words)
+
+
+def _parse_table(data: object) -> dict[str, list[str]]:
+    """Check that decoded JSON is an object mapping labels to keyword lists.
+
+    Raises:
+        ValueError: If it is not
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Routing table must be a JSON object")
+    for label, keywords in data.items():
+        if not isinstance(keywords, list) or not all(
+            isinstance(keyword, str) for keyword in keywords
+        ):
+            raise ValueError(f"Keywords for {label!r} must be a list of strings")
+    return data
+
+
+class ReloadableMatcher:
+    """Matcher backed by a JSON routing table file, recompiled when it changes.
+
+    The file's modification time is checked at most once per check_interval
+    seconds. If a changed file cannot be read or parsed, or is not an object
+    mapping labels to lists of keywords, a warning is logged and the last good
+    matcher stays in use.
+
+    Args:
+        path: JSON file with an object mapping labels to keyword lists
+        check_interval: Minimum seconds between modification time checks
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], check_interval: float = 1.0
+    ) -> None:
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime = 0
+        self._checked = 0.0
+        self.matcher = self.reload()
+
+    def reload(self) -> KeywordMatcher:
+        """Recompile from the file and swap in the new matcher.
+
+        Raises:
+            OSError, ValueError: If the file cannot be read or parsed, or does
+                not hold a valid routing table
+        """
+        with self._lock:
+            mtime = os.stat(self.path).st_mtime_ns
+            table = _parse_table(json.loads(self.path.read_text()))
+            matcher = compile_keywords(table)
+            self.matcher, self._mtime = matcher, mtime
+            self._checked = time.monotonic()
+            return matcher
+
+    def current(self) -> KeywordMatcher:
+        """Return the matcher, reloading first if the file has changed."""
+        now = time.monotonic()
+        if now - self._checked >= self.check_interval:
+            self._checked = now
+            try:
+                if os.stat(self.path).st_mtime_ns != self._mtime:
+                    self.reload()
+            except (OSError, ValueError):
+                logger.warning("Could not reload %s", self.path, exc_info=True)
+        return self.matcher
+
+    def classify(self, text: str, default: str | None = None) -> str | None:
+        """Classify with the current matcher (see KeywordMatcher.classify)."""
+        return self.current().classify(text, default)
+
+    def matches(self, text: str) -> set[str]:
+        """Match with the current matcher (see KeywordMatcher.matches)."""
+        return self.current().matches(text)
@@ -0,0 +1,201 @@
+# src/logging_config.py
+"""Non-blocking logging setup for the exercises.
+
+configure_logging() routes every log record through an in-memory queue to a
+background QueueListener, so graph nodes never wait on stderr. High-volume DEBUG
+loggers can be sampled before anything is queued, and StructuredMessage defers
+building "key=value" strings until the listener actually writes the record.
+
+Example:
+    configure_logging(logging.DEBUG, sample_rates={"httpx": 0.01})
+    logger.debug(StructuredMessage("tool finished", tool="calculator", ms=1.2))
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from collections.abc import Mapping
+from typing import Any, TextIO
+
+DEFAULT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# Chatty HTTP client loggers that are sampled at DEBUG unless overridden
+DEFAULT_SAMPLE_RATES = {
+    "httpcore": 0.01,
+    "httpx": 0.01,
+    "openai": 0.1,
+    "urllib3": 0.01,
+}
+
+# Records queued but not yet written before new ones are dropped
+DEFAULT_QUEUE_SIZE = 10_000
+
+
+class StructuredMessage:
+    """Log message with structured fields, formatted only when emitted.
+
+    Args:
+        message: Human-readable event description
+        **fields: Values rendered as ``key=value`` after the message
+    """
+
+    __slots__ = ("fields", "message")
+
+    def __init__(self, message: str, **fields: Any) -> None:
+        self.message = message
+        self.fields = fields
+
+    def __str__(self) -> str:
+        if not self.fields:
+            return self.message
+        rendered = " ".join(f"{key}={value!r}" for key, value in self.fields.items())
+        return f"{self.message} {rendered}"
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of low-severity records per logger.
+
+    A rate configured for a logger also applies to its children unless they
+    have their own. Records above max_level are never sampled out.
+
+    Args:
+        rates: Logger name to fraction of records to keep (0.0 - 1.0)
+        max_level: Highest level that is subject to sampling
+        seed: Seed for the sampling RNG, for reproducible tests
+    """
+
+    def __init__(
+        self,
+        rates: Mapping[str, float],
+        max_level: int = logging.DEBUG,
+        seed: int | None = None,
+    ) -> None:
+        super().__init__()
+        self.rates = dict(rates)
+        self.max_level = max_level
+        self._random = random.Random(seed)
+        self._resolved: dict[str, float] = {}
+
+    def rate_for(self, name: str) -> float:
+        """Return the sampling rate that applies to a logger name."""
+        try:
+            return self._resolved[name]
+        except KeyError:
+            pass
+
+        rate = 1.0
+        candidate = name
+        while candidate:
+            if candidate in self.rates:
+                rate = self.rates[candidate]
+                break
+            candidate = candidate.rpartition(".")[0]
+        self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        rate = self.rate_for(record.name)
+        return rate >= 1.0 or self._random.random() < rate
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never blocks and leaves formatting to the listener.
+
+    The stock handler formats each record on the calling thread before queueing
+    it. Here the record is queued as-is, so formatting (including any
+    StructuredMessage) happens on the listener thread. When the queue is full
+    the record is dropped and counted instead of blocking the caller.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """QueueListener whose shutdown waits for room in a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+_listener: logging.handlers.QueueListener | None = None
+_queue_handler: NonBlockingQueueHandler | None = None
+
+
+def configure_logging(
+    level: int = logging.INFO,
+    *,
+    sample_rates: Mapping[str, float] | None = None,
+    stream: TextIO | None = None,
+    handler: logging.Handler | None = None,
+    fmt: str = DEFAULT_FORMAT,
+    max_queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> logging.handlers.QueueListener:
+    """Install queue-based logging on the root logger.
+
+    Calling it again replaces the previous configuration. Handlers installed by
+    others (e.g. pytest's capture handler) are left in place.
+
+    Args:
+        level: Root logger level
+        sample_rates: Per-logger sampling rates for DEBUG records. Defaults to
+            DEFAULT_SAMPLE_RATES.
+        stream: Stream for the default handler (stderr if omitted)
+        handler: Handler that writes records, replacing the stream handler
+        fmt: Format string used when no handler is given
+        max_queue_size: Queued records beyond this are dropped (0 = unbounded)
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener, _queue_handler
+
+    stop_logging()
+
+    if handler is None:
+        handler = logging.StreamHandler(stream or sys.stderr)
+        handler.setFormatter(logging.Formatter(fmt))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    rates = DEFAULT_SAMPLE_RATES if sample_rates is None else sample_rates
+    if rates:
+        _queue_handler.addFilter(SamplingFilter(rates))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(_queue_handler)
+
+    _listener = _QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush queued records and remove the handler installed by configure_logging."""
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
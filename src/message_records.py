@@ -0,0 +1,185 @@
+# src/message_records.py
+"""Compact message records for hot-path graph state.
+
+Every pydantic HumanMessage/AIMessage carries validation cost and several
+hundred bytes of per-object overhead. For short scripted flows that only pass
+text around, MessageRecord (a NamedTuple) holds the same conversation turn in a
+fraction of the memory. Records are converted to BaseMessage only at LLM or
+tool boundaries with to_messages(). Fields beyond role, content and IDs (tool
+calls, names, response and usage metadata) are kept in the record's extra dict
+only when set, so text turns stay small and every message round-trips.
+
+NamedTuple rather than a __slots__ class so checkpoint serializers can round-trip
+records. LangGraph's serializer warns when it loads a class it has not been told
+about; src.serde.checkpoint_serializer() registers MessageRecord.
+
+Example:
+    class State(TypedDict):
+        messages: Annotated[list[MessageRecord], add_records]
+
+    llm.invoke(to_messages(state["messages"]))
+"""
+
+import uuid
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+    ToolMessage,
+)
+
+from src.reducers import REMOVE_ALL_MESSAGES
+
+# Message fields MessageRecord stores in fields of its own
+_RECORD_FIELDS = frozenset({"type", "content", "id", "tool_call_id"})
+
+_MESSAGE_TYPES: dict[str, type[BaseMessage]] = {
+    "human": HumanMessage,
+    "ai": AIMessage,
+    "system": SystemMessage,
+    "tool": ToolMessage,
+}
+
+
+class MessageRecord(NamedTuple):
+    """A single conversation turn.
+
+    Attributes:
+        role: Message type: "human", "ai", "system" or "tool"
+        content: Message content
+        id: Message ID, used to replace records in add_records
+        tool_call_id: ID of the tool call a "tool" record answers
+        metadata: Optional metadata such as timestamps
+        extra: Any other message fields that are not at their defaults, e.g.
+            name, tool_calls, response_metadata or usage_metadata
+    """
+
+    role: str
+    content: str | list
+    id: str | None = None
+    tool_call_id: str | None = None
+    metadata: dict[str, Any] | None = None
+    extra: dict[str, Any] | None = None
+
+    @classmethod
+    def from_message(cls, message: BaseMessage) -> "MessageRecord":
+        """Build a record from a message; to_message() returns an equal message.
+
+        Raises:
+            ValueError: If the message type has no record role
+        """
+        if message.type not in _MESSAGE_TYPES:
+            raise ValueError(f"Unsupported message type: {message.type!r}")
+        extra = _non_default_fields(message)
+        return cls(
+            role=message.type,
+            content=message.content,
+            id=message.id,
+            tool_call_id=getattr(message, "tool_call_id", None),
+            metadata=extra.pop("metadata", None),
+            extra=extra or None,
+        )
+
+    def to_message(self) -> BaseMessage:
+        """Build the equivalent BaseMessage."""
+        kwargs: dict[str, Any] = {"content": self.content, "id": self.id}
+        if self.role == "tool":
+            kwargs["tool_call_id"] = self.tool_call_id
+        if self.metadata is not None:
+            kwargs["metadata"] = self.metadata
+        if self.extra:
+            kwargs.update(self.extra)
+        return _MESSAGE_TYPES[self.role](**kwargs)
+
+
+def _non_default_fields(message: BaseMessage) -> dict[str, Any]:
+    """Fields besides those a record stores directly that differ from defaults.
+
+    Includes extra attributes such as metadata.
+    """
+    model_fields = type(message).model_fields
+    fields = {}
+    for name, value in message.__dict__.items():
+        if name in _RECORD_FIELDS:
+            continue
+        field = model_fields.get(name)
+        if field is None or value != field.get_default(call_default_factory=True):
+            fields[name] = value
+    fields.update(message.__pydantic_extra__ or {})
+    return fields
+
+
+def to_messages(records: Iterable[MessageRecord | BaseMessage]) -> list[BaseMessage]:
+    """Convert records to messages for an LLM or tool call."""
+    return [
+        record.to_message() if isinstance(record, MessageRecord) else record
+        for record in records
+    ]
+
+
+def to_records(messages: Iterable[MessageRecord | BaseMessage]) -> list[MessageRecord]:
+    """Convert messages (e.g. an LLM response) to records."""
+    return [
+        message
+        if isinstance(message, MessageRecord)
+        else MessageRecord.from_message(message)
+        for message in messages
+    ]
+
+
+def _with_ids(records: list[MessageRecord]) -> list[MessageRecord]:
+    if all(record.id is not None for record in records):
+        return records
+    return [
+        record if record.id is not None else record._replace(id=str(uuid.uuid4()))
+        for record in records
+    ]
+
+
+def add_records(
+    left: list[MessageRecord], right: MessageRecord | BaseMessage | list
+) -> list[MessageRecord]:
+    """Reducer for record channels: append, or replace records with the same ID.
+
+    BaseMessage values in the update are converted to records. Records without
+    an ID are given one, as add_messages does, so they can be replaced later.
+    RemoveMessage deletes the record with its ID (or every record, for
+    REMOVE_ALL_MESSAGES), so make_trim_node works on record channels too.
+
+    Raises:
+        ValueError: If a RemoveMessage targets an ID that does not exist
+    """
+    updates = right if isinstance(right, list) else [right]
+    for index in range(len(updates) - 1, -1, -1):
+        update = updates[index]
+        if isinstance(update, RemoveMessage) and update.id == REMOVE_ALL_MESSAGES:
+            left, updates = [], updates[index + 1 :]
+            break
+    merged = _with_ids(list(left))
+    positions = {record.id: i for i, record in enumerate(merged)}
+    removed: set[str] = set()
+    for update in updates:
+        if not isinstance(update, RemoveMessage):
+            update = _with_ids(to_records([update]))[0]
+        position = positions.get(update.id)
+        if position is None:
+            if isinstance(update, RemoveMessage):
+                raise ValueError(
+                    "Attempting to delete a message with an ID that doesn't exist "
+                    f"('{update.id}')"
+                )
+            positions[update.id] = len(merged)
+            merged.append(update)
+        elif isinstance(update, RemoveMessage):
+            removed.add(update.id)
+        else:
+            removed.discard(update.id)
+            merged[position] = update
+    if removed:
+        return [record for record in merged if record.id not in removed]
+    return merged
@@ -0,0 +1,365 @@
+# src/reducers.py
+"""Message reducers for long-running conversations.
+
+add_messages re-coerces every message in the history and rebuilds an ID lookup
+on every update, so each node that returns messages pays O(history) in Python
+code. The reducers here keep their index alongside the channel value. Like
+add_messages they never change what the previous value contains (stream
+snapshots and checkpoints may still refer to it):
+
+- windowed_messages(n): the value is a MessageWindow, a deque bounded at n with
+  an ID index. Each update copies it, so it costs O(n) however long the
+  conversation runs.
+- indexed_messages: the value is a MessageLog, an unbounded, read-only
+  sequence with an ID to position index. Versions share one append-only store,
+  so appends and replacements cost O(1). Removal semantics and errors match
+  add_messages.
+
+Both types load from checkpoints without LangGraph's "unregistered type"
+warning when the saver uses src.serde.checkpoint_serializer.
+
+Example:
+    class State(TypedDict):
+        messages: Annotated[list[BaseMessage], windowed_messages(3)]
+"""
+
+import itertools
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+from langchain_core.messages import (
+    BaseMessage,
+    RemoveMessage,
+    convert_to_messages,
+    message_chunk_to_message,
+)
+
+try:
+    from langgraph.graph.message import REMOVE_ALL_MESSAGES
+except ImportError:  # older langgraph releases
+    REMOVE_ALL_MESSAGES = "__remove_all__"
+
+
+def coerce_messages(messages: Any) -> list[BaseMessage]:
+    """Normalize a reducer update the way add_messages does.
+
+    Accepts a message, a message-like (dict, tuple, str) or a list of them,
+    converts chunks to full messages and assigns missing IDs.
+    """
+    if not isinstance(messages, (list, MessageLog)):
+        messages = [messages]
+    coerced = [message_chunk_to_message(m) for m in convert_to_messages(messages)]
+    for message in coerced:
+        if message.id is None:
+            message.id = str(uuid.uuid4())
+    return coerced
+
+
+class MessageWindow(deque):
+    """Deque of the most recent messages with an index from ID to position.
+
+    Positions are stored as absolute sequence numbers, so evicting the oldest
+    message never renumbers the index. Replacing a message keeps its position.
+    Removing a message from the middle renumbers the messages after it, which
+    is O(window size).
+
+    Supports slicing (returning a list) so code such as
+    ``state["messages"][-3:]`` keeps working. It is still a deque, not a list:
+    ``state["messages"] + [message]`` raises TypeError, so build new lists with
+    ``[*state["messages"], message]``.
+    """
+
+    def __init__(
+        self, iterable: Iterable[BaseMessage] = (), maxlen: int | None = None
+    ) -> None:
+        super().__init__(maxlen=maxlen)
+        self._positions: dict[str, int] = {}
+        self._offset = 0
+        for message in iterable:
+            self.upsert(message)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return list(self)[index]
+        return super().__getitem__(index)
+
+    def upsert(self, message: BaseMessage) -> None:
+        """Replace the message with the same ID, or append it as the newest."""
+        position = self._positions.get(message.id)
+        if position is not None:
+            self[position - self._offset] = message
+            return
+
+        if self.maxlen is not None and len(self) == self.maxlen:
+            evicted = self.popleft()
+            del self._positions[evicted.id]
+            self._offset += 1
+        self._positions[message.id] = self._offset + len(self)
+        self.append(message)
+
+    def remove_id(self, message_id: str) -> bool:
+        """Remove the message with the given ID.
+
+        Returns:
+            False if no such message is in the window (e.g. already evicted)
+        """
+        position = self._positions.pop(message_id, None)
+        if position is None:
+            return False
+        index = position - self._offset
+        del self[index]
+        for later in range(index, len(self)):
+            self._positions[self[later].id] -= 1
+        return True
+
+    def reset(self) -> None:
+        """Remove every message."""
+        self.clear()
+        self._positions.clear()
+        self._offset = 0
+
+    def copy(self) -> "MessageWindow":
+        """Return a shallow copy, reusing the index instead of rebuilding it."""
+        window = type(self)(maxlen=self.maxlen)
+        window.extend(self)
+        window._positions = dict(self._positions)
+        window._offset = self._offset
+        return window
+
+    __copy__ = copy
+
+    def merge(self, update: Any) -> "MessageWindow":
+        """Apply a reducer update with add_messages semantics.
+
+        Messages replace those with the same ID or are appended; RemoveMessage
+        deletes by ID. Removing an ID that is not in the window is a no-op,
+        since the message may already have been evicted.
+
+        Returns:
+            A new window; this one is left unchanged
+        """
+        window = self.copy()
+        for message in coerce_messages(update):
+            if isinstance(message, RemoveMessage):
+                if message.id == REMOVE_ALL_MESSAGES:
+                    window.reset()
+                else:
+                    window.remove_id(message.id)
+            else:
+                window.upsert(message)
+        return window
+
+
+def windowed_messages(window_size: int) -> Callable[[Any, Any], MessageWindow]:
+    """Build a reducer that keeps only the last window_size messages.
+
+    Each step copies at most window_size messages, so its cost does not grow
+    with the length of the conversation. Values restored from a checkpoint are
+    re-wrapped with the right bound on the next update.
+
+    Args:
+        window_size: Maximum number of messages kept in the channel
+
+    Returns:
+        A reducer for ``Annotated[list[BaseMessage], windowed_messages(n)]``
+    """
+    if window_size < 1:
+        raise ValueError("window_size must be at least 1")
+
+    def reducer(left: Any, right: Any) -> MessageWindow:
+        if not (isinstance(left, MessageWindow) and left.maxlen == window_size):
+            left = MessageWindow(coerce_messages(list(left or [])), window_size)
+        return left.merge(right)
+
+    reducer.__name__ = f"windowed_messages_{window_size}"
+    return reducer
+
+
+class _LogStore:
+    """Storage shared by the versions of a MessageLog.
+
+    messages holds the newest version's message at each position; versions
+    only differ in their length and in replaced messages. A replacement saves
+    the message it overwrote in history, so older versions still read theirs.
+    """
+
+    __slots__ = ("generation", "history", "index", "messages", "replaced")
+
+    def __init__(self, messages: list[BaseMessage]) -> None:
+        self.messages = messages
+        self.index = {message.id: i for i, message in enumerate(messages)}
+        # position -> [(generation that replaced it, message it replaced)]
+        self.history: dict[int, list[tuple[int, BaseMessage]]] = {}
+        self.replaced = 0
+        self.generation = 0
+
+
+class MessageLog(Sequence[BaseMessage]):
+    """Immutable sequence of messages with an index from message ID to position.
+
+    Every version produced by merge shares one append-only store with the
+    version it was merged from, so appends and replacements cost O(1) each
+    instead of a copy of the history. Older versions (stream snapshots,
+    checkpoints) keep reading their own messages. A batch with removals is
+    applied in one O(history) compaction pass into a new store, as is a merge
+    into a version that is no longer the newest one.
+    """
+
+    __slots__ = ("_generation", "_length", "_store")
+
+    def __init__(self, messages: Iterable[BaseMessage] = ()) -> None:
+        self._attach(_LogStore(list(messages)))
+
+    def _attach(self, store: _LogStore) -> "MessageLog":
+        self._store = store
+        self._generation = store.generation
+        self._length = len(store.messages)
+        return self
+
+    def _at(self, position: int) -> BaseMessage:
+        store = self._store
+        if self._generation != store.generation:
+            for replaced_at, message in store.history.get(position, ()):
+                if replaced_at > self._generation:
+                    return message
+        return store.messages[position]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._at(i) for i in range(*index.indices(self._length))]
+        position = index + self._length if index < 0 else index
+        if not 0 <= position < self._length:
+            raise IndexError("MessageLog index out of range")
+        return self._at(position)
+
+    def __iter__(self) -> Iterator[BaseMessage]:
+        if self._generation == self._store.generation:
+            return itertools.islice(self._store.messages, self._length)
+        return map(self._at, range(self._length))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (MessageLog, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other, strict=True)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self, other: Iterable[BaseMessage]) -> list[BaseMessage]:
+        return [*self, *other]
+
+    def __radd__(self, other: Iterable[BaseMessage]) -> list[BaseMessage]:
+        return [*other, *self]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def _asdict(self) -> dict[str, list[BaseMessage]]:
+        # JsonPlusSerializer stores objects with _asdict as
+        # MessageLog(**log._asdict()), like namedtuples
+        return {"messages": list(self)}
+
+    def merge(self, update: Any) -> "MessageLog":
+        """Apply a reducer update with exactly the add_messages semantics.
+
+        Returns:
+            A new log; this one is left unchanged
+
+        Raises:
+            ValueError: If a RemoveMessage targets an ID that does not exist.
+                Nothing is modified in that case.
+        """
+        messages = coerce_messages(update)
+        log = self
+        for index in range(len(messages) - 1, -1, -1):
+            message = messages[index]
+            if isinstance(message, RemoveMessage) and message.id == REMOVE_ALL_MESSAGES:
+                log = type(self)()
+                messages = messages[index + 1 :]
+                break
+        if log._generation != log._store.generation:
+            # Another version was already merged into this store
+            log = type(self)(log)
+
+        # Validate removals before changing anything, so a bad update is a no-op
+        index = log._store.index
+        appended: set[str] = set()
+        for message in messages:
+            if message.id in index or message.id in appended:
+                continue
+            if isinstance(message, RemoveMessage):
+                raise ValueError(
+                    "Attempting to delete a message with an ID that doesn't exist "
+                    f"('{message.id}')"
+                )
+            appended.add(message.id)
+
+        if any(isinstance(message, RemoveMessage) for message in messages):
+            return log._compacted(messages)
+        return log._extended(messages)
+
+    def _extended(self, messages: list[BaseMessage]) -> "MessageLog":
+        """Append and replace in the shared store; O(1) per message."""
+        if not messages:
+            return self
+        store = self._store
+        generation = store.generation + 1
+        for message in messages:
+            position = store.index.get(message.id)
+            if position is None:
+                store.index[message.id] = len(store.messages)
+                store.messages.append(message)
+                continue
+            if position < self._length:
+                replaced = (generation, store.messages[position])
+                store.history.setdefault(position, []).append(replaced)
+                store.replaced += 1
+            store.messages[position] = message
+        store.generation = generation
+        log = type(self).__new__(type(self))._attach(store)
+        if store.replaced > len(store.messages):
+            # Start a fresh store once the saved replacements outgrow the log,
+            # so a long run of edits keeps memory O(history)
+            log = type(self)(log)
+        return log
+
+    def _compacted(self, messages: list[BaseMessage]) -> "MessageLog":
+        """Apply a batch with removals into a new store."""
+        items = list(self)
+        index = dict(self._store.index)
+        to_remove: set[str] = set()
+        for message in messages:
+            position = index.get(message.id)
+            if position is not None:
+                if isinstance(message, RemoveMessage):
+                    to_remove.add(message.id)
+                else:
+                    to_remove.discard(message.id)
+                    items[position] = message
+            else:
+                index[message.id] = len(items)
+                items.append(message)
+        return type(self)(message for message in items if message.id not in to_remove)
+
+
+def indexed_messages(left: Any, right: Any) -> MessageLog:
+    """Replacement for add_messages backed by a MessageLog.
+
+    Produces the same messages and errors as add_messages, but appends and
+    replaces in O(1) per message instead of re-coercing and re-indexing every
+    message in Python. A value restored from a checkpoint (a plain list) is
+    re-indexed once on the next update.
+    """
+    if isinstance(left, Mapping):
+        # JsonPlusSerializer returns MessageLog._asdict() for a class that is
+        # not on its allowlist
+        left = left.get("messages")
+    if not isinstance(left, MessageLog):
+        left = MessageLog(coerce_messages(list(left or [])))
+    return left.merge(right)
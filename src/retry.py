@@ -0,0 +1,457 @@
+# src/retry.py
+"""Retries with exponential backoff, retry budgets and circuit breaking.
+
+Retrier wraps tool calls with three protections. Each tool name gets its own
+budget and breaker:
+
+- RetryPolicy: retry transient failures (timeouts, connection errors, 429
+  and 5xx responses) with capped exponential backoff and full jitter. Fatal
+  errors (other 4xx, bad arguments) are raised at once. A Retry-After header
+  is honoured up to max_delay.
+- RetryBudget: retries may add at most a fixed fraction of extra load per
+  tool. During an outage, callers give up instead of multiplying traffic.
+- CircuitBreaker: after failure_threshold consecutive transient failures,
+  calls fail fast with CircuitOpenError for reset_timeout seconds. After that
+  a single trial call decides whether the circuit closes again.
+
+TavilySearchResults returns failures as a repr() string instead of raising.
+Pass result_error=error_from_result so those strings are retried like
+exceptions.
+
+Example:
+    retrier = Retrier(RetryPolicy(max_attempts=4), result_error=error_from_result)
+    results = retrier.call("tavily", tavily_tool.invoke, args)
+    results = await retrier.acall("tavily", tavily_tool.ainvoke, args)
+"""
+
+import asyncio
+import functools
+import random
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying: rate limited, or the upstream is struggling
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Parsing of repr(error) strings returned by TavilySearchResults
+_ERROR_CLASS = re.compile(r"^(\w+)\(")
+# "status=503" (aiohttp) or a leading "'503 Server Error" (requests)
+_STATUS = re.compile(r"\bstatus=(\d{3})\b|^\w+\(['\"](\d{3}) ")
+# Connection and timeout errors of requests, urllib3, aiohttp and the stdlib
+TRANSIENT_ERROR_NAMES = frozenset(
+    {
+        "ConnectionError",
+        "ConnectionRefusedError",
+        "ConnectionResetError",
+        "ConnectionAbortedError",
+        "BrokenPipeError",
+        "ChunkedEncodingError",
+        "ProtocolError",
+        "ClientConnectionError",
+        "ClientConnectorError",
+        "ClientConnectorDNSError",
+        "ClientOSError",
+        "ClientPayloadError",
+        "ServerDisconnectedError",
+    }
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a tool whose circuit is open."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(f"Circuit for {name!r} is open; retry in {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class ToolResultError(RuntimeError):
+    """A failure a tool reported in its result instead of raising."""
+
+    def __init__(
+        self, message: str, status: int | None = None, transient: bool = False
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.transient = transient
+
+
+def error_from_result(result: Any) -> ToolResultError | None:
+    """Detect TavilySearchResults-style failures returned as repr() strings.
+
+    The exception class name decides first: connection errors and timeouts
+    are transient whatever numbers appear in their host or port. Otherwise
+    the HTTP status is read from "status=NNN" (aiohttp) or a leading
+    "NNN ... Error" message (requests).
+
+    Returns:
+        A ToolResultError carrying the HTTP status or the transient flag, or
+        None for normal results
+    """
+    if not isinstance(result, str):
+        return None
+    match = _ERROR_CLASS.match(result)
+    name = match.group(1) if match else ""
+    if name in TRANSIENT_ERROR_NAMES or "Timeout" in name:
+        return ToolResultError(result, transient=True)
+    match = _STATUS.search(result)
+    if match:
+        return ToolResultError(result, int(match.group(1) or match.group(2)))
+    return ToolResultError(result)
+
+
+def error_status(error: BaseException) -> int | None:
+    """Return the HTTP status of requests, aiohttp or tool result errors."""
+    status = getattr(error, "status", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Return the Retry-After delay an error response asked for, in seconds."""
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    try:
+        return float(headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Classify an error as transient (retry) or fatal (raise now).
+
+    Retryable: timeouts, connection errors, and responses with a status in
+    RETRYABLE_STATUSES. Statuses outside that set, open circuits and anything
+    else are fatal.
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+    status = error_status(error)
+    if status is not None:
+        return status in RETRYABLE_STATUSES
+    if getattr(error, "transient", False):
+        return True
+    # Not every OSError: invalid URLs, missing files and permissions are fatal
+    return isinstance(error, _transient_error_types())
+
+
+@functools.cache
+def _transient_error_types() -> tuple[type[BaseException], ...]:
+    """Timeout and connection error classes of the stdlib, requests and aiohttp."""
+    types: list[type[BaseException]] = [TimeoutError, ConnectionError]
+    try:
+        import requests
+    except ImportError:  # optional, only its errors are classified
+        pass
+    else:
+        types += [requests.ConnectionError, requests.Timeout]
+    try:
+        import aiohttp
+    except ImportError:  # optional, only its errors are classified
+        pass
+    else:
+        types += [aiohttp.ClientConnectionError, aiohttp.ServerTimeoutError]
+    return tuple(types)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how long to wait between attempts.
+
+    Attributes:
+        max_attempts: Attempts per call, including the first
+        base_delay: Backoff before the first retry, in seconds
+        max_delay: Cap on a single backoff, in seconds
+        multiplier: Backoff growth per retry
+        jitter: Draw each delay uniformly from [0, backoff] ("full jitter")
+            instead of sleeping the full backoff
+        retryable: Predicate classifying errors as transient
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    retryable: Callable[[BaseException], bool] = field(default=is_retryable)
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.base_delay < 0 or self.max_delay < 0 or self.multiplier < 1:
+            raise ValueError("delays must not be negative and multiplier >= 1")
+
+    def delay(
+        self, retry: int, error: BaseException | None = None, rng: Any = random
+    ) -> float:
+        """Seconds to wait before retry number retry (1 for the first retry)."""
+        backoff = min(self.max_delay, self.base_delay * self.multiplier ** (retry - 1))
+        if self.jitter:
+            backoff = rng.uniform(0, backoff)
+        requested = retry_after(error) if error is not None else None
+        if requested is not None:
+            backoff = max(backoff, min(requested, self.max_delay))
+        return backoff
+
+
+class RetryBudget:
+    """Limit retries to a fraction of calls.
+
+    Each call deposits ratio tokens and each retry withdraws one, so in
+    steady state retries add at most ratio extra load. A reserve of tokens
+    allows some retries when traffic is low.
+
+    Args:
+        ratio: Retries allowed per call
+        reserve: Maximum (and initial) number of banked retries
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10.0) -> None:
+        if ratio < 0 or reserve < 0:
+            raise ValueError("ratio and reserve must not be negative")
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = reserve
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Record a call."""
+        with self._lock:
+            self._balance = min(self.reserve, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a retry token; returns False when the budget is spent."""
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+    @property
+    def balance(self) -> float:
+        """Retries currently available."""
+        return self._balance
+
+
+class CircuitBreaker:
+    """Fail fast while an upstream keeps failing.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit
+        reset_timeout: Seconds the circuit stays open before a trial call
+        clock: Monotonic time source, in seconds
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial = False
+        self._trial_started = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return whether a call may go ahead now."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if self.clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = HALF_OPEN
+                self._trial = False
+            # Half open: let exactly one trial call through. A trial older
+            # than reset_timeout is presumed lost and another is allowed.
+            now = self.clock()
+            if self._trial and now - self._trial_started < self.reset_timeout:
+                return False
+            self._trial = True
+            self._trial_started = now
+            return True
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit lets a trial call through."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (self.clock() - self._opened_at))
+
+    def record_success(self) -> None:
+        """Record a call that reached the upstream; closes the circuit."""
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._trial = False
+
+    def release(self) -> None:
+        """Record a call that ended without an outcome, e.g. was cancelled.
+
+        The state is unchanged; in half open, the next caller gets the trial.
+        """
+        with self._lock:
+            self._trial = False
+
+    def record_failure(self) -> None:
+        """Record a transient failure; may open the circuit."""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self._opened_at = self.clock()
+                self._trial = False
+
+
+class Retrier:
+    """Run tool calls under a retry policy, per-tool budgets and breakers.
+
+    Args:
+        policy: Backoff and classification settings
+        result_error: Function turning a returned result into an error to
+            retry (e.g. error_from_result), or None for normal results
+        budget: Factory for each tool's RetryBudget
+        breaker: Factory for each tool's CircuitBreaker
+        rng: Source of jitter (random.Random-like)
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        *,
+        result_error: Callable[[Any], BaseException | None] | None = None,
+        budget: Callable[[], RetryBudget] = RetryBudget,
+        breaker: Callable[[], CircuitBreaker] = CircuitBreaker,
+        rng: Any = random,
+    ) -> None:
+        self.policy = policy or RetryPolicy()
+        self.result_error = result_error
+        self.rng = rng
+        self._new_budget = budget
+        self._new_breaker = breaker
+        self._budgets: dict[str, RetryBudget] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self.stats: defaultdict[str, Counter[str]] = defaultdict(Counter)
+
+    def budget(self, name: str) -> RetryBudget:
+        """Return the retry budget of a tool."""
+        with self._lock:
+            if name not in self._budgets:
+                self._budgets[name] = self._new_budget()
+            return self._budgets[name]
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        """Return the circuit breaker of a tool."""
+        with self._lock:
+            if name not in self._breakers:
+                self._breakers[name] = self._new_breaker()
+            return self._breakers[name]
+
+    def _check(self, name: str, breaker: CircuitBreaker) -> None:
+        if not breaker.allow():
+            self.stats[name]["short_circuited"] += 1
+            raise CircuitOpenError(name, breaker.retry_after())
+        self.stats[name]["attempts"] += 1
+
+    def _outcome(self, result: Any) -> BaseException | None:
+        return self.result_error(result) if self.result_error is not None else None
+
+    def _next_delay(
+        self, name: str, attempt: int, error: BaseException, breaker: CircuitBreaker
+    ) -> float | None:
+        """Record a failed attempt; returns the backoff, or None to give up."""
+        stats = self.stats[name]
+        if not self.policy.retryable(error):
+            # The upstream answered, so it is not down
+            breaker.record_success()
+            stats["fatal"] += 1
+            return None
+        breaker.record_failure()
+        if attempt >= self.policy.max_attempts:
+            stats["exhausted"] += 1
+            return None
+        if not self.budget(name).withdraw():
+            stats["budget_exhausted"] += 1
+            return None
+        stats["retries"] += 1
+        return self.policy.delay(attempt, error, self.rng)
+
+    def call(self, name: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call fn(*args, **kwargs) with retries, sleeping between attempts.
+
+        Raises:
+            CircuitOpenError: If the tool's circuit is open
+            Exception: The last error once it is fatal or retries are used up
+        """
+        breaker = self.breaker(name)
+        self.budget(name).deposit()
+        attempt = 0
+        while True:
+            self._check(name, breaker)
+            attempt += 1
+            try:
+                result = fn(*args, **kwargs)
+                error = self._outcome(result)
+            except Exception as raised:
+                error = raised
+            except BaseException:
+                # Cancelled or interrupted: says nothing about the upstream
+                breaker.release()
+                raise
+            if error is None:
+                breaker.record_success()
+                return result
+            delay = self._next_delay(name, attempt, error, breaker)
+            if delay is None:
+                raise error
+            time.sleep(delay)
+
+    async def acall(
+        self, name: str, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Async variant of call(); waits with asyncio.sleep."""
+        breaker = self.breaker(name)
+        self.budget(name).deposit()
+        attempt = 0
+        while True:
+            self._check(name, breaker)
+            attempt += 1
+            try:
+                result = await fn(*args, **kwargs)
+                error = self._outcome(result)
+            except Exception as raised:
+                error = raised
+            except BaseException:
+                # Cancelled or interrupted: says nothing about the upstream
+                breaker.release()
+                raise
+            if error is None:
+                breaker.record_success()
+                return result
+            delay = self._next_delay(name, attempt, error, breaker)
+            if delay is None:
+                raise error
+            await asyncio.sleep(delay)
@@ -0,0 +1,146 @@
+# src/routing.py
+"""Declarative routing tables for conditional edges.
+
+Instead of an if/else chain per router, describe the branches once:
+
+    spec = RouteSpec(
+        key="classification",
+        routes={"greeting": "greeting_response", "help": "help_response"},
+        default="fallback_response",
+        thresholds={"greeting": 0.8},
+    )
+    router = compile_routes(spec, graph_builder)
+    graph_builder.add_conditional_edges("classifier", router, router.path_map)
+
+compile_routes validates the spec up front, so typos in labels or node
+names fail when the graph is built, not on the first message that takes the
+branch. The returned Router dispatches with a single dict lookup and counts
+how often each branch was taken.
+"""
+
+import threading
+from collections import Counter
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from langgraph.graph import END, StateGraph
+
+# Branch names used in Router.hits besides the route values
+DEFAULT_BRANCH = "default"
+BELOW_THRESHOLD = "below_threshold"
+
+
+@dataclass(frozen=True)
+class RouteSpec:
+    """Declarative description of a conditional edge.
+
+    Attributes:
+        key: State key to route on, or a function of the state returning the
+            value to route on (e.g. for boolean end conditions)
+        routes: Mapping of value to destination node
+        default: Destination for values without a route
+        thresholds: Minimum confidence per value; below it the message goes
+            to below_threshold
+        confidence_key: State key holding the confidence
+        below_threshold: Destination for low-confidence values (default: the
+            default destination)
+    """
+
+    key: str | Callable[[Mapping[str, Any]], Hashable]
+    routes: Mapping[Hashable, str]
+    default: str
+    thresholds: Mapping[Hashable, float] = field(default_factory=dict)
+    confidence_key: str = "confidence"
+    below_threshold: str | None = None
+
+
+class Router:
+    """Compiled dict-dispatch router produced by compile_routes."""
+
+    def __init__(self, spec: RouteSpec) -> None:
+        self.spec = spec
+        self._routes = dict(spec.routes)
+        self._thresholds = dict(spec.thresholds)
+        self._default = spec.default
+        self._below = spec.below_threshold or spec.default
+        key = spec.key
+        self._read: Callable[[Mapping[str, Any]], Hashable] = (
+            key if callable(key) else lambda state: state.get(key)
+        )
+        self._confidence_key = spec.confidence_key
+        self._lock = threading.Lock()
+        self.hits: Counter[str] = Counter()
+
+    @property
+    def path_map(self) -> dict[str, str]:
+        """Destination names for add_conditional_edges."""
+        destinations = [*self._routes.values(), self._default, self._below]
+        return {destination: destination for destination in destinations}
+
+    def __call__(self, state: Mapping[str, Any]) -> str:
+        value = self._read(state)
+        destination = self._routes.get(value)
+        if destination is None:
+            branch, destination = DEFAULT_BRANCH, self._default
+        else:
+            branch = str(value)
+            threshold = self._thresholds.get(value)
+            # A missing or None confidence counts as 0
+            if (
+                threshold is not None
+                and (state.get(self._confidence_key) or 0.0) < threshold
+            ):
+                branch, destination = f"{value}:{BELOW_THRESHOLD}", self._below
+        with self._lock:
+            self.hits[branch] += 1
+        return destination
+
+    def reset_hits(self) -> None:
+        """Zero the branch counters."""
+        with self._lock:
+            self.hits.clear()
+
+
+def validate_routes(spec: RouteSpec, nodes: Any = None) -> None:
+    """Check a spec for mistakes that would otherwise surface at run time.
+
+    Args:
+        spec: Spec to check
+        nodes: Node names that may be routed to (END is always allowed)
+
+    Raises:
+        ValueError: On empty routes, thresholds for unknown values or outside
+            [0, 1], or destinations that are not nodes
+    """
+    if not spec.routes:
+        raise ValueError("RouteSpec.routes must not be empty")
+    unknown = [value for value in spec.thresholds if value not in spec.routes]
+    if unknown:
+        raise ValueError(f"Thresholds for values without a route: {unknown}")
+    invalid = {v: t for v, t in spec.thresholds.items() if not 0.0 <= t <= 1.0}
+    if invalid:
+        raise ValueError(f"Thresholds must be between 0 and 1: {invalid}")
+    if nodes is not None:
+        allowed = {*nodes, END}
+        destinations = {*spec.routes.values(), spec.default}
+        if spec.below_threshold:
+            destinations.add(spec.below_threshold)
+        missing = sorted(destinations - allowed)
+        if missing:
+            raise ValueError(f"Routes point at unknown nodes: {missing}")
+
+
+def compile_routes(spec: RouteSpec, graph: StateGraph | None = None) -> Router:
+    """Validate a spec and compile it into a router.
+
+    Args:
+        spec: Routing spec
+        graph: Graph builder whose nodes the destinations must exist in. Add
+            the nodes before compiling the routes.
+
+    Returns:
+        A Router usable as the path function of add_conditional_edges
+    """
+    validate_routes(spec, graph.nodes if graph is not None else None)
+    return Router(spec)
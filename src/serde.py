@@ -0,0 +1,167 @@
+# src/serde.py
+"""Binary checkpoint serializer with a fast path for messages.
+
+The default checkpoint serializer encodes each message through its generic
+constructor path: the class path, every field by keyword, and pydantic
+validation again on load. MessagePackSerializer writes messages as a compact
+msgpack extension (a type code plus the raw field values) and rebuilds them
+with model_construct, which skips validation. Message fields were already
+validated when the message was created, so the result compares equal to the
+original.
+
+States that contain values this encoding does not know (datetimes, enums,
+UUIDs, exceptions, arbitrary objects) are handed to the default serializer, so
+any state can be checkpointed and loads back with the same types. The one enum
+with a fast path is src.state_updates.DELETE, which loads as the same sentinel.
+
+LangGraph logs a warning when it loads a class that is not on the serializer's
+msgpack allowlist. checkpoint_serializer builds a JsonPlusSerializer with this
+package's channel value types (CHANNEL_TYPES) on the allowlist.
+
+Example:
+    graph = builder.compile(checkpointer=MemorySaver(serde=MessagePackSerializer()))
+
+    saver = MemorySaver(serde=checkpoint_serializer())
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+import ormsgpack
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from src.reducers import MessageLog
+from src.state_updates import DELETE
+
+TYPE_TAG = "msgpack-messages"
+
+# Extension type codes
+EXT_MESSAGE = 1
+EXT_TUPLE = 2
+EXT_SET = 3
+EXT_FROZENSET = 4
+EXT_DELETE = 5
+
+# Stable codes for the message classes with a fast path. Append only: the codes
+# are stored in checkpoints.
+MESSAGE_CLASSES: tuple[type[BaseMessage], ...] = (
+    HumanMessage,
+    AIMessage,
+    ToolMessage,
+    SystemMessage,
+)
+_MESSAGE_CODES = {cls: code for code, cls in enumerate(MESSAGE_CLASSES)}
+
+# Channel value classes defined in this package, as (module, class name)
+CHANNEL_TYPES: tuple[tuple[str, str], ...] = (
+    ("src.reducers", "MessageWindow"),
+    ("src.reducers", "MessageLog"),
+    ("src.message_records", "MessageRecord"),
+    ("src.state_updates", "_Sentinel"),
+)
+
+_PACK_OPTIONS = (
+    ormsgpack.OPT_NON_STR_KEYS
+    | ormsgpack.OPT_PASSTHROUGH_TUPLE
+    | ormsgpack.OPT_PASSTHROUGH_SUBCLASS
+    | ormsgpack.OPT_PASSTHROUGH_DATACLASS
+    | ormsgpack.OPT_PASSTHROUGH_DATETIME
+    | ormsgpack.OPT_PASSTHROUGH_ENUM
+    | ormsgpack.OPT_PASSTHROUGH_UUID
+)
+
+
+def _default(obj: Any) -> ormsgpack.Ext:
+    """Encode the types msgpack has no native representation for."""
+    code = _MESSAGE_CODES.get(type(obj))
+    if code is not None:
+        payload = [code, obj.__dict__, obj.__pydantic_extra__ or None]
+        return ormsgpack.Ext(EXT_MESSAGE, _pack(payload))
+    if type(obj) is tuple:
+        return ormsgpack.Ext(EXT_TUPLE, _pack(list(obj)))
+    if type(obj) is set:
+        return ormsgpack.Ext(EXT_SET, _pack(list(obj)))
+    if type(obj) is frozenset:
+        return ormsgpack.Ext(EXT_FROZENSET, _pack(list(obj)))
+    if obj is DELETE:
+        return ormsgpack.Ext(EXT_DELETE, _pack(None))
+    if isinstance(obj, MessageLog):
+        # Stored as a plain list; indexed_messages re-indexes it on next update
+        return list(obj)
+    raise TypeError(f"Type is not msgpack serializable: {type(obj).__qualname__}")
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    """Decode the extension types written by _default."""
+    value = _unpack(data)
+    if code == EXT_MESSAGE:
+        cls_code, fields, extra = value
+        return MESSAGE_CLASSES[cls_code].model_construct(**fields, **(extra or {}))
+    if code == EXT_TUPLE:
+        return tuple(value)
+    if code == EXT_SET:
+        return set(value)
+    if code == EXT_FROZENSET:
+        return frozenset(value)
+    if code == EXT_DELETE:
+        return DELETE
+    raise ValueError(f"Unknown msgpack extension type {code}")
+
+
+def _pack(obj: Any) -> bytes:
+    return ormsgpack.packb(obj, default=_default, option=_PACK_OPTIONS)
+
+
+def _unpack(data: bytes) -> Any:
+    return ormsgpack.unpackb(
+        data, ext_hook=_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
+    )
+
+
+def checkpoint_serializer(
+    extra_types: Iterable[tuple[str, str] | type] = (),
+) -> JsonPlusSerializer:
+    """Build a JsonPlusSerializer that allows CHANNEL_TYPES.
+
+    With an explicit allowlist LangGraph loads only its own safe types and the
+    listed ones, so add any other custom classes the graph state holds.
+
+    Args:
+        extra_types: Further (module, class name) pairs or classes to allow
+    """
+    return JsonPlusSerializer(allowed_msgpack_modules=[*CHANNEL_TYPES, *extra_types])
+
+
+class MessagePackSerializer(SerializerProtocol):
+    """Checkpoint serializer using msgpack with a fast path for messages.
+
+    Args:
+        fallback: Serializer for values the fast encoding does not support.
+            Defaults to LangGraph's JsonPlusSerializer; pass
+            checkpoint_serializer() to load CHANNEL_TYPES without warnings.
+    """
+
+    def __init__(self, fallback: SerializerProtocol | None = None) -> None:
+        self.fallback = fallback or JsonPlusSerializer()
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        try:
+            return TYPE_TAG, _pack(obj)
+        except TypeError:
+            # Some value has no fast encoding; store the whole object the
+            # default way so it still round-trips
+            return self.fallback.dumps_typed(obj)
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_ == TYPE_TAG:
+            return _unpack(payload)
+        return self.fallback.loads_typed(data)
@@ -0,0 +1,114 @@
+# src/single_flight.py
+"""Single-flight coalescing of identical concurrent async calls.
+
+When several tasks ask for the same thing at the same time (two pending tools
+with the same query, or many conversations asking "capital of France" at
+once), only the first call runs. The others wait for it and receive the same
+result, or the same exception. Once the call finishes, the next request for
+that key runs again; results are not cached (see src.tool_cache for that).
+
+Example:
+    flight = SingleFlight()
+    execute = coalesced(execute_tool, flight)
+
+    # Duplicate tool calls run once; each keeps its own ID
+    pairs = await asyncio.gather(*(execute(call) for call in pending_tools))
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Any, TypeVar
+
+from src.tool_cache import cache_key
+
+T = TypeVar("T")
+
+
+def tool_call_key(tool_call: Mapping[str, Any]) -> str:
+    """Key identical tool calls alike, ignoring their IDs.
+
+    Uses the same normalization as the tool result cache, so calls that would
+    share a cache entry are coalesced too.
+    """
+    return cache_key(tool_call.get("tool_name", ""), tool_call.get("args") or {})
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its outcome.
+
+    In-flight calls are tracked per event loop, so one instance can be shared
+    by graphs running on different loops.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[
+            tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future
+        ] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Return the outcome of call(), or of the in-flight call for key.
+
+        A waiter that is cancelled does not cancel the shared call, so the
+        other waiters still get their result.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        future = self._inflight.get(flight_key)
+        if future is None:
+            self.calls += 1
+            future = asyncio.ensure_future(call())
+            self._inflight[flight_key] = future
+            future.add_done_callback(lambda done: self._finish(flight_key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
+
+    def _finish(self, flight_key: tuple, future: asyncio.Future) -> None:
+        self._inflight.pop(flight_key, None)
+        # Mark the exception retrieved: waiters re-raise it from their own
+        # await, and if every waiter was cancelled asyncio would otherwise log
+        # "Task exception was never retrieved"
+        if not future.cancelled():
+            future.exception()
+
+    @property
+    def inflight(self) -> int:
+        """Number of calls currently running."""
+        return len(self._inflight)
+
+    def stats(self) -> dict[str, int]:
+        """Counters for logging or metrics."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "inflight": self.inflight,
+        }
+
+
+def coalesced(
+    execute: Callable[[dict], Awaitable[tuple[str, Any]]],
+    flight: SingleFlight,
+    key: Callable[[Mapping[str, Any]], Hashable] = tool_call_key,
+) -> Callable[[dict], Awaitable[tuple[str, Any]]]:
+    """Wrap an executor returning (tool_call_id, result) with single-flight.
+
+    The shared execution reports the ID of whichever call ran it. The wrapper
+    swaps in the caller's own ID, so results and errors stay attributed to
+    every pending tool, duplicates included.
+
+    Args:
+        execute: Async function taking a tool call dict with an "id"
+        flight: SingleFlight shared by the callers to coalesce
+        key: Function mapping a tool call to its coalescing key
+
+    Returns:
+        An async function with the same signature as execute
+    """
+
+    async def run(tool_call: dict) -> tuple[str, Any]:
+        _, result = await flight.do(key(tool_call), lambda: execute(tool_call))
+        return tool_call["id"], result
+
+    return run
@@ -0,0 +1,153 @@
+# src/state_updates.py
+"""Delta-only node updates with structurally shared nested maps.
+
+A node that returns ``{**state, "tool_name": name}`` copies the whole state
+dict on every step and sends every key back through its channel, including
+``messages``, which add_messages then re-merges by ID. The helpers here let a
+node return only what changed:
+
+- changes(state, update) drops keys whose value is the one already in state,
+  and reduces nested maps on merge_maps channels to their differences.
+- delta_node wraps an existing node that returns a full state so the graph only
+  receives the delta.
+- merge_maps is a reducer for nested dict channels (e.g. tool_usage). It copies
+  only the path to each changed key and shares every untouched sub-map with
+  the previous value, so values must be treated as read-only. Setting a key to
+  DELETE removes it. Because updates are merged, returning an empty map (or a
+  map without some key) leaves the existing counts in place: a merge_maps
+  channel can only be reset by sending DELETE for each key, e.g.
+  ``{"tool_usage": {name: DELETE for name in state["tool_usage"]}}``.
+
+Example:
+    class State(TypedDict):
+        tool_usage: Annotated[dict[str, int], merge_maps]
+
+    def update_usage(state: State) -> dict:
+        count = state["tool_usage"].get(name, 0) + 1
+        return {"tool_usage": {name: count}}
+"""
+
+import enum
+import functools
+import inspect
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+class _Sentinel(enum.Enum):
+    DELETE = "delete"
+
+
+# Value that removes a key in merge_maps. An enum member, so no real value can
+# be mistaken for it, and pending writes holding it still load from a
+# checkpoint as the same object (see src.serde.CHANNEL_TYPES).
+DELETE = _Sentinel.DELETE
+
+
+def merge_maps(left: Mapping | None, right: Mapping | None) -> dict:
+    """Merge right into left, copying only the paths that change.
+
+    Nested mappings are merged recursively; any other value replaces the old
+    one. Sub-maps that right does not touch are shared, not copied.
+    """
+    if not right:
+        return left if isinstance(left, dict) else dict(left or {})
+    merged = dict(left or {})
+    for key, value in right.items():
+        if value is DELETE:
+            merged.pop(key, None)
+            continue
+        current = merged.get(key)
+        if isinstance(value, Mapping) and isinstance(current, Mapping):
+            merged[key] = merge_maps(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def diff_maps(old: Mapping, new: Mapping) -> dict:
+    """Return the smallest update that merge_maps(old, update) turns into new."""
+    delta: dict[str, Any] = dict.fromkeys(old.keys() - new.keys(), DELETE)
+    for key, value in new.items():
+        if key not in old:
+            delta[key] = value
+            continue
+        current = old[key]
+        if current is value:
+            continue
+        if isinstance(value, Mapping) and isinstance(current, Mapping):
+            nested = diff_maps(current, value)
+            if nested:
+                delta[key] = nested
+        elif current != value:
+            delta[key] = value
+    return delta
+
+
+def changes(
+    state: Mapping[str, Any],
+    update: Mapping[str, Any],
+    map_keys: Iterable[str] = (),
+) -> dict[str, Any]:
+    """Reduce a node's return value to the keys that actually changed.
+
+    Values are compared by identity, so the messages list and other channels
+    carried over from ``{**state, ...}`` are dropped without an O(n) compare.
+
+    Args:
+        state: State the node was called with
+        update: Value the node returned
+        map_keys: Keys of merge_maps channels, sent as diff_maps deltas
+
+    Returns:
+        The delta to return from the node
+    """
+    map_keys = frozenset(map_keys)
+    delta: dict[str, Any] = {}
+    for key, value in update.items():
+        if key not in state:
+            delta[key] = value
+        elif state[key] is value:
+            continue
+        elif key in map_keys and isinstance(value, Mapping):
+            nested = diff_maps(state[key], value)
+            if nested:
+                delta[key] = nested
+        else:
+            delta[key] = value
+    return delta
+
+
+def delta_node(
+    node: Callable[..., Any] | None = None,
+    *,
+    map_keys: Iterable[str] = (),
+) -> Any:
+    """Decorate a node so it returns only the keys it changed.
+
+    Usable as ``@delta_node`` or ``@delta_node(map_keys=["tool_usage"])``, on
+    sync and async nodes. Non-mapping return values (e.g. Command) pass through.
+    """
+    map_keys = tuple(map_keys)
+
+    def reduce(state: Mapping[str, Any], update: Any) -> Any:
+        if not isinstance(update, Mapping):
+            return update
+        return changes(state, update, map_keys)
+
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(state: Any, *args: Any, **kwargs: Any) -> Any:
+                return reduce(state, await func(state, *args, **kwargs))
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(state: Any, *args: Any, **kwargs: Any) -> Any:
+            return reduce(state, func(state, *args, **kwargs))
+
+        return wrapper
+
+    return decorate(node) if node is not None else decorate
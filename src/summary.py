@@ -0,0 +1,137 @@
+# src/summary.py
+"""Incremental rolling summary for windowed conversations.
+
+Rebuilding the summary from every message on every turn is O(n) per turn and
+the summary grows without bound. fold_summary() instead appends only the
+messages added since the last fold, tracked by the ID of the last summarized
+message (the cursor), and trims the oldest entries once the summary exceeds a
+maximum size. Messages that were folded in stay covered after the window
+evicts them.
+
+Example:
+    summary, cursor = fold_summary(state["summary"], cursor, state["messages"])
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from langchain_core.messages import BaseMessage
+
+SUMMARY_PREFIX = "Conversation summary: "
+SEPARATOR = " -> "
+TRUNCATION_MARKER = "..."
+
+# Upper bound on the summary length, including the prefix
+DEFAULT_MAX_SUMMARY_CHARS = 2000
+
+# Smallest max_chars that leaves room for the prefix and the truncation marker
+MIN_SUMMARY_CHARS = len(SUMMARY_PREFIX) + len(TRUNCATION_MARKER)
+
+
+def messages_since(
+    messages: Sequence[BaseMessage], cursor: str | None
+) -> Sequence[BaseMessage]:
+    """Return the messages that come after the one whose ID is the cursor.
+
+    Scans backwards from the newest message, so the cost is proportional to the
+    number of new messages. If the cursor is None or no longer in the list (it
+    was evicted), every message is new.
+    """
+    if cursor is None:
+        return messages
+    for index in range(len(messages) - 1, -1, -1):
+        if messages[index].id == cursor:
+            return messages[index + 1 :]
+    return messages
+
+
+def _check_max_chars(max_chars: int) -> None:
+    if max_chars < MIN_SUMMARY_CHARS:
+        raise ValueError(
+            f"max_chars must be at least {MIN_SUMMARY_CHARS}, the length of "
+            "the prefix and the truncation marker"
+        )
+
+
+def _trim(body: str, limit: int) -> str:
+    """Drop whole entries from the front of body until it fits in limit.
+
+    The dropped entries are replaced by the truncation marker. If even the
+    newest entry does not fit, only the marker is left.
+    """
+    if len(body) <= limit:
+        return body
+    head = TRUNCATION_MARKER + SEPARATOR
+    cut = body.find(SEPARATOR, len(body) - (limit - len(head)) - len(SEPARATOR))
+    if cut == -1:
+        return TRUNCATION_MARKER
+    return head + body[cut + len(SEPARATOR) :]
+
+
+def fold_summary(
+    summary: str,
+    cursor: str | None,
+    messages: Sequence[BaseMessage],
+    *,
+    max_chars: int = DEFAULT_MAX_SUMMARY_CHARS,
+) -> tuple[str, str | None]:
+    """Fold the messages added since the cursor into the summary.
+
+    Args:
+        summary: Current summary ("" if none yet)
+        cursor: ID of the last message already in the summary
+        messages: Current message window. Messages need IDs, which the
+            add_messages reducer assigns.
+        max_chars: Maximum summary length, including the prefix. The oldest
+            entries are replaced by "..." once the summary would grow past it.
+
+    Returns:
+        The updated summary and cursor
+
+    Raises:
+        ValueError: If max_chars is below MIN_SUMMARY_CHARS
+    """
+    _check_max_chars(max_chars)
+    new_messages = messages_since(messages, cursor)
+    if not new_messages:
+        return summary, cursor
+
+    body = summary.removeprefix(SUMMARY_PREFIX)
+    entries = [str(message.content) for message in new_messages]
+    body = SEPARATOR.join([body, *entries] if body else entries)
+    body = _trim(body, max_chars - len(SUMMARY_PREFIX))
+    return SUMMARY_PREFIX + body, new_messages[-1].id
+
+
+def make_summary_node(
+    *,
+    max_chars: int = DEFAULT_MAX_SUMMARY_CHARS,
+    min_messages: int = 3,
+    cursor_key: str = "summary_cursor",
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Build a summary_generation node that folds in only new messages.
+
+    Args:
+        max_chars: Maximum summary length
+        min_messages: Messages required before the first summary is written
+        cursor_key: State key that stores the cursor between turns
+
+    Returns:
+        A node returning updates for "summary" and the cursor key
+
+    Raises:
+        ValueError: If max_chars is below MIN_SUMMARY_CHARS
+    """
+    _check_max_chars(max_chars)
+
+    def summary_generation(state: dict[str, Any]) -> dict[str, Any]:
+        cursor = state.get(cursor_key)
+        messages = state["messages"]
+        if cursor is None and len(messages) < min_messages:
+            return {}
+        summary, cursor = fold_summary(
+            state.get("summary", ""), cursor, messages, max_chars=max_chars
+        )
+        return {"summary": summary, cursor_key: cursor}
+
+    return summary_generation
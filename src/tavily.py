@@ -0,0 +1,75 @@
+# src/tavily.py
+"""Tavily search wrapper that reuses the registry's pooled HTTP sessions.
+
+The stock TavilySearchAPIWrapper opens a new connection for every sync call and
+a new aiohttp.ClientSession for every async call. This subclass sends the same
+request through the shared sessions from src.clients instead.
+
+Async callers should use the tool's ainvoke(), which goes through
+raw_results_async on the event loop. Offloading invoke() with
+asyncio.to_thread ties up a worker of the default thread pool for the whole
+request, and that pool only has min(32, cpu_count + 4) workers.
+"""
+
+from typing import Any
+
+from langchain_community.utilities.tavily_search import (
+    TAVILY_API_URL,
+    TavilySearchAPIWrapper,
+)
+
+from src.clients import HTTP_TIMEOUT, registry
+
+
+class PooledTavilySearchAPIWrapper(TavilySearchAPIWrapper):
+    """TavilySearchAPIWrapper backed by shared, connection-pooled sessions."""
+
+    # Base URL of the search API (e.g. a local stand-in for load tests)
+    api_url: str = TAVILY_API_URL
+
+    def _search_params(
+        self,
+        query: str,
+        max_results: int | None = 5,
+        search_depth: str | None = "advanced",
+        include_domains: list[str] | None = None,
+        exclude_domains: list[str] | None = None,
+        include_answer: bool | None = False,
+        include_raw_content: bool | None = False,
+        include_images: bool | None = False,
+        **extra: Any,
+    ) -> dict[str, Any]:
+        """Build the request body, accepting the parent's positional order."""
+        params = {
+            "api_key": self.tavily_api_key.get_secret_value(),
+            "query": query,
+            "max_results": max_results,
+            "search_depth": search_depth,
+            "include_domains": include_domains or [],
+            "exclude_domains": exclude_domains or [],
+            "include_answer": include_answer,
+            "include_raw_content": include_raw_content,
+            "include_images": include_images,
+        }
+        params.update({key: value for key, value in extra.items() if value is not None})
+        return params
+
+    def raw_results(self, query: str, *args: Any, **kwargs: Any) -> dict:
+        """Run a search over the shared requests session."""
+        response = registry.http_session().post(
+            f"{self.api_url}/search",
+            json=self._search_params(query, *args, **kwargs),
+            timeout=HTTP_TIMEOUT,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def raw_results_async(self, query: str, *args: Any, **kwargs: Any) -> dict:
+        """Run a search over the shared aiohttp session of the running loop."""
+        session = registry.async_http_session()
+        async with session.post(
+            f"{self.api_url}/search",
+            json=self._search_params(query, *args, **kwargs),
+        ) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
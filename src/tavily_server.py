@@ -0,0 +1,365 @@
+# src/tavily_server.py
+"""Local stand-in for the Tavily search API.
+
+Serves POST /search with the same request and response shape as
+https://api.tavily.com, so TavilySearchResults works against it unchanged.
+Results are deterministic: known queries return fixtures, and any other query
+returns results generated from a hash of the normalized query. A
+ServerProfile adds realistic behaviour on top:
+
+- latency drawn from a fixed, uniform, log-normal or exponential distribution
+- a fraction of requests failing with a server error
+- a token-bucket rate limit that answers 429 with Retry-After
+
+Point the shared tool at the stand-in by setting TAVILY_API_URL in the
+environment or .env (see src.clients). No API quota or network is needed, so
+load tests and benchmarks can run offline and in CI.
+
+Example:
+    python -m src.tavily_server --port 8765 --latency lognormal --latency-ms 300 \\
+        --error-rate 0.02 --rate-limit 50
+    TAVILY_API_URL=http://127.0.0.1:8765 python -m benchmarks.bench_tavily_async
+
+    # In-process, e.g. from a test or benchmark
+    with StandInServer(ServerProfile(latency_ms=50)) as server:
+        wrapper = PooledTavilySearchAPIWrapper(api_url=server.url, ...)
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+
+from src.classification_cache import normalize_text
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal", "exponential")
+
+DEFAULT_PORT = 8765
+
+# Returned for these queries instead of generated results
+DEFAULT_FIXTURES: Mapping[str, list[dict[str, Any]]] = {
+    "capital of france": [
+        {
+            "title": "Paris - Wikipedia",
+            "url": "https://en.wikipedia.org/wiki/Paris",
+            "content": "Paris is the capital and largest city of France.",
+            "score": 0.98,
+        },
+        {
+            "title": "France | Capital, Map, Population | Britannica",
+            "url": "https://www.britannica.com/place/France",
+            "content": "The capital of France is Paris, on the Seine.",
+            "score": 0.95,
+        },
+    ],
+}
+
+
+@dataclass(frozen=True)
+class ServerProfile:
+    """Latency, failure and rate-limit behaviour of the stand-in.
+
+    Attributes:
+        latency: Latency distribution, one of LATENCY_DISTRIBUTIONS
+        latency_ms: Latency for "fixed", and the median for the others
+        latency_spread: Relative spread. Uniform draws from median * (1 +/-
+            spread); log-normal uses it as sigma. Not used by "fixed" or
+            "exponential"
+        error_rate: Fraction of requests answered with error_status
+        error_status: HTTP status of injected failures
+        rate_limit: Sustained requests per second before 429s (None: no limit)
+        burst: Requests allowed in a burst (default: one second's worth)
+        seed: Seed for latency and failure draws
+    """
+
+    latency: str = "fixed"
+    latency_ms: float = 0.0
+    latency_spread: float = 0.5
+    error_rate: float = 0.0
+    error_status: int = 500
+    rate_limit: float | None = None
+    burst: int | None = None
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"latency must be one of {LATENCY_DISTRIBUTIONS}, "
+                f"got {self.latency!r}"
+            )
+        if self.latency_ms < 0 or self.latency_spread < 0:
+            raise ValueError("latency_ms and latency_spread must not be negative")
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        if self.rate_limit is not None and self.rate_limit <= 0:
+            raise ValueError("rate_limit must be positive")
+
+
+def sample_latency(profile: ServerProfile, rng: random.Random) -> float:
+    """Draw one response latency, in seconds."""
+    median = profile.latency_ms / 1000
+    if profile.latency == "fixed" or median == 0:
+        return median
+    if profile.latency == "uniform":
+        low = median * max(0.0, 1 - profile.latency_spread)
+        return rng.uniform(low, median * (1 + profile.latency_spread))
+    if profile.latency == "lognormal":
+        return rng.lognormvariate(math.log(median), profile.latency_spread)
+    # Exponential with the given median
+    return rng.expovariate(math.log(2) / median)
+
+
+def generate_results(query: str, max_results: int = 5) -> list[dict[str, Any]]:
+    """Build search results for a query without a fixture.
+
+    The results depend only on the normalized query, so "Weather in Paris?"
+    and "weather in paris" get the same ones.
+    """
+    key = normalize_text(query)
+    digest = zlib.crc32(key.encode())
+    slug = "-".join(key.split()) or "empty"
+    return [
+        {
+            "title": f"{key} - result {rank + 1}",
+            "url": f"https://example.com/{slug}/{(digest + rank) % 10_000}",
+            "content": f"Stand-in search result {rank + 1} for {key!r}.",
+            "score": round(0.95 - 0.1 * rank - (digest % 100) / 10_000, 4),
+        }
+        for rank in range(max(0, max_results))
+    ]
+
+
+def load_fixtures(path: str | Path) -> dict[str, list[dict[str, Any]]]:
+    """Read fixtures from a JSON object mapping query to a list of results."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {normalize_text(query): results for query, results in data.items()}
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take a token; returns 0 on success or the seconds until one is free."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+STATS_KEY = web.AppKey("stats", Counter)
+
+
+def make_app(
+    profile: ServerProfile | None = None,
+    fixtures: Mapping[str, list[dict[str, Any]]] | None = None,
+) -> web.Application:
+    """Build the aiohttp application serving POST /search.
+
+    Args:
+        profile: Behaviour to simulate (default: instant, always succeeds)
+        fixtures: Results for specific queries, keyed by query text
+            (default: DEFAULT_FIXTURES)
+
+    Returns:
+        The application. Request outcomes are counted in app[STATS_KEY].
+    """
+    profile = profile or ServerProfile()
+    if fixtures is None:
+        fixtures = DEFAULT_FIXTURES
+    fixtures = {normalize_text(query): results for query, results in fixtures.items()}
+    rng = random.Random(profile.seed)
+    bucket = None
+    if profile.rate_limit:
+        burst = profile.burst or math.ceil(profile.rate_limit)
+        bucket = _TokenBucket(profile.rate_limit, burst)
+    stats: Counter[str] = Counter()
+
+    async def search(request: web.Request) -> web.Response:
+        stats["requests"] += 1
+        if bucket is not None:
+            wait = bucket.take()
+            if wait:
+                stats["rate_limited"] += 1
+                return web.json_response(
+                    {"detail": {"error": "Rate limit exceeded"}},
+                    status=429,
+                    headers={"Retry-After": str(math.ceil(wait))},
+                )
+        try:
+            body = await request.json()
+            query = body["query"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            stats["bad_request"] += 1
+            return web.json_response(
+                {"detail": {"error": "Request body must include a query"}},
+                status=400,
+            )
+
+        latency = sample_latency(profile, rng)
+        failed = rng.random() < profile.error_rate
+        if latency:
+            await asyncio.sleep(latency)
+        if failed:
+            stats["errors"] += 1
+            return web.json_response(
+                {"detail": {"error": "Injected failure"}},
+                status=profile.error_status,
+            )
+
+        max_results = body.get("max_results") or 5
+        results = fixtures.get(normalize_text(query))
+        if results is None:
+            results = generate_results(query, max_results)
+        stats["ok"] += 1
+        return web.json_response(
+            {
+                "query": query,
+                "follow_up_questions": None,
+                "answer": None,
+                "images": [],
+                "results": results[:max_results],
+                "response_time": round(latency, 4),
+            }
+        )
+
+    app = web.Application()
+    app[STATS_KEY] = stats
+    app.router.add_post("/search", search)
+    return app
+
+
+class StandInServer:
+    """Run the stand-in on a background thread with its own event loop.
+
+    The server does not share the caller's event loop, so it never competes
+    with the client under test.
+
+    Args:
+        profile: Behaviour to simulate
+        fixtures: Results for specific queries (default: DEFAULT_FIXTURES)
+        host: Interface to bind
+        port: Port to bind (0: any free port)
+    """
+
+    def __init__(
+        self,
+        profile: ServerProfile | None = None,
+        fixtures: Mapping[str, list[dict[str, Any]]] | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.app = make_app(profile, fixtures)
+        self.host = host
+        self.port = port
+        self.url: str | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopped: asyncio.Event | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def stats(self) -> Counter[str]:
+        """Request outcome counters (requests, ok, errors, rate_limited, ...)."""
+        return self.app[STATS_KEY]
+
+    def start(self) -> str:
+        """Start serving and return the base URL."""
+        if self._thread is not None:
+            raise RuntimeError("Server is already running")
+        started = threading.Event()
+        failure: list[BaseException] = []
+
+        async def serve() -> None:
+            self._loop = asyncio.get_running_loop()
+            self._stopped = asyncio.Event()
+            runner = web.AppRunner(self.app, access_log=None)
+            try:
+                await runner.setup()
+                site = web.TCPSite(runner, self.host, self.port, backlog=4096)
+                await site.start()
+                host, port = runner.addresses[0][:2]
+                self.url = f"http://{host}:{port}"
+            except BaseException as error:
+                failure.append(error)
+                started.set()
+                await runner.cleanup()
+                return
+            started.set()
+            await self._stopped.wait()
+            await runner.cleanup()
+
+        self._thread = threading.Thread(
+            target=asyncio.run, args=(serve(),), name="tavily-stand-in", daemon=True
+        )
+        self._thread.start()
+        started.wait()
+        if failure:
+            self._thread = None
+            raise failure[0]
+        return self.url
+
+    def stop(self) -> None:
+        """Stop serving and wait for the server thread to exit."""
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._stopped.set)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local Tavily search stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-spread", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--rate-limit", type=float, help="requests per second")
+    parser.add_argument("--burst", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fixtures", type=Path, help="JSON file of query results")
+    args = parser.parse_args()
+
+    profile = ServerProfile(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        latency_spread=args.latency_spread,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        seed=args.seed,
+    )
+    fixtures = load_fixtures(args.fixtures) if args.fixtures else None
+    web.run_app(make_app(profile, fixtures), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+# src/tool_cache.py
+"""TTL + LRU cache for tool results, with an optional SQLite tier.
+
+Search tools are called with the same few queries over and over ("capital of
+France"). ToolResultCache keys each call by tool name and normalized
+arguments, and answers repeats from memory instead of going over the network.
+Entries expire after a per-entry TTL. Beyond maxsize, the least recently used
+entries are evicted first.
+
+With a path, results are also written to a SQLite file. Entries then survive
+restarts and are shared by processes on the same machine. A lookup that misses
+memory but hits the file promotes the entry back into memory. ainvoke does its
+SQLite reads and writes in a worker thread (asyncio.to_thread), so concurrent
+async tool calls do not wait on the disk. Results that cannot be encoded as
+JSON are kept in memory only, with a warning.
+
+Only results are cached, never failures. Exceptions propagate as usual.
+TavilySearchResults reports failures by returning the error as a string, and
+those are not cached either.
+
+Example:
+    search_cache = ToolResultCache(ttl=3600, path="cache/tools.sqlite")
+    results = search_cache.invoke(tavily_tool, {"query": "capital of France"})
+"""
+
+import asyncio
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+from src.classification_cache import normalize_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAXSIZE = 1024
+
+# Seconds a result stays fresh unless put() is given another TTL
+DEFAULT_TTL = 3600.0
+
+_MISSING = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tool_results (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+def cache_key(
+    tool_name: str,
+    args: Mapping[str, Any],
+    normalize: Callable[[str], str] = normalize_text,
+) -> str:
+    """Build the cache key for a tool call.
+
+    Top-level string arguments are normalized, so "Capital of France?" and
+    "capital of france" share a key. Argument order does not matter.
+    """
+    normalized = {
+        name: normalize(value) if isinstance(value, str) else value
+        for name, value in args.items()
+    }
+    return f"{tool_name}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+
+def _is_result(value: Any) -> bool:
+    # TavilySearchResults returns repr(error) instead of raising
+    return not isinstance(value, str)
+
+
+class ToolResultCache:
+    """Thread-safe TTL + LRU cache of tool results.
+
+    Args:
+        maxsize: Maximum number of entries kept in memory
+        ttl: Default seconds before an entry expires (None: never)
+        path: SQLite file for the on-disk tier (default: memory only)
+        normalize: Function applied to string arguments when building keys
+        should_cache: Predicate deciding whether a tool result is cached
+        clock: Wall-clock time source, in seconds
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float | None = DEFAULT_TTL,
+        *,
+        path: str | Path | None = None,
+        normalize: Callable[[str], str] = normalize_text,
+        should_cache: Callable[[Any], bool] = _is_result,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.normalize = normalize
+        self.should_cache = should_cache
+        self.clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Guards the SQLite connection; never taken while holding _lock
+        self._db_lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            with self._db:
+                self._db.execute(_SCHEMA)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def key(self, tool_name: str, args: Mapping[str, Any]) -> str:
+        """Return the cache key for a call of tool_name with args."""
+        return cache_key(tool_name, args, self.normalize)
+
+    def _expiry(self, ttl: float | None) -> float:
+        ttl = self.ttl if ttl is None else ttl
+        return math.inf if ttl is None else self.clock() + ttl
+
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        # Caller holds the lock
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _get_memory(self, key: str, now: float) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+            self.expirations += 1
+            return _MISSING
+
+    def _get_disk(self, key: str, now: float) -> Any:
+        with self._db_lock:
+            if self._db is None:
+                return _MISSING
+            row = self._db.execute(
+                "SELECT value, expires_at FROM tool_results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[1] <= now:
+                with self._db:
+                    self._db.execute("DELETE FROM tool_results WHERE key = ?", (key,))
+        if row is None:
+            return _MISSING
+        value, expires_at = row
+        with self._lock:
+            if expires_at <= now:
+                self.expirations += 1
+                return _MISSING
+            value = json.loads(value)
+            self._remember(key, expires_at, value)
+            self.hits += 1
+            self.disk_hits += 1
+            return value
+
+    def _persist(self, key: str, value: Any, expires_at: float) -> None:
+        try:
+            encoded = json.dumps(value)
+        except (TypeError, ValueError) as error:
+            # The call succeeded; only the disk copy is skipped
+            logger.warning("Not persisting %s, result is not JSON: %s", key, error)
+            return
+        with self._db_lock:
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO tool_results VALUES (?, ?, ?)",
+                        (key, encoded, expires_at),
+                    )
+
+    def _miss(self, default: Any) -> Any:
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def get(self, tool_name: str, args: Mapping[str, Any], default: Any = None) -> Any:
+        """Return the cached result of a call, counting a hit or miss."""
+        key = self.key(tool_name, args)
+        now = self.clock()
+        value = self._get_memory(key, now)
+        if value is _MISSING and self._db is not None:
+            value = self._get_disk(key, now)
+        return self._miss(default) if value is _MISSING else value
+
+    async def aget(
+        self, tool_name: str, args: Mapping[str, Any], default: Any = None
+    ) -> Any:
+        """Async get(); the SQLite lookup runs in a worker thread."""
+        key = self.key(tool_name, args)
+        now = self.clock()
+        value = self._get_memory(key, now)
+        if value is _MISSING and self._db is not None:
+            value = await asyncio.to_thread(self._get_disk, key, now)
+        return self._miss(default) if value is _MISSING else value
+
+    def put(
+        self,
+        tool_name: str,
+        args: Mapping[str, Any],
+        value: Any,
+        ttl: float | None = None,
+    ) -> None:
+        """Store a result.
+
+        Args:
+            tool_name: Name of the tool that produced the result
+            args: Arguments of the call
+            value: The result. Only JSON-serializable results are written to
+                the SQLite tier; others are kept in memory and a warning is
+                logged.
+            ttl: Seconds until the entry expires (default: the cache's ttl,
+                math.inf: never)
+        """
+        key = self.key(tool_name, args)
+        expires_at = self._expiry(ttl)
+        with self._lock:
+            self._remember(key, expires_at, value)
+        if self._db is not None:
+            self._persist(key, value, expires_at)
+
+    async def aput(
+        self,
+        tool_name: str,
+        args: Mapping[str, Any],
+        value: Any,
+        ttl: float | None = None,
+    ) -> None:
+        """Async put(); the SQLite write runs in a worker thread."""
+        key = self.key(tool_name, args)
+        expires_at = self._expiry(ttl)
+        with self._lock:
+            self._remember(key, expires_at, value)
+        if self._db is not None:
+            await asyncio.to_thread(self._persist, key, value, expires_at)
+
+    def get_or_call(
+        self,
+        tool_name: str,
+        args: Mapping[str, Any],
+        call: Callable[[Mapping[str, Any]], Any],
+        ttl: float | None = None,
+    ) -> Any:
+        """Return the cached result, or call(args) and cache what it returns."""
+        value = self.get(tool_name, args, _MISSING)
+        if value is _MISSING:
+            value = call(args)
+            if self.should_cache(value):
+                self.put(tool_name, args, value, ttl)
+        return value
+
+    def invoke(
+        self, tool: Any, args: Mapping[str, Any], ttl: float | None = None
+    ) -> Any:
+        """Run tool.invoke(args) through the cache."""
+        return self.get_or_call(tool.name, args, tool.invoke, ttl)
+
+    async def ainvoke(
+        self, tool: Any, args: Mapping[str, Any], ttl: float | None = None
+    ) -> Any:
+        """Run tool.ainvoke(args) through the cache, off the loop for SQLite."""
+        value = await self.aget(tool.name, args, _MISSING)
+        if value is _MISSING:
+            value = await tool.ainvoke(args)
+            if self.should_cache(value):
+                await self.aput(tool.name, args, value, ttl)
+        return value
+
+    def purge_expired(self) -> int:
+        """Drop expired entries from both tiers; returns how many were dropped."""
+        now = self.clock()
+        dropped = 0
+        with self._db_lock:
+            if self._db is not None:
+                with self._db:
+                    cursor = self._db.execute(
+                        "DELETE FROM tool_results WHERE expires_at <= ?", (now,)
+                    )
+                dropped += cursor.rowcount
+        with self._lock:
+            expired = [key for key, (at, _) in self._entries.items() if at <= now]
+            for key in expired:
+                del self._entries[key]
+            dropped += len(expired)
+            self.expirations += dropped
+            return dropped
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from either tier."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Counters for logging or metrics."""
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers and reset the counters."""
+        with self._db_lock:
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM tool_results")
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+            self.expirations = self.evictions = 0
+
+    def close(self) -> None:
+        """Close the SQLite connection, keeping the in-memory tier."""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
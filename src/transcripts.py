@@ -0,0 +1,295 @@
+# src/transcripts.py
+"""Append-only, memory-mapped transcript store for evicted messages.
+
+Windowing keeps graph state small by dropping old messages. TranscriptStore
+keeps them on disk instead: each thread has one append-only log of
+length-prefixed serialized messages, and an in-memory offset index built from
+the record headers. Reads go through a read-only mmap of the log and decode
+only the records requested, so nodes such as summary_generation can look at old
+history without it ever entering the graph state.
+
+Record layout: 2-byte type length, type, 2-byte message ID length, message ID,
+4-byte payload length, payload, all lengths big-endian. The type and payload
+come from a checkpoint serializer. Appends skip messages whose ID is already in
+the log, so replayed or retried evictions do not duplicate history. A record
+left incomplete by a crash is truncated away when the log is reopened.
+
+At most max_open logs are kept open (file handle, mmap and index); the least
+recently used one is closed when another is needed and reindexed on next use.
+
+Example:
+    store = TranscriptStore("transcripts")
+    graph_builder.add_node("windowing", make_trim_node(on_evict=store.spill))
+
+    def summary_generation(state, config):
+        oldest = store.read(thread_id_from(config), 0, 10)
+"""
+
+import logging
+import mmap
+import os
+import struct
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+from src.serde import MessagePackSerializer
+
+logger = logging.getLogger(__name__)
+
+# Logs kept open at once by default
+MAX_OPEN_TRANSCRIPTS = 64
+
+_TYPE_HEADER = struct.Struct(">H")
+_PAYLOAD_HEADER = struct.Struct(">I")
+
+
+def thread_id_from(config: RunnableConfig | None) -> str:
+    """Return the thread ID of a run config.
+
+    Raises:
+        KeyError: If the run has no thread_id (no checkpointer configured)
+    """
+    try:
+        return str((config or {})["configurable"]["thread_id"])
+    except KeyError:
+        raise KeyError("The run config has no configurable.thread_id") from None
+
+
+class _Transcript:
+    """One thread's log: append handle, read-only map, offset and ID index."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.offsets = array("Q")
+        self.ids: set[str] = set()
+        self.map: mmap.mmap | None = None
+        self.writer = open(path, "ab")
+        self.size = self._scan()
+        if self.size < os.path.getsize(path):
+            logger.warning(
+                "Truncating torn record at byte %d of %s", self.size, self.path
+            )
+            self._unmap()
+            self.writer.truncate(self.size)
+
+    def _remap(self) -> mmap.mmap:
+        if self.map is None or len(self.map) < self.size:
+            self._unmap()
+            with open(self.path, "rb") as reader:
+                self.map = mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.map
+
+    def _unmap(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+    def _scan(self) -> int:
+        """Index the complete records in the file.
+
+        Returns:
+            The end of the last complete record. A crash mid-append can leave
+            a partial record after it.
+        """
+        end = os.path.getsize(self.path)
+        if end == 0:
+            return 0
+        self.size = end
+        view = self._remap()
+        position = 0
+        while position < end:
+            fields = _read_record(view, position, end)
+            if fields is None:
+                break
+            message_id, next_position = fields
+            self.offsets.append(position)
+            if message_id:
+                self.ids.add(message_id)
+            position = next_position
+        return position
+
+    def append(self, records: Sequence[tuple[str, str, bytes]]) -> None:
+        chunks = []
+        position = self.size
+        for message_id, type_, payload in records:
+            header = b"".join(
+                _encode_field(_TYPE_HEADER, value.encode())
+                for value in (type_, message_id)
+            )
+            chunks += [header, _PAYLOAD_HEADER.pack(len(payload)), payload]
+            self.offsets.append(position)
+            if message_id:
+                self.ids.add(message_id)
+            position += len(header) + _PAYLOAD_HEADER.size + len(payload)
+        self.writer.write(b"".join(chunks))
+        self.writer.flush()
+        self.size = position
+
+    def record(self, index: int) -> tuple[str, bytes]:
+        view = self._remap()
+        position = self.offsets[index]
+        (type_length,) = _TYPE_HEADER.unpack_from(view, position)
+        position += _TYPE_HEADER.size
+        type_ = view[position : position + type_length].decode()
+        position += type_length
+        (id_length,) = _TYPE_HEADER.unpack_from(view, position)
+        position += _TYPE_HEADER.size + id_length
+        (payload_length,) = _PAYLOAD_HEADER.unpack_from(view, position)
+        position += _PAYLOAD_HEADER.size
+        return type_, view[position : position + payload_length]
+
+    def close(self) -> None:
+        self.writer.close()
+        self._unmap()
+
+
+def _encode_field(header: struct.Struct, value: bytes) -> bytes:
+    return header.pack(len(value)) + value
+
+
+def _read_record(view: mmap.mmap, position: int, end: int) -> tuple[str, int] | None:
+    """Return (message ID, end of record), or None if the record is incomplete."""
+    lengths = []
+    for header in (_TYPE_HEADER, _TYPE_HEADER, _PAYLOAD_HEADER):
+        if position + header.size > end:
+            return None
+        (length,) = header.unpack_from(view, position)
+        position += header.size
+        lengths.append((position, length))
+        position += length
+        if position > end:
+            return None
+    id_start, id_length = lengths[1]
+    return view[id_start : id_start + id_length].decode(), position
+
+
+class TranscriptStore:
+    """Per-thread append-only message logs under one directory.
+
+    Args:
+        directory: Directory holding one ``<thread_id>.log`` file per thread
+        serde: Serializer for the messages (default: MessagePackSerializer)
+        max_open: Most logs kept open at once
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        serde: SerializerProtocol | None = None,
+        *,
+        max_open: int = MAX_OPEN_TRANSCRIPTS,
+    ) -> None:
+        if max_open < 1:
+            raise ValueError("max_open must be at least 1")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.serde = serde or MessagePackSerializer()
+        self.max_open = max_open
+        self._transcripts: OrderedDict[str, _Transcript] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _transcript(self, thread_id: str, create: bool = True) -> _Transcript | None:
+        transcript = self._transcripts.get(thread_id)
+        if transcript is not None:
+            self._transcripts.move_to_end(thread_id)
+            return transcript
+
+        path = self.directory / f"{quote(thread_id, safe='')}.log"
+        if not create and not path.exists():
+            return None
+        while len(self._transcripts) >= self.max_open:
+            self._transcripts.popitem(last=False)[1].close()
+        transcript = self._transcripts[thread_id] = _Transcript(path)
+        return transcript
+
+    def append(self, thread_id: str, messages: Sequence[BaseMessage]) -> int:
+        """Append messages to the end of a thread's log.
+
+        Messages whose ID is already in the log (or earlier in the batch) are
+        skipped.
+
+        Returns:
+            The number of messages written
+        """
+        if not messages:
+            return 0
+        encoded = [
+            (message.id or "", *self.serde.dumps_typed(message)) for message in messages
+        ]
+        with self._lock:
+            transcript = self._transcript(thread_id)
+            batch_ids: set[str] = set()
+            records = []
+            for record in encoded:
+                message_id = record[0]
+                if message_id:
+                    if message_id in transcript.ids or message_id in batch_ids:
+                        continue
+                    batch_ids.add(message_id)
+                records.append(record)
+            if records:
+                transcript.append(records)
+            return len(records)
+
+    def spill(
+        self, messages: Sequence[BaseMessage], config: RunnableConfig | None
+    ) -> None:
+        """Eviction hook for make_trim_node: append to the run's thread log.
+
+        Messages already in the log are skipped, so a retried or replayed step
+        does not store its evictions twice.
+        """
+        self.append(thread_id_from(config), messages)
+
+    def count(self, thread_id: str) -> int:
+        """Number of messages stored for a thread."""
+        with self._lock:
+            transcript = self._transcript(thread_id, create=False)
+            return len(transcript.offsets) if transcript else 0
+
+    def iter(
+        self, thread_id: str, start: int = 0, stop: int | None = None
+    ) -> Iterator[BaseMessage]:
+        """Decode messages one at a time, oldest first.
+
+        start and stop follow slice semantics, including negative values.
+        Messages appended while iterating are not included.
+        """
+        with self._lock:
+            transcript = self._transcript(thread_id, create=False)
+            if transcript is None:
+                return
+            indices = range(len(transcript.offsets))[start:stop]
+        for index in indices:
+            with self._lock:
+                # Re-fetched each time: the log may have been evicted meanwhile
+                type_, payload = self._transcript(thread_id).record(index)
+            yield self.serde.loads_typed((type_, payload))
+
+    def read(
+        self, thread_id: str, start: int = 0, stop: int | None = None
+    ) -> list[BaseMessage]:
+        """Return a slice of a thread's messages, e.g. read(thread, -10)."""
+        return list(self.iter(thread_id, start, stop))
+
+    def close(self) -> None:
+        """Close every open log."""
+        with self._lock:
+            for transcript in self._transcripts.values():
+                transcript.close()
+            self._transcripts.clear()
+
+    def __enter__(self) -> "TranscriptStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
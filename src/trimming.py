@@ -0,0 +1,223 @@
+# src/trimming.py
+"""Window trimming that actually shrinks the persisted message channel.
+
+Assigning ``state["messages"] = state["messages"][-n:]`` and returning the state
+does not remove anything from an add_messages channel: the reducer merges the
+returned messages back by ID and keeps the rest. The helpers here emit
+RemoveMessage deltas for the evicted messages instead, so the channel, and every
+checkpoint written after it, only holds the window.
+
+The window is either a number of messages (make_trim_node) or a token budget
+(make_token_trim_node). Token counts are computed once per message and cached in
+its response_metadata, which is checkpointed with the message and never sent to
+the model, so finding the trim point never re-tokenizes history.
+
+Both nodes accept an on_evict hook that receives the evicted messages and the
+run config before they are removed, e.g. TranscriptStore.spill from
+src.transcripts to keep them on disk.
+
+Trimming bounds each checkpoint, but a saver still keeps every checkpoint of a
+thread. compact_checkpoints drops all but the newest few from an
+InMemorySaver, along with their pending writes and the channel blobs only they
+used, so a long conversation's total saver memory stays flat too.
+
+Example:
+    graph_builder.add_node("windowing", make_trim_node())
+    graph_builder.add_node("windowing", make_token_trim_node(max_tokens=2000))
+
+    graph.invoke(update, config)
+    compact_checkpoints(saver, thread_id_from(config))
+"""
+
+import math
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from langchain_core.messages import BaseMessage, RemoveMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.memory import InMemorySaver
+
+# Called with the evicted messages and the run config
+EvictionHook = Callable[[Sequence[BaseMessage], RunnableConfig | None], None]
+
+
+def _evict(
+    evicted: Sequence[BaseMessage],
+    config: RunnableConfig | None,
+    on_evict: EvictionHook | None,
+) -> dict[str, Any]:
+    """Run the eviction hook and build the removal update."""
+    if not evicted:
+        return {}
+    if on_evict is not None:
+        on_evict(evicted, config)
+    return {"messages": [RemoveMessage(id=message.id) for message in evicted]}
+
+
+def evicted_messages(
+    messages: Sequence[BaseMessage], window_size: int
+) -> Sequence[BaseMessage]:
+    """Return the oldest messages that fall outside the window."""
+    excess = len(messages) - window_size
+    return messages[:excess] if excess > 0 else []
+
+
+def window_removals(
+    messages: Sequence[BaseMessage], window_size: int
+) -> list[RemoveMessage]:
+    """Build RemoveMessage deltas that trim messages down to window_size."""
+    return [
+        RemoveMessage(id=message.id)
+        for message in evicted_messages(messages, window_size)
+    ]
+
+
+def make_trim_node(
+    window_size: int | None = None,
+    *,
+    window_key: str = "window_size",
+    on_evict: EvictionHook | None = None,
+) -> Callable[..., dict[str, Any]]:
+    """Build a message_windowing node that removes evicted messages.
+
+    Args:
+        window_size: Fixed window size. If omitted, the size is read from the
+            state under window_key on every step.
+        window_key: State key holding the window size
+        on_evict: Called with the evicted messages and run config before
+            they are removed
+
+    Returns:
+        A node that returns only the removal deltas (or no update)
+    """
+
+    def message_windowing(
+        state: dict[str, Any], config: RunnableConfig | None = None
+    ) -> dict[str, Any]:
+        size = window_size if window_size is not None else state[window_key]
+        return _evict(evicted_messages(state["messages"], size), config, on_evict)
+
+    return message_windowing
+
+
+TOKEN_COUNT_KEY = "token_count"
+
+# Per-message overhead (role, separators) used by the approximate counter
+MESSAGE_OVERHEAD_TOKENS = 3
+
+
+def approximate_token_count(message: BaseMessage) -> int:
+    """Estimate a message's tokens at four characters per token."""
+    content = message.content
+    if not isinstance(content, str):
+        content = "".join(
+            part if isinstance(part, str) else str(part.get("text", ""))
+            for part in content
+        )
+    return math.ceil(len(content) / 4) + MESSAGE_OVERHEAD_TOKENS
+
+
+def message_tokens(
+    message: BaseMessage,
+    token_counter: Callable[[BaseMessage], int] = approximate_token_count,
+) -> int:
+    """Return the message's token count, computing and caching it on first use.
+
+    Use the same token_counter for every call on a conversation; a cached count
+    is never recomputed.
+    """
+    count = message.response_metadata.get(TOKEN_COUNT_KEY)
+    if count is None:
+        count = message.response_metadata[TOKEN_COUNT_KEY] = token_counter(message)
+    return count
+
+
+def budget_evicted_messages(
+    messages: Sequence[BaseMessage],
+    max_tokens: int,
+    token_counter: Callable[[BaseMessage], int] = approximate_token_count,
+) -> Sequence[BaseMessage]:
+    """Return the oldest messages that do not fit in the token budget.
+
+    Walks back from the newest message, so only the messages that stay in the
+    window are counted. The newest message is always kept, even if it alone
+    exceeds the budget.
+    """
+    total = 0
+    for index in range(len(messages) - 1, -1, -1):
+        total += message_tokens(messages[index], token_counter)
+        if total > max_tokens and index < len(messages) - 1:
+            return messages[: index + 1]
+    return []
+
+
+def make_token_trim_node(
+    max_tokens: int | None = None,
+    *,
+    budget_key: str = "token_budget",
+    token_counter: Callable[[BaseMessage], int] = approximate_token_count,
+    on_evict: EvictionHook | None = None,
+) -> Callable[..., dict[str, Any]]:
+    """Build a message_windowing node that keeps messages within a token budget.
+
+    Args:
+        max_tokens: Fixed token budget. If omitted, the budget is read from the
+            state under budget_key on every step.
+        budget_key: State key holding the token budget
+        token_counter: Counts one message's tokens, e.g. a wrapper around
+            llm.get_num_tokens_from_messages. Called once per message.
+        on_evict: Called with the evicted messages and run config before
+            they are removed
+
+    Returns:
+        A node that returns only the removal deltas (or no update)
+    """
+
+    def message_windowing(
+        state: dict[str, Any], config: RunnableConfig | None = None
+    ) -> dict[str, Any]:
+        budget = max_tokens if max_tokens is not None else state[budget_key]
+        evicted = budget_evicted_messages(state["messages"], budget, token_counter)
+        return _evict(evicted, config, on_evict)
+
+    return message_windowing
+
+
+def compact_checkpoints(saver: InMemorySaver, thread_id: str, keep: int = 1) -> int:
+    """Delete all but the newest keep checkpoints of a thread.
+
+    Pending writes of the deleted checkpoints and channel blobs no kept
+    checkpoint refers to are deleted too. Time travel to a deleted checkpoint
+    is no longer possible. Not for graphs with DeltaChannel channels, whose
+    values are rebuilt from older checkpoints.
+
+    Args:
+        saver: The in-memory saver holding the thread
+        thread_id: Thread to compact
+        keep: Number of checkpoints kept per namespace
+
+    Returns:
+        The number of checkpoints deleted
+    """
+    if keep < 1:
+        raise ValueError("keep must be at least 1")
+    deleted = 0
+    for checkpoint_ns, checkpoints in saver.storage.get(thread_id, {}).items():
+        # Checkpoint IDs are time-ordered (UUIDv6)
+        stale = sorted(checkpoints)[:-keep]
+        for checkpoint_id in stale:
+            del checkpoints[checkpoint_id]
+            saver.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+        deleted += len(stale)
+
+        live = set()
+        for saved, _, _ in checkpoints.values():
+            versions = saver.serde.loads_typed(saved)["channel_versions"]
+            live.update(versions.items())
+        for key in [
+            key
+            for key in saver.blobs
+            if key[:2] == (thread_id, checkpoint_ns) and key[2:] not in live
+        ]:
+            del saver.blobs[key]
+    return deleted
@@ -1,8 +1,11 @@
+import logging
 import sys
 from pathlib import Path
 
 import pytest
 
+from src.logging_config import configure_logging, stop_logging
+
 # Add the solutions directory to the Python path
 solutions_path = Path(__file__).parent.parent / "solutions"
 sys.path.append(str(solutions_path))
@@ -28,6 +31,16 @@ def get_solution_module(request):
     return solution_module
 
 
+@pytest.fixture(scope="session", autouse=True)
+def debug_logging():
+    """
+    Log at DEBUG for the whole session through the non-blocking queue pipeline.
+    """
+    configure_logging(logging.DEBUG)
+    yield
+    stop_logging()
+
+
 @pytest.fixture
 def student_submission(request):
     """
@@ -0,0 +1,79 @@
+"""Tests for the LRU classification cache in src/classification_cache.py."""
+
+import asyncio
+
+import pytest
+
+from src.classification_cache import ClassificationCache, normalize_text
+
+
+def counting_classifier(calls):
+    def classify(text):
+        calls.append(text)
+        return ("greeting", 0.9)
+
+    return classify
+
+
+def test_normalize_text():
+    assert normalize_text("  Hello   there! ") == "hello there"
+    assert normalize_text("HELP?") == normalize_text("help")
+    assert normalize_text("2 + 2") == "2 + 2"
+
+
+def test_repeated_intents_skip_classification():
+    calls = []
+    cache = ClassificationCache()
+    classify = counting_classifier(calls)
+
+    for text in ["Hello", "hello!", " HELLO "]:
+        assert cache.get_or_compute(text, classify) == ("greeting", 0.9)
+
+    assert calls == ["Hello"]
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert cache.hit_rate == pytest.approx(2 / 3)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ClassificationCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+
+def test_clear_resets_counters():
+    cache = ClassificationCache()
+    cache.get_or_compute("hi", str.upper)
+    cache.clear()
+
+    assert cache.stats() == {
+        "size": 0,
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "hit_rate": 0.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_lookups():
+    cache = ClassificationCache(maxsize=8)
+
+    async def classify(text):
+        await asyncio.sleep(0)
+        return text.strip().lower()
+
+    texts = [f"message {i % 4}" for i in range(200)]
+    results = await asyncio.gather(
+        *(cache.aget_or_compute(text, classify) for text in texts)
+    )
+
+    assert results == [text.lower() for text in texts]
+    assert cache.hits + cache.misses == len(texts)
+    assert len(cache) == 4
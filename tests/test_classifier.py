@@ -0,0 +1,106 @@
+"""Tests for the batch message classifier in src/classifier.py."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from src.classifier import (
+    SEED_EXAMPLES,
+    BatchClassifier,
+    HashingFeaturizer,
+    classify_batches,
+    default_classifier,
+)
+
+
+def test_featurizer_rows_are_normalized():
+    offsets, columns, values = HashingFeaturizer(256).transform(["hello", ""])
+
+    assert offsets.tolist()[0] == 0
+    assert len(offsets) == 3
+    assert columns.max() < 256
+    for start, stop in itertools.pairwise(offsets):
+        assert np.linalg.norm(values[start:stop]) == pytest.approx(1.0)
+
+
+def test_hashing_is_stable():
+    first = HashingFeaturizer().transform(["I need help"])
+    second = HashingFeaturizer().transform(["I need help"])
+
+    assert all(np.array_equal(a, b) for a, b in zip(first, second, strict=True))
+
+
+@pytest.mark.parametrize(
+    ("text", "label", "min_confidence"),
+    [
+        ("Hello", "greeting", 0.8),
+        ("I need help", "help", 0.7),
+        ("Foo bar", "unknown", 0.0),
+    ],
+)
+def test_default_classifier_exercise_intents(text, label, min_confidence):
+    predicted, confidence = default_classifier().classify(text)
+
+    assert predicted == label
+    assert confidence >= min_confidence
+
+
+def test_probabilities_sum_to_one_for_large_batches():
+    texts = ["hello there", "can you help me", "bananas"] * 2000
+
+    probabilities = default_classifier().predict_proba(texts)
+
+    assert probabilities.shape == (6000, 3)
+    assert np.allclose(probabilities.sum(axis=1), 1.0)
+
+
+def test_batch_matches_single_predictions():
+    texts = ["hi", "help please", "the sky is blue"]
+    classifier = default_classifier()
+
+    assert classifier.predict(texts) == [classifier.classify(t) for t in texts]
+    assert list(classify_batches(iter(texts), batch_size=2)) == classifier.predict(
+        texts
+    )
+
+
+def test_calibration_fits_a_temperature():
+    classifier = BatchClassifier(["yes", "no"], n_features=64)
+    classifier.fit(["yes", "yep", "no", "nope"], ["yes", "yes", "no", "no"])
+
+    temperature = classifier.calibrate(["yes", "no"], ["yes", "no"])
+
+    assert temperature > 0
+    assert classifier.temperature == temperature
+
+
+def test_default_temperature_is_calibrated_out_of_fold():
+    """Held-out confidence matches held-out accuracy at the chosen temperature."""
+    examples = [(t, label) for label, texts in SEED_EXAMPLES.items() for t in texts]
+    temperature = default_classifier().temperature
+    confidences, correct = [], []
+    for fold in range(4):
+        train = [example for i, example in enumerate(examples) if i % 4 != fold]
+        held_out = examples[fold::4]
+        model = BatchClassifier(tuple(SEED_EXAMPLES)).fit(*zip(*train, strict=True))
+        model.temperature = temperature
+        for (label, confidence), (_, expected) in zip(
+            model.predict([text for text, _ in held_out]), held_out, strict=True
+        ):
+            confidences.append(confidence)
+            correct.append(label == expected)
+
+    assert np.mean(confidences) == pytest.approx(np.mean(correct), abs=0.1)
+
+
+def test_fit_calibrated_validates_folds():
+    with pytest.raises(ValueError, match="folds"):
+        BatchClassifier(["yes", "no"]).fit_calibrated(
+            ["yes", "no"], ["yes", "no"], folds=3
+        )
+
+
+def test_unknown_label_is_rejected():
+    with pytest.raises(ValueError, match="maybe"):
+        BatchClassifier(["yes", "no"]).fit(["hmm"], ["maybe"])
@@ -0,0 +1,172 @@
+"""Tests for the shared client registry in src/clients.py."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.clients import ClientRegistry
+
+
+def make_counting_factory(delay: float = 0.0):
+    """Factory that records how many times it was called."""
+    calls = []
+
+    def factory():
+        calls.append(threading.get_ident())
+        time.sleep(delay)
+        return object()
+
+    return factory, calls
+
+
+def test_clients_are_created_lazily_and_once():
+    registry = ClientRegistry()
+    factory, calls = make_counting_factory()
+    registry.register("client", factory)
+
+    assert calls == []
+    first = registry.get("client")
+    assert registry.get("client") is first
+    assert len(calls) == 1
+
+
+def test_concurrent_threads_share_one_client():
+    registry = ClientRegistry()
+    factory, calls = make_counting_factory(delay=0.05)
+    registry.register("client", factory)
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        clients = list(pool.map(lambda _: registry.get("client"), range(64)))
+
+    assert len(calls) == 1
+    assert all(client is clients[0] for client in clients)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_share_one_client():
+    registry = ClientRegistry()
+    factory, calls = make_counting_factory(delay=0.01)
+    registry.register("client", factory)
+
+    clients = await asyncio.gather(
+        *(asyncio.to_thread(registry.get, "client") for _ in range(32))
+    )
+
+    assert len(calls) == 1
+    assert len({id(client) for client in clients}) == 1
+
+
+def test_unknown_and_duplicate_names():
+    registry = ClientRegistry()
+    registry.register("client", object)
+
+    with pytest.raises(KeyError):
+        registry.get("missing")
+    with pytest.raises(ValueError):
+        registry.register("client", object)
+
+
+def test_replace_discards_built_client():
+    registry = ClientRegistry()
+    registry.register("client", object)
+    old = registry.get("client")
+
+    registry.register("client", object, replace=True)
+    assert registry.get("client") is not old
+
+
+def test_lazy_proxy_defers_creation():
+    registry = ClientRegistry()
+    factory, calls = make_counting_factory()
+    registry.register("client", lambda: (factory(), "value")[1])
+
+    proxy = registry.lazy("client")
+    assert calls == []
+    assert proxy.upper() == "VALUE"
+    assert proxy.resolve() == "value"
+    assert len(calls) == 1
+
+
+def test_lazy_proxy_works_where_langchain_expects_the_real_object():
+    from langchain_core.messages import AIMessage
+    from langchain_core.runnables import RunnableLambda
+    from langchain_core.tools import BaseTool, tool
+    from langgraph.graph import END, START, MessagesState, StateGraph
+    from langgraph.prebuilt import ToolNode
+
+    @tool
+    def calculator(expression: str) -> str:
+        """Evaluate an arithmetic expression."""
+        return str(eval(expression))
+
+    registry = ClientRegistry()
+    registry.register("calculator", lambda: calculator)
+    registry.register("double", lambda: RunnableLambda(lambda x: x * 2))
+    proxy = registry.lazy("calculator")
+
+    assert isinstance(proxy, BaseTool)
+    assert (RunnableLambda(lambda x: x + 1) | registry.lazy("double")).invoke(1) == 4
+
+    builder = StateGraph(MessagesState)
+    builder.add_node("tools", ToolNode([proxy]))
+    builder.add_edge(START, "tools")
+    builder.add_edge("tools", END)
+    call = {"name": "calculator", "args": {"expression": "2 + 2"}, "id": "1"}
+    result = builder.compile().invoke(
+        {"messages": [AIMessage(content="", tool_calls=[call])]}
+    )
+
+    assert result["messages"][-1].content == "4"
+
+
+def test_http_session_is_shared_until_reset():
+    registry = ClientRegistry()
+    session = registry.http_session()
+
+    assert registry.http_session() is session
+    registry.reset()
+    assert registry.http_session() is not session
+
+
+@pytest.mark.asyncio
+async def test_async_http_session_is_shared_per_loop():
+    registry = ClientRegistry()
+    session = registry.async_http_session()
+
+    assert registry.async_http_session() is session
+    await registry.aclose()
+    assert session.closed
+
+
+def test_reset_closes_async_sessions_of_idle_and_closed_loops():
+    registry = ClientRegistry()
+
+    async def open_session():
+        return registry.async_http_session()
+
+    idle_loop = asyncio.new_event_loop()
+    try:
+        idle = idle_loop.run_until_complete(open_session())
+        finished = asyncio.run(open_session())
+
+        registry.reset()
+
+        assert idle.closed
+        assert finished.closed
+    finally:
+        idle_loop.close()
+
+
+@pytest.mark.asyncio
+async def test_reset_closes_the_running_loops_session():
+    registry = ClientRegistry()
+    session = registry.async_http_session()
+
+    registry.reset()
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    assert session.closed
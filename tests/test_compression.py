@@ -0,0 +1,123 @@
+"""Tests for compressed checkpoint blobs in src/compression.py."""
+
+from typing import Annotated, TypedDict
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from src.compression import (
+    CompressedSerializer,
+    collect_samples,
+    dictionary_id,
+    train_dictionary,
+)
+
+
+def conversation(turn):
+    return [
+        HumanMessage(content=f"What is the capital of country {turn}?", id=f"h{turn}"),
+        AIMessage(content="Thanks for the information!", id=f"a{turn}"),
+    ]
+
+
+SAMPLES = [JsonPlusSerializer().dumps_typed(conversation(i))[1] for i in range(20)]
+
+
+def test_round_trip_with_dictionary():
+    serde = CompressedSerializer(
+        dictionary=train_dictionary(SAMPLES, codec="zlib"), codec="zlib", min_size=0
+    )
+    value = conversation(99)
+
+    type_, blob = serde.dumps_typed(value)
+
+    assert type_.endswith(f"+zlib:{serde.dictionary_id}")
+    assert serde.loads_typed((type_, blob)) == value
+
+
+def test_dictionary_shrinks_small_blobs():
+    plain = CompressedSerializer(codec="zlib", min_size=0)
+    trained = CompressedSerializer(
+        dictionary=train_dictionary(SAMPLES, codec="zlib"), codec="zlib", min_size=0
+    )
+    value = conversation(99)
+
+    assert len(trained.dumps_typed(value)[1]) < len(plain.dumps_typed(value)[1])
+
+
+def test_small_blobs_are_stored_uncompressed():
+    serde = CompressedSerializer(codec="zlib", min_size=1024)
+
+    assert serde.dumps_typed("short") == JsonPlusSerializer().dumps_typed("short")
+
+
+def test_uncompressed_and_old_dictionary_blobs_still_load():
+    old = train_dictionary(SAMPLES[:10], codec="zlib")
+    old_blob = CompressedSerializer(
+        dictionary=old, codec="zlib", min_size=0
+    ).dumps_typed(conversation(1))
+    plain_blob = JsonPlusSerializer().dumps_typed(conversation(2))
+
+    serde = CompressedSerializer(dictionary=train_dictionary(SAMPLES, codec="zlib"))
+    serde.add_dictionary(old)
+
+    assert serde.loads_typed(old_blob) == conversation(1)
+    assert serde.loads_typed(plain_blob) == conversation(2)
+
+
+def test_unknown_dictionary_is_an_error():
+    dictionary = train_dictionary(SAMPLES, codec="zlib")
+    blob = CompressedSerializer(
+        dictionary=dictionary, codec="zlib", min_size=0
+    ).dumps_typed(conversation(1))
+
+    with pytest.raises(ValueError, match=dictionary_id(dictionary)):
+        CompressedSerializer(codec="zlib").loads_typed(blob)
+
+
+def test_zstd_round_trip():
+    pytest.importorskip("zstandard")
+    serde = CompressedSerializer(
+        dictionary=train_dictionary(SAMPLES, codec="zstd"), codec="zstd", min_size=0
+    )
+    value = conversation(99)
+
+    assert serde.loads_typed(serde.dumps_typed(value)) == value
+
+
+def test_zstd_requires_zstandard(monkeypatch):
+    monkeypatch.setattr("src.compression.zstandard", None)
+
+    with pytest.raises(ImportError, match="zstandard"):
+        train_dictionary(SAMPLES, codec="zstd")
+    with pytest.raises(ImportError, match="zstandard"):
+        CompressedSerializer(codec="zstd")
+
+
+def test_unknown_codec_is_an_error():
+    with pytest.raises(ValueError, match="Unknown codec"):
+        train_dictionary(SAMPLES, codec="lz4")
+
+
+def test_collect_samples_from_checkpointer():
+    class State(TypedDict):
+        messages: Annotated[list[BaseMessage], add_messages]
+
+    builder = StateGraph(State)
+    builder.add_node("respond", lambda state: {"messages": conversation(1)})
+    builder.add_edge(START, "respond")
+    builder.add_edge("respond", END)
+    saver = MemorySaver()
+    builder.compile(checkpointer=saver).invoke(
+        {"messages": []}, {"configurable": {"thread_id": "1"}}
+    )
+
+    samples = list(collect_samples(saver))
+    serde = JsonPlusSerializer()
+
+    assert samples
+    assert serde.dumps_typed(conversation(1))[1] in samples
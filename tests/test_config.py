@@ -0,0 +1,71 @@
+"""Tests for the lazy settings loader in src/config.py."""
+
+import importlib
+
+import pytest
+
+import src.config as config
+
+
+@pytest.fixture(autouse=True)
+def isolated_settings(monkeypatch, tmp_path):
+    """Run each test in an empty directory with no API keys in the environment."""
+    monkeypatch.chdir(tmp_path)
+    for key in ("OPENAI_API_KEY", "TAVILY_API_KEY"):
+        monkeypatch.delenv(key, raising=False)
+    config.clear_settings_cache()
+    yield
+    config.clear_settings_cache()
+
+
+def test_import_does_not_require_keys():
+    """Importing the module must not read or validate any settings."""
+    importlib.reload(config)
+    assert config.get_settings.cache_info().currsize == 0
+
+
+def test_get_settings_is_cached(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("TAVILY_API_KEY", "tvly-test")
+
+    assert config.get_settings() is config.get_settings()
+    assert config.settings is config.get_settings()
+
+
+def test_reload_settings_picks_up_changes(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-old")
+    monkeypatch.setenv("TAVILY_API_KEY", "tvly-test")
+    first = config.get_settings()
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-new")
+    assert config.get_settings().openai_api_key == "sk-old"
+
+    reloaded = config.reload_settings()
+    assert reloaded is not first
+    assert reloaded.openai_api_key == "sk-new"
+
+
+def test_get_secret_does_not_need_other_fields(monkeypatch):
+    """A single secret resolves even when other required keys are missing."""
+    monkeypatch.setenv("tavily_api_key", "tvly-env")
+
+    assert config.get_secret("tavily_api_key") == "tvly-env"
+    assert config.get_settings.cache_info().currsize == 0
+
+
+def test_get_secret_reads_env_file(tmp_path):
+    (tmp_path / ".env").write_text("TAVILY_API_KEY=tvly-file\n")
+
+    assert config.get_secret("tavily_api_key") == "tvly-file"
+
+
+def test_get_secret_prefers_environment(monkeypatch, tmp_path):
+    (tmp_path / ".env").write_text("TAVILY_API_KEY=tvly-file\n")
+    monkeypatch.setenv("TAVILY_API_KEY", "tvly-env")
+
+    assert config.get_secret("tavily_api_key") == "tvly-env"
+
+
+def test_get_secret_missing_raises():
+    with pytest.raises(KeyError, match="OPENAI_API_KEY"):
+        config.get_secret("openai_api_key")
@@ -0,0 +1,129 @@
+"""Tests for the compiled-graph cache in src/graph_factory.py."""
+
+import gc
+from typing import TypedDict
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+
+from src.graph_factory import GraphFactory, cached_graph, freeze, graphs
+
+
+class State(TypedDict):
+    count: int
+
+
+def build_counter(step: int = 1) -> StateGraph:
+    builder = StateGraph(State)
+    builder.add_node("increment", lambda state: {"count": state["count"] + step})
+    builder.add_edge(START, "increment")
+    builder.add_edge("increment", END)
+    return builder
+
+
+def test_graph_is_compiled_once_per_configuration():
+    factory = GraphFactory()
+
+    first = factory.get(build_counter, step=1)
+    assert factory.get(build_counter, step=1) is first
+    assert factory.get(build_counter, step=2) is not first
+    assert (factory.hits, factory.misses) == (1, 2)
+    assert first.invoke({"count": 0}) == {"count": 1}
+
+
+def test_state_graph_builders_are_cached_by_identity():
+    factory = GraphFactory()
+    builder = build_counter()
+
+    assert factory.get(builder) is factory.get(builder)
+    assert len(factory) == 1
+
+
+def test_cached_graph_decorator():
+    calls = []
+
+    @cached_graph
+    def create(step: int = 1):
+        calls.append(step)
+        return build_counter(step).compile()
+
+    try:
+        assert create(step=3) is create(step=3)
+        assert calls == [3]
+    finally:
+        graphs.clear()
+
+
+class Tool:
+    """Unhashable, like pydantic tool models."""
+
+    __hash__ = None
+
+    def __init__(self, name, limit):
+        self.name = name
+        self.limit = limit
+
+
+def test_unhashable_configuration_is_frozen():
+    tool = Tool("calculator", 10)
+
+    assert freeze({"tools": [tool], "limits": {"a": 1}}) == freeze(
+        {"limits": {"a": 1}, "tools": [tool]}
+    )
+
+
+def test_tools_with_the_same_name_get_separate_graphs():
+    factory = GraphFactory()
+
+    def build(tools):
+        return build_counter(tools[0].limit)
+
+    small = factory.get(build, tools=[Tool("calculator", 1)])
+    large = factory.get(build, tools=[Tool("calculator", 5)])
+
+    assert small is not large
+    assert large.invoke({"count": 0}) == {"count": 5}
+
+
+def test_keys_are_not_reused_after_garbage_collection():
+    factory = GraphFactory()
+
+    def build(settings):
+        return build_counter(settings.limit)
+
+    for limit in range(1, 20):
+        graph = factory.get(build, settings=Tool("unnamed", limit))
+        gc.collect()
+        assert graph.invoke({"count": 0}) == {"count": limit}
+
+
+def test_compile_kwargs_are_part_of_the_key():
+    factory = GraphFactory()
+    builder = build_counter()
+    saver = MemorySaver()
+
+    plain = factory.get(builder)
+    saved = factory.get(builder, compile_kwargs={"checkpointer": saver})
+
+    assert saved is not plain
+    assert factory.get(builder, compile_kwargs={"checkpointer": saver}) is saved
+    assert saved.checkpointer is saver
+
+
+def test_warmup_reports_failures_without_raising():
+    factory = GraphFactory()
+    graph = factory.get(build_counter)
+
+    assert factory.warmup(graph, {"count": 0})
+    assert not factory.warmup(graph, {})
+
+
+@pytest.mark.asyncio
+async def test_warmup_inside_a_running_loop():
+    factory = GraphFactory()
+    graph = factory.get(build_counter)
+
+    assert factory.warmup(graph, {"count": 0}, use_async=True)
+    assert await factory.awarmup(graph, {"count": 0})
+    assert not await factory.awarmup(graph, {})
@@ -0,0 +1,133 @@
+"""Tests for the single-pass keyword matcher in src/keywords.py."""
+
+import json
+import os
+import random
+
+import pytest
+
+from src.keywords import KeywordMatcher, ReloadableMatcher, compile_keywords
+
+TABLE = {
+    "greeting": ["hello", "hi", "hey"],
+    "help": ["help", "support"],
+    "calculator": ["calculate", "+", "-"],
+}
+
+
+def naive_counts(table, text):
+    text = text.lower()
+    counts = {}
+    for label, keywords in table.items():
+        hits = sum(
+            text.startswith(keyword, i)
+            for keyword in keywords
+            for i in range(len(text))
+        )
+        if hits:
+            counts[label] = hits
+    return counts
+
+
+def test_classify():
+    matcher = KeywordMatcher(TABLE)
+
+    assert matcher.classify("Hello") == "greeting"
+    assert matcher.classify("I need HELP and support") == "help"
+    assert matcher.classify("Foo bar", default="unknown") == "unknown"
+    assert matcher.matches("calculate 2 + 2") == {"calculator"}
+
+
+def test_ties_go_to_the_first_match():
+    matcher = KeywordMatcher(TABLE)
+
+    assert matcher.classify("hello, help") == "greeting"
+    assert matcher.classify("help, hello") == "help"
+
+
+@pytest.mark.parametrize(
+    ("text", "label"),
+    [
+        ("Can you help me with this?", "help"),
+        ("I need help, they said", "help"),
+        ("Which option?", None),
+        ("What is the weather in Saint-Denis?", None),
+        ("Hi there", "greeting"),
+        ("hey!", "greeting"),
+        ("calculate 5-3", "calculator"),
+        ("2 + 2", "calculator"),
+    ],
+)
+def test_keywords_match_whole_words(text, label):
+    assert KeywordMatcher(TABLE).classify(text) == label
+
+
+def test_overlapping_keywords_match_like_substring_scans():
+    rng = random.Random(0)
+    for _ in range(500):
+        table = {
+            f"label{i}": [
+                "".join(rng.choice("abc") for _ in range(rng.randint(1, 4)))
+                for _ in range(3)
+            ]
+            for i in range(3)
+        }
+        text = "".join(rng.choice("abcAB ") for _ in range(30))
+
+        matcher = KeywordMatcher(table, whole_words=False)
+        assert matcher.counts(text) == naive_counts(table, text)
+
+
+def test_empty_keyword_is_rejected():
+    with pytest.raises(ValueError):
+        KeywordMatcher({"greeting": [""]})
+
+
+def test_compiled_matchers_are_shared():
+    assert compile_keywords(TABLE) is compile_keywords(dict(TABLE))
+    assert compile_keywords(TABLE) is not compile_keywords({"help": ["help"]})
+    assert compile_keywords(TABLE) is not compile_keywords(TABLE, whole_words=False)
+
+
+def test_reloadable_matcher_picks_up_changes(tmp_path):
+    path = tmp_path / "routes.json"
+    path.write_text(json.dumps({"greeting": ["hello"]}))
+    matcher = ReloadableMatcher(path, check_interval=0)
+
+    assert matcher.classify("howdy") is None
+
+    path.write_text(json.dumps({"greeting": ["hello", "howdy"]}))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert matcher.classify("howdy") == "greeting"
+
+
+def test_reloadable_matcher_keeps_last_good_table(tmp_path):
+    path = tmp_path / "routes.json"
+    path.write_text(json.dumps({"greeting": ["hello"]}))
+    matcher = ReloadableMatcher(path, check_interval=0)
+
+    path.write_text("{not json")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert matcher.classify("hello") == "greeting"
+
+
+@pytest.mark.parametrize(
+    "table", [{"greeting": 5}, {"greeting": "hello"}, ["hello"], {"help": [1]}]
+)
+def test_reloadable_matcher_rejects_malformed_tables(tmp_path, table):
+    path = tmp_path / "routes.json"
+    path.write_text(json.dumps({"greeting": ["hello"]}))
+    matcher = ReloadableMatcher(path, check_interval=0)
+
+    path.write_text(json.dumps(table))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert matcher.classify("hello") == "greeting"
+    assert matcher.classify("h") is None
+    with pytest.raises(ValueError):
+        matcher.reload()
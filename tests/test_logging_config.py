@@ -0,0 +1,112 @@
+"""Tests for the queue-based logging pipeline in src/logging_config.py."""
+
+import logging
+import queue
+import threading
+
+import pytest
+
+from src.logging_config import (
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    StructuredMessage,
+    configure_logging,
+    stop_logging,
+)
+
+
+class ListHandler(logging.Handler):
+    """Collects formatted records and the thread that wrote them."""
+
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+        self.threads.add(threading.get_ident())
+
+
+class CountingValue:
+    """Value that counts how often it is rendered."""
+
+    def __init__(self):
+        self.renders = 0
+
+    def __repr__(self):
+        self.renders += 1
+        return "value"
+
+
+@pytest.fixture
+def collected():
+    handler = ListHandler()
+    configure_logging(logging.DEBUG, handler=handler, sample_rates={})
+    yield handler
+    # Restore the session-wide configuration from conftest
+    configure_logging(logging.DEBUG)
+
+
+def record(name, level=logging.DEBUG):
+    return logging.LogRecord(name, level, __file__, 0, "message", None, None)
+
+
+def test_records_are_written_by_the_listener_thread(collected):
+    logging.getLogger("tests.pipeline").info("hello %s", "world")
+    stop_logging()
+
+    assert collected.lines == ["hello world"]
+    assert threading.get_ident() not in collected.threads
+
+
+def test_structured_message_is_rendered_by_the_listener(collected):
+    logging.getLogger("tests.pipeline").info(StructuredMessage("event", v=1, s="x"))
+    stop_logging()
+
+    assert collected.lines == ["event v=1 s='x'"]
+
+
+def test_queueing_does_not_render_the_message():
+    value = CountingValue()
+    handler = NonBlockingQueueHandler(queue.Queue())
+    message = record("tests.pipeline")
+    message.msg = StructuredMessage("event", v=value)
+
+    handler.emit(message)
+
+    assert value.renders == 0
+    assert str(handler.queue.get_nowait().msg) == "event v=value"
+
+
+def test_sampling_rate_applies_to_child_loggers():
+    sampler = SamplingFilter({"noisy": 0.0, "noisy.keep": 1.0})
+
+    assert not sampler.filter(record("noisy"))
+    assert not sampler.filter(record("noisy.child"))
+    assert sampler.filter(record("noisy.keep.child"))
+    assert sampler.filter(record("quiet"))
+
+
+def test_sampling_never_drops_records_above_max_level():
+    sampler = SamplingFilter({"noisy": 0.0})
+
+    assert sampler.filter(record("noisy", logging.INFO))
+    assert sampler.filter(record("noisy", logging.ERROR))
+
+
+def test_sampling_keeps_roughly_the_configured_fraction():
+    sampler = SamplingFilter({"noisy": 0.1}, seed=1)
+
+    kept = sum(sampler.filter(record("noisy")) for _ in range(10_000))
+    assert 800 < kept < 1200
+
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=2))
+
+    for _ in range(5):
+        handler.emit(record("tests.pipeline"))
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
@@ -0,0 +1,169 @@
+"""Tests for the compact message records in src/message_records.py."""
+
+import logging
+from typing import Annotated, TypedDict
+
+import pytest
+from langchain_core.messages import (
+    AIMessage,
+    ChatMessage,
+    HumanMessage,
+    RemoveMessage,
+    ToolMessage,
+)
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+
+from src.message_records import (
+    MessageRecord,
+    add_records,
+    to_messages,
+    to_records,
+)
+from src.reducers import REMOVE_ALL_MESSAGES
+from src.serde import checkpoint_serializer
+from src.trimming import TOKEN_COUNT_KEY, make_trim_node
+
+
+def test_round_trip_preserves_fields():
+    message = HumanMessage(content="Hello!", id="1", metadata={"timestamp": 1.0})
+
+    restored = MessageRecord.from_message(message).to_message()
+
+    assert isinstance(restored, HumanMessage)
+    assert restored.content == "Hello!"
+    assert restored.id == "1"
+    assert restored.metadata == {"timestamp": 1.0}
+
+
+def test_tool_record_keeps_tool_call_id():
+    record = MessageRecord.from_message(
+        ToolMessage(content="42", tool_call_id="call-1", id="t")
+    )
+
+    assert record.role == "tool"
+    assert record.to_message().tool_call_id == "call-1"
+
+
+def test_ai_messages_round_trip_with_every_field():
+    message = AIMessage(
+        content="",
+        id="a",
+        name="assistant",
+        tool_calls=[{"name": "search", "args": {"q": "x"}, "id": "call-1"}],
+        additional_kwargs={"refusal": None},
+        response_metadata={"model_name": "gpt", TOKEN_COUNT_KEY: 12},
+        usage_metadata={"input_tokens": 3, "output_tokens": 4, "total_tokens": 7},
+    )
+
+    record = MessageRecord.from_message(message)
+
+    assert record.to_message() == message
+    assert record.extra["response_metadata"][TOKEN_COUNT_KEY] == 12
+
+
+def test_plain_messages_have_no_extra_fields():
+    assert MessageRecord.from_message(HumanMessage(content="hi", id="h")).extra is None
+
+
+def test_unsupported_message_types_are_rejected():
+    with pytest.raises(ValueError, match="Unsupported"):
+        MessageRecord.from_message(ChatMessage(content="x", role="narrator"))
+
+
+def test_record_has_no_instance_dict():
+    record = MessageRecord("human", "hi")
+
+    assert not hasattr(record, "__dict__")
+
+
+def test_boundary_helpers_pass_through_converted_values():
+    ai = AIMessage(content="Hi", id="a")
+    record = MessageRecord("human", "Hello!", "h")
+
+    assert to_messages([record, ai])[1] is ai
+    assert to_records([record, ai]) == [record, MessageRecord("ai", "Hi", "a")]
+
+
+def test_add_records_appends_and_replaces_by_id():
+    left = [MessageRecord("human", "a", "1"), MessageRecord("ai", "b", "2")]
+
+    merged = add_records(
+        left,
+        [MessageRecord("ai", "B", "2"), AIMessage(content="c", id="3")],
+    )
+
+    assert [record.content for record in merged] == ["a", "B", "c"]
+    assert all(isinstance(record, MessageRecord) for record in merged)
+
+
+def test_add_records_applies_removals():
+    left = [MessageRecord("human", c, c) for c in "abc"]
+
+    assert add_records(left, [RemoveMessage(id="a"), RemoveMessage(id="c")]) == [
+        left[1]
+    ]
+    assert add_records(left, [RemoveMessage(id=REMOVE_ALL_MESSAGES), left[2]]) == [
+        left[2]
+    ]
+    with pytest.raises(ValueError, match="doesn't exist"):
+        add_records(left, RemoveMessage(id="x"))
+
+
+def test_trim_node_works_on_record_channels():
+    left = [MessageRecord("human", c, c) for c in "abcd"]
+
+    update = make_trim_node(2)({"messages": left})
+
+    assert add_records(left, update["messages"]) == left[2:]
+
+
+def test_add_records_assigns_missing_ids():
+    merged = add_records(
+        [MessageRecord("human", "a")],
+        [MessageRecord("ai", "b"), AIMessage(content="c")],
+    )
+
+    assert all(record.id for record in merged)
+    assert len({record.id for record in merged}) == 3
+
+    edited = add_records(merged, merged[1]._replace(content="B"))
+    assert [record.content for record in edited] == ["a", "B", "c"]
+
+
+class State(TypedDict):
+    messages: Annotated[list[MessageRecord], add_records]
+
+
+def echo_graph(checkpointer=None):
+    def respond(state: State) -> dict:
+        last = to_messages(state["messages"])[-1]
+        return {"messages": AIMessage(content=f"echo: {last.content}")}
+
+    builder = StateGraph(State)
+    builder.add_node("respond", respond)
+    builder.add_edge(START, "respond")
+    builder.add_edge("respond", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+def test_records_in_graph_state():
+    result = echo_graph().invoke({"messages": [MessageRecord("human", "hi", "h")]})
+    reply = result["messages"][1]
+
+    assert result["messages"][0] == MessageRecord("human", "hi", "h")
+    assert (reply.role, reply.content) == ("ai", "echo: hi")
+    assert reply.id is not None
+
+
+def test_records_round_trip_through_checkpoints_without_warnings(caplog):
+    graph = echo_graph(MemorySaver(serde=checkpoint_serializer()))
+    config = {"configurable": {"thread_id": "t"}}
+
+    with caplog.at_level(logging.WARNING):
+        graph.invoke({"messages": [MessageRecord("human", "hi", "h")]}, config)
+        restored = graph.get_state(config).values["messages"]
+
+    assert all(isinstance(record, MessageRecord) for record in restored)
+    assert [record.content for record in restored] == ["hi", "echo: hi"]
+    assert "unregistered type" not in caplog.text
@@ -0,0 +1,290 @@
+"""Tests for the message reducers in src/reducers.py."""
+
+import logging
+import random
+from typing import Annotated, TypedDict
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, RemoveMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from src.reducers import MessageLog, MessageWindow, indexed_messages, windowed_messages
+from src.serde import MessagePackSerializer, checkpoint_serializer
+
+
+def human(text):
+    return HumanMessage(content=text, id=text)
+
+
+def contents(messages):
+    return [message.content for message in messages]
+
+
+def test_window_evicts_oldest_messages():
+    reducer = windowed_messages(3)
+    window = reducer([], [human("a"), human("b")])
+    window = reducer(window, [human("c"), human("d")])
+
+    assert isinstance(window, MessageWindow)
+    assert contents(window) == ["b", "c", "d"]
+    assert len(window) == 3
+
+
+def test_replace_by_id_keeps_position():
+    reducer = windowed_messages(3)
+    window = reducer([], [human("a"), human("b"), human("c"), human("d")])
+
+    window = reducer(window, HumanMessage(content="C", id="c"))
+
+    assert contents(window) == ["b", "C", "d"]
+
+
+def test_remove_by_id_and_evicted_ids():
+    reducer = windowed_messages(3)
+    window = reducer([], [human("a"), human("b"), human("c"), human("d")])
+
+    window = reducer(window, [RemoveMessage(id="c"), RemoveMessage(id="a")])
+    window = reducer(window, [human("e"), human("f")])
+
+    assert contents(window) == ["d", "e", "f"]
+
+
+def test_missing_ids_are_assigned():
+    window = windowed_messages(2)([], [("user", "hi"), AIMessage(content="hello")])
+
+    assert all(message.id for message in window)
+
+
+def test_slicing_returns_a_list():
+    window = windowed_messages(3)([], [human("a"), human("b"), human("c")])
+
+    assert contents(window[-2:]) == ["b", "c"]
+    assert window[-1].content == "c"
+
+
+def test_merge_leaves_the_previous_window_unchanged():
+    reducer = windowed_messages(2)
+    first = reducer([], [human("a"), human("b")])
+
+    second = reducer(first, [human("c"), RemoveMessage(id="b")])
+
+    assert second is not first
+    assert contents(first) == ["a", "b"]
+    assert contents(second) == ["c"]
+    assert contents(reducer(first, HumanMessage(content="B", id="b"))) == ["a", "B"]
+
+
+def test_invalid_window_size():
+    with pytest.raises(ValueError):
+        windowed_messages(0)
+
+
+class State(TypedDict):
+    messages: Annotated[list[BaseMessage], windowed_messages(3)]
+
+
+def test_graph_channel_stays_bounded():
+    def respond(state: State) -> dict:
+        return {"messages": [AIMessage(content=f"reply {len(state['messages'])}")]}
+
+    builder = StateGraph(State)
+    builder.add_node("respond", respond)
+    builder.add_edge(START, "respond")
+    builder.add_edge("respond", END)
+    graph = builder.compile()
+
+    state = {"messages": []}
+    for turn in range(10):
+        state = graph.invoke(
+            {"messages": [*state["messages"], HumanMessage(content=f"turn {turn}")]}
+        )
+
+    assert len(state["messages"]) == 3
+    assert state["messages"][-2].content == "turn 9"
+
+
+def two_turn_graph(checkpointer=None):
+    def respond(state: State) -> dict:
+        return {"messages": [AIMessage(content=f"reply {len(state['messages'])}")]}
+
+    builder = StateGraph(State)
+    builder.add_node("first", respond)
+    builder.add_node("second", respond)
+    builder.add_edge(START, "first")
+    builder.add_edge("first", "second")
+    builder.add_edge("second", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+def test_value_snapshots_are_independent():
+    snapshots = list(
+        two_turn_graph().stream({"messages": [human("a")]}, stream_mode="values")
+    )
+
+    assert [contents(s["messages"]) for s in snapshots] == [
+        ["a"],
+        ["a", "reply 1"],
+        ["a", "reply 1", "reply 2"],
+    ]
+
+
+def test_window_round_trips_through_checkpoints_without_warnings(caplog):
+    graph = two_turn_graph(MemorySaver(serde=checkpoint_serializer()))
+    config = {"configurable": {"thread_id": "t"}}
+
+    with caplog.at_level(logging.WARNING):
+        graph.invoke({"messages": [human("a"), human("b")]}, config)
+        graph.invoke({"messages": [human("c")]}, config)
+        restored = graph.get_state(config).values["messages"]
+
+    assert isinstance(restored, MessageWindow)
+    assert contents(restored) == ["c", "reply 3", "reply 3"]
+    assert "unregistered type" not in caplog.text
+
+
+def random_updates(seed, steps=300):
+    """Random batches of appends, replacements and removals."""
+    rng = random.Random(seed)
+    live, next_id = [], 0
+    for _ in range(steps):
+        batch = []
+        for _ in range(rng.randint(1, 4)):
+            action = rng.random()
+            if live and action < 0.3:
+                target = rng.choice(live)
+                batch.append(HumanMessage(content=f"edit {next_id}", id=target))
+            elif live and action < 0.45:
+                target = rng.choice(live)
+                live.remove(target)
+                batch.append(RemoveMessage(id=target))
+            else:
+                live.append(str(next_id))
+                batch.append(AIMessage(content=f"msg {next_id}", id=str(next_id)))
+            next_id += 1
+        yield batch
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_indexed_messages_matches_add_messages(seed):
+    expected, actual = [], []
+    for batch in random_updates(seed):
+        expected = add_messages(expected, batch)
+        actual = indexed_messages(actual, batch)
+
+        assert isinstance(actual, MessageLog)
+        assert [(m.id, m.content) for m in actual] == [
+            (m.id, m.content) for m in expected
+        ]
+
+
+def test_indexed_messages_rejects_unknown_removal_without_changes():
+    log = indexed_messages([], [human("a"), human("b")])
+    update = [HumanMessage(content="A", id="a"), human("c"), RemoveMessage(id="x")]
+
+    with pytest.raises(ValueError, match="doesn't exist"):
+        indexed_messages(log, update)
+    with pytest.raises(ValueError, match="doesn't exist"):
+        add_messages(list(log), update)
+
+    assert contents(log) == ["a", "b"]
+    assert contents(indexed_messages(log, human("c"))) == ["a", "b", "c"]
+
+
+def test_indexed_messages_removal_order_matches_add_messages():
+    log = indexed_messages([], [human("a")])
+
+    # Removing a message appended earlier in the same update is allowed ...
+    merged = indexed_messages(log, [human("b"), RemoveMessage(id="b")])
+    assert contents(merged) == ["a"]
+    # ... but not one appended later
+    with pytest.raises(ValueError, match="doesn't exist"):
+        indexed_messages(log, [RemoveMessage(id="b"), human("b")])
+
+
+def test_indexed_messages_leaves_the_previous_log_unchanged():
+    first = indexed_messages([], [human("a"), human("b")])
+
+    second = indexed_messages(
+        first, [HumanMessage(content="A", id="a"), RemoveMessage(id="b"), human("c")]
+    )
+
+    assert contents(first) == ["a", "b"]
+    assert contents(second) == ["A", "c"]
+
+
+def test_log_versions_share_storage_and_keep_their_messages():
+    versions = [indexed_messages([], [human("a"), human("b")])]
+    for update in (
+        HumanMessage(content="A", id="a"),
+        human("c"),
+        [HumanMessage(content="AA", id="a"), HumanMessage(content="C", id="c")],
+    ):
+        versions.append(indexed_messages(versions[-1], update))
+
+    assert len({id(log._store) for log in versions}) == 1
+    assert [contents(log) for log in versions] == [
+        ["a", "b"],
+        ["A", "b"],
+        ["A", "b", "c"],
+        ["AA", "b", "C"],
+    ]
+    assert versions[1][0].content == "A" and versions[1][-1].content == "b"
+    assert contents(versions[2][1:]) == ["b", "c"]
+
+
+def test_merging_an_older_version_branches_off():
+    first = indexed_messages([], [human("a")])
+    second = indexed_messages(first, human("b"))
+
+    branch = indexed_messages(first, HumanMessage(content="A", id="a"))
+
+    assert contents(branch) == ["A"]
+    assert contents(second) == ["a", "b"]
+    assert contents(first) == ["a"]
+
+
+def test_many_replacements_keep_storage_bounded():
+    log = indexed_messages([], [human(str(i)) for i in range(10)])
+    first = log
+    for i in range(100):
+        log = indexed_messages(log, HumanMessage(content=f"edit {i}", id=str(i % 10)))
+
+    assert log._store.replaced <= len(log)
+    assert contents(first) == [str(i) for i in range(10)]
+    assert log == [HumanMessage(content=f"edit {90 + i}", id=str(i)) for i in range(10)]
+
+
+@pytest.mark.parametrize("serde", [checkpoint_serializer(), MessagePackSerializer()])
+def test_log_round_trips_through_checkpoints(serde, caplog):
+    class LogState(TypedDict):
+        messages: Annotated[list[BaseMessage], indexed_messages]
+
+    def respond(state: LogState) -> dict:
+        return {"messages": [AIMessage(content=f"reply {len(state['messages'])}")]}
+
+    builder = StateGraph(LogState)
+    builder.add_node("respond", respond)
+    builder.add_edge(START, "respond")
+    builder.add_edge("respond", END)
+    graph = builder.compile(checkpointer=MemorySaver(serde=serde))
+    config = {"configurable": {"thread_id": "t"}}
+
+    with caplog.at_level(logging.WARNING):
+        graph.invoke({"messages": [human("a")]}, config)
+        state = graph.invoke({"messages": [human("b")]}, config)
+
+    assert contents(state["messages"]) == ["a", "reply 1", "b", "reply 3"]
+    assert contents(graph.get_state(config).values["messages"]) == contents(
+        state["messages"]
+    )
+    assert "unregistered type" not in caplog.text
+
+
+def test_indexed_messages_reindexes_plain_lists():
+    """Values restored from a checkpoint are plain lists."""
+    log = indexed_messages([human("a"), human("b")], HumanMessage(content="B", id="b"))
+
+    assert isinstance(log, MessageLog)
+    assert contents(log) == ["a", "B"]
@@ -0,0 +1,381 @@
+"""Tests for the retry engine in src/retry.py."""
+
+import asyncio
+import random
+
+import pytest
+import requests
+
+from src.retry import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    Retrier,
+    RetryBudget,
+    RetryPolicy,
+    ToolResultError,
+    error_from_result,
+    is_retryable,
+)
+
+# No sleeping between attempts
+FAST = RetryPolicy(max_attempts=3, base_delay=0.0, jitter=False)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def http_error(status: int, **headers) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers)
+    return requests.HTTPError(f"{status} Error", response=response)
+
+
+def flaky(failures, result="ok"):
+    """Raise each error in failures once, then return result."""
+    calls = []
+
+    def call():
+        calls.append(1)
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return result
+
+    return call, calls
+
+
+def test_error_classification():
+    assert is_retryable(TimeoutError())
+    assert is_retryable(requests.ConnectionError())
+    assert is_retryable(http_error(503))
+    assert is_retryable(http_error(429))
+    assert not is_retryable(http_error(401))
+    assert not is_retryable(ValueError("bad args"))
+    assert not is_retryable(CircuitOpenError("tavily", 1.0))
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        requests.exceptions.InvalidURL("bad url"),
+        requests.exceptions.MissingSchema("no scheme"),
+        requests.exceptions.InvalidHeader("bad header"),
+        FileNotFoundError("fixtures.json"),
+        PermissionError("denied"),
+    ],
+)
+def test_non_network_os_errors_are_fatal(error):
+    assert not is_retryable(error)
+
+
+def test_network_errors_of_every_client_are_retryable():
+    aiohttp = pytest.importorskip("aiohttp")
+
+    assert is_retryable(ConnectionResetError())
+    assert is_retryable(requests.Timeout())
+    assert is_retryable(aiohttp.ServerTimeoutError())
+    assert is_retryable(aiohttp.ServerDisconnectedError())
+
+
+# repr() strings TavilySearchResults returned against the stand-in server
+# (src.tavily_server) and unreachable hosts
+REQUESTS_503 = (
+    "HTTPError('503 Server Error: Service Unavailable for url: "
+    "http://127.0.0.1:37011/search')"
+)
+REQUESTS_401 = (
+    "HTTPError('401 Client Error: Unauthorized for url: http://127.0.0.1:40681/search')"
+)
+AIOHTTP_503 = (
+    "ClientResponseError(RequestInfo(url=URL('http://127.0.0.1:37011/search'), "
+    "method='POST', headers=<CIMultiDictProxy('Host': '127.0.0.1:37011', "
+    "'Content-Length': '202', 'Content-Type': 'application/json')>, "
+    "real_url=URL('http://127.0.0.1:37011/search')), (), status=503, "
+    "message='Service Unavailable', headers=<CIMultiDictProxy('Content-Length': "
+    "'41', 'Server': 'Python/3.11 aiohttp/3.14.5')>)"
+)
+REQUESTS_REFUSED = (
+    "ConnectionError(MaxRetryError('HTTPConnectionPool(host=\\'127.0.0.1\\', "
+    "port=1): Max retries exceeded with url: /search (Caused by "
+    "NewConnectionError(\"HTTPConnection(host=\\'127.0.0.1\\', port=1): Failed "
+    "to establish a new connection: [Errno 111] Connection refused\"))'))"
+)
+AIOHTTP_REFUSED = (
+    "ClientConnectorError(ConnectionKey(host='127.0.0.1', port=1, is_ssl=False, "
+    "ssl=True, proxy=None, proxy_auth=None, proxy_headers_hash=None, "
+    'server_hostname=None), ConnectionRefusedError(111, "Connect call failed '
+    "('127.0.0.1', 1)\"))"
+)
+REQUESTS_DNS = (
+    "ConnectionError(MaxRetryError('HTTPSConnectionPool(host=\\'nonexistent."
+    "invalid\\', port=443): Max retries exceeded with url: /search (Caused by "
+    "NameResolutionError(...))'))"
+)
+AIOHTTP_DNS = (
+    "ClientConnectorDNSError(ConnectionKey(host='nonexistent.invalid', port=443, "
+    "is_ssl=True, ssl=True, proxy=None, proxy_auth=None, proxy_headers_hash=None, "
+    "server_hostname=None), gaierror(-2, 'Name or service not known'))"
+)
+
+
+def test_normal_results_are_not_errors():
+    assert error_from_result([{"url": "https://example.com"}]) is None
+
+
+@pytest.mark.parametrize(
+    ("result", "status"),
+    [(REQUESTS_503, 503), (AIOHTTP_503, 503), (REQUESTS_401, 401)],
+)
+def test_error_strings_carry_the_http_status(result, status):
+    assert error_from_result(result).status == status
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        REQUESTS_503,
+        AIOHTTP_503,
+        REQUESTS_REFUSED,
+        AIOHTTP_REFUSED,
+        REQUESTS_DNS,
+        AIOHTTP_DNS,
+        "ReadTimeout('timed out')",
+    ],
+)
+def test_transient_error_strings_are_retryable(result):
+    assert is_retryable(error_from_result(result))
+
+
+@pytest.mark.parametrize(
+    "result", [REQUESTS_401, "ValidationError('query')", "KeyError('results')"]
+)
+def test_fatal_error_strings_are_not_retryable(result):
+    assert not is_retryable(error_from_result(result))
+
+
+def test_connection_errors_ignore_numbers_in_host_and_port():
+    for result in (REQUESTS_REFUSED, AIOHTTP_REFUSED, REQUESTS_DNS, AIOHTTP_DNS):
+        error = error_from_result(result)
+        assert error.status is None
+        assert error.transient
+
+
+def test_backoff_grows_exponentially_up_to_the_cap():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=False)
+
+    assert [policy.delay(retry) for retry in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+
+def test_full_jitter_stays_within_the_backoff():
+    policy = RetryPolicy(base_delay=1.0, max_delay=8.0)
+    rng = random.Random(0)
+    delays = [policy.delay(3, rng=rng) for _ in range(1000)]
+
+    assert 0 <= min(delays) and max(delays) <= 4.0
+    assert len(set(delays)) > 900
+
+
+def test_retry_after_header_is_honoured_up_to_max_delay():
+    policy = RetryPolicy(base_delay=0.1, max_delay=5.0, jitter=False)
+
+    assert policy.delay(1, http_error(429, **{"Retry-After": "3"})) == 3.0
+    assert policy.delay(1, http_error(429, **{"Retry-After": "60"})) == 5.0
+
+
+def test_transient_failures_are_retried():
+    retrier = Retrier(FAST)
+    call, calls = flaky([TimeoutError(), http_error(503)])
+
+    assert retrier.call("tavily", call) == "ok"
+    assert len(calls) == 3
+    assert retrier.stats["tavily"]["retries"] == 2
+
+
+def test_fatal_errors_are_not_retried():
+    retrier = Retrier(FAST)
+    call, calls = flaky([http_error(400)])
+
+    with pytest.raises(requests.HTTPError):
+        retrier.call("tavily", call)
+    assert len(calls) == 1
+
+
+def test_gives_up_after_max_attempts():
+    retrier = Retrier(FAST)
+    call, calls = flaky([TimeoutError()] * 5)
+
+    with pytest.raises(TimeoutError):
+        retrier.call("tavily", call)
+    assert len(calls) == 3
+    assert retrier.stats["tavily"]["exhausted"] == 1
+
+
+def test_error_results_are_retried_and_raised():
+    retrier = Retrier(FAST, result_error=error_from_result)
+    results = iter(["HTTPError('503 Service Unavailable')", [{"content": "Paris"}]])
+
+    assert retrier.call("tavily", lambda: next(results)) == [{"content": "Paris"}]
+
+    with pytest.raises(ToolResultError, match="401"):
+        retrier.call("tavily", lambda: "HTTPError('401 Unauthorized')")
+
+
+def test_retry_budget_limits_retries_to_a_fraction_of_calls():
+    budget = RetryBudget(ratio=0.5, reserve=1)
+
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+def test_spent_budget_stops_retry_storms():
+    retrier = Retrier(
+        FAST,
+        budget=lambda: RetryBudget(ratio=0.0, reserve=2),
+        breaker=lambda: CircuitBreaker(failure_threshold=100),
+    )
+    total_calls = []
+    for _ in range(5):
+        call, calls = flaky([TimeoutError()] * 5)
+        with pytest.raises(TimeoutError):
+            retrier.call("tavily", call)
+        total_calls += calls
+
+    # 5 first attempts plus the 2 banked retries
+    assert len(total_calls) == 7
+    assert retrier.stats["tavily"]["budget_exhausted"] == 4
+
+
+def test_circuit_opens_then_half_opens_after_the_timeout():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == 10
+
+    clock.now += 10
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()  # one trial at a time
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    clock.now += 10
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_stale_trial_expires_after_the_reset_timeout():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow()
+
+    clock.now += 5
+    assert not breaker.allow()
+    clock.now += 5
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_call_releases_the_circuit():
+    clock = FakeClock()
+    retrier = Retrier(
+        RetryPolicy(max_attempts=1),
+        breaker=lambda: CircuitBreaker(failure_threshold=1, clock=clock),
+    )
+    with pytest.raises(TimeoutError):
+        await retrier.acall("tavily", _raise, TimeoutError())
+    clock.now += 30
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(retrier.acall("tavily", hang), 0.01)
+
+    assert retrier.breaker("tavily").state == HALF_OPEN
+    assert await retrier.acall("tavily", _ok) == "ok"
+    assert retrier.breaker("tavily").state == CLOSED
+
+
+async def _raise(error):
+    raise error
+
+
+async def _ok():
+    return "ok"
+
+
+def test_open_circuit_fails_fast_per_tool():
+    clock = FakeClock()
+    retrier = Retrier(
+        RetryPolicy(max_attempts=1),
+        breaker=lambda: CircuitBreaker(failure_threshold=2, clock=clock),
+    )
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            retrier.call("tavily", flaky([TimeoutError()])[0])
+
+    call, calls = flaky([])
+    with pytest.raises(CircuitOpenError):
+        retrier.call("tavily", call)
+    assert calls == []
+    assert retrier.stats["tavily"]["short_circuited"] == 1
+    assert retrier.call("calculator", call) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_async_calls_are_retried():
+    retrier = Retrier(FAST)
+    attempts = []
+
+    async def search(query):
+        attempts.append(query)
+        if len(attempts) < 2:
+            raise ConnectionError("reset by peer")
+        return [{"content": query}]
+
+    assert await retrier.acall("tavily", search, "capital of France") == [
+        {"content": "capital of France"}
+    ]
+    assert len(attempts) == 2
+
+
+@pytest.mark.enable_socket
+@pytest.mark.asyncio
+async def test_async_server_errors_from_the_real_tool_are_retried():
+    from langchain_community.tools import TavilySearchResults
+
+    from src.clients import registry
+    from src.tavily import PooledTavilySearchAPIWrapper
+    from src.tavily_server import ServerProfile, StandInServer
+
+    retrier = Retrier(FAST, result_error=error_from_result)
+    with StandInServer(ServerProfile(error_rate=1.0, error_status=503)) as server:
+        wrapper = PooledTavilySearchAPIWrapper(
+            tavily_api_key="tvly-test", api_url=server.url
+        )
+        tool = TavilySearchResults(api_wrapper=wrapper)
+        with pytest.raises(ToolResultError) as raised:
+            await retrier.acall("tavily", tool.ainvoke, {"query": "q"})
+        await registry.aclose()
+
+    assert raised.value.status == 503
+    assert server.stats["requests"] == 3
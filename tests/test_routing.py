@@ -0,0 +1,115 @@
+"""Tests for declarative routing tables in src/routing.py."""
+
+from typing import Annotated, TypedDict
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from src.routing import RouteSpec, compile_routes, validate_routes
+
+SPEC = RouteSpec(
+    key="classification",
+    routes={"greeting": "greet", "help": "assist"},
+    default="fallback",
+    thresholds={"greeting": 0.8},
+)
+
+
+def test_dispatch_and_hit_counters():
+    router = compile_routes(SPEC)
+
+    assert router({"classification": "greeting", "confidence": 0.9}) == "greet"
+    assert router({"classification": "greeting", "confidence": 0.5}) == "fallback"
+    assert router({"classification": "help"}) == "assist"
+    assert router({"classification": "other"}) == "fallback"
+    assert router.hits == {
+        "greeting": 1,
+        "greeting:below_threshold": 1,
+        "help": 1,
+        "default": 1,
+    }
+
+    router.reset_hits()
+    assert not router.hits
+
+
+def test_missing_or_none_confidence_is_below_threshold():
+    router = compile_routes(SPEC)
+
+    assert router({"classification": "greeting"}) == "fallback"
+    assert router({"classification": "greeting", "confidence": None}) == "fallback"
+
+
+def test_key_function_and_end():
+    spec = RouteSpec(
+        key=lambda state: bool(state["errors"]), routes={True: "errors"}, default=END
+    )
+    router = compile_routes(spec)
+
+    assert router({"errors": {"call-1": "boom"}}) == "errors"
+    assert router({"errors": {}}) == END
+
+
+@pytest.mark.parametrize(
+    ("spec", "message"),
+    [
+        (RouteSpec(key="c", routes={}, default="x"), "must not be empty"),
+        (
+            RouteSpec(key="c", routes={"a": "x"}, default="x", thresholds={"b": 0.5}),
+            "without a route",
+        ),
+        (
+            RouteSpec(key="c", routes={"a": "x"}, default="x", thresholds={"a": 2}),
+            "between 0 and 1",
+        ),
+        (RouteSpec(key="c", routes={"a": "typo"}, default="x"), "typo"),
+    ],
+)
+def test_validation(spec, message):
+    with pytest.raises(ValueError, match=message):
+        validate_routes(spec, nodes={"x"})
+
+
+def test_router_in_graph():
+    class State(TypedDict):
+        messages: Annotated[list[BaseMessage], add_messages]
+        classification: str
+        confidence: float
+
+    def classify(state: State) -> dict:
+        text = state["messages"][-1].content.lower()
+        if "hello" in text:
+            return {"classification": "greeting", "confidence": 0.9}
+        return {"classification": "unknown", "confidence": 0.0}
+
+    def reply(text):
+        return lambda state: {"messages": [AIMessage(content=text)]}
+
+    builder = StateGraph(State)
+    builder.add_node("classifier", classify)
+    builder.add_node("greet", reply("Hello there!"))
+    builder.add_node("assist", reply("How can I help you?"))
+    builder.add_node("fallback", reply("I don't understand."))
+    builder.add_edge(START, "classifier")
+    router = compile_routes(SPEC, builder)
+    builder.add_conditional_edges("classifier", router, router.path_map)
+    for node in ("greet", "assist", "fallback"):
+        builder.add_edge(node, END)
+    graph = builder.compile()
+
+    hello = graph.invoke({"messages": [HumanMessage(content="Hello")]})
+    other = graph.invoke({"messages": [HumanMessage(content="Foo bar")]})
+
+    assert hello["messages"][-1].content == "Hello there!"
+    assert other["messages"][-1].content == "I don't understand."
+    assert router.hits == {"greeting": 1, "default": 1}
+
+
+def test_unknown_node_fails_at_compile_time():
+    builder = StateGraph(dict)
+    builder.add_node("greet", lambda state: {})
+
+    with pytest.raises(ValueError, match="assist"):
+        compile_routes(SPEC, builder)
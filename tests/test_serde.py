@@ -0,0 +1,129 @@
+"""Tests for the msgpack checkpoint serializer in src/serde.py."""
+
+import uuid
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Annotated, TypedDict
+
+import pytest
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from src.serde import TYPE_TAG, MessagePackSerializer
+
+MESSAGES = [
+    SystemMessage(content="You are helpful", id="s"),
+    HumanMessage(content="What is 2 + 2?", id="h", metadata={"timestamp": 1.5}),
+    AIMessage(
+        content="",
+        id="a",
+        tool_calls=[{"name": "calculator", "args": {"expression": "2+2"}, "id": "c"}],
+        usage_metadata={"input_tokens": 3, "output_tokens": 2, "total_tokens": 5},
+        response_metadata={"model_name": "test"},
+    ),
+    ToolMessage(content="4.0", tool_call_id="c", id="t", status="success"),
+    AIMessage(content=[{"type": "text", "text": "It is 4"}], id="a2", name="agent"),
+]
+
+
+@pytest.fixture
+def serde():
+    return MessagePackSerializer()
+
+
+@pytest.mark.parametrize("message", MESSAGES, ids=lambda m: m.id)
+def test_messages_round_trip_exactly(serde, message):
+    type_, blob = serde.dumps_typed(message)
+    restored = serde.loads_typed((type_, blob))
+
+    assert type_ == TYPE_TAG
+    assert type(restored) is type(message)
+    assert restored == message
+    assert restored.__pydantic_extra__ == message.__pydantic_extra__
+
+
+def test_state_containers_round_trip(serde):
+    value = {
+        "messages": MESSAGES,
+        "results": {"call-1": [{"url": "https://example.com", "score": 0.9}]},
+        "errors": {},
+        "pair": ("a", 1),
+        "seen": {"x", "y"},
+        1: None,
+    }
+
+    assert serde.loads_typed(serde.dumps_typed(value)) == value
+
+
+def test_unsupported_values_use_the_fallback(serde):
+    value = {"at": datetime(2024, 1, 1, 12, 0)}
+
+    type_, blob = serde.dumps_typed(value)
+
+    assert type_ != TYPE_TAG
+    assert serde.loads_typed((type_, blob)) == value
+
+
+class Priority(Enum):
+    LOW = 1
+    HIGH = 2
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        Priority.HIGH,
+        uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        datetime(2024, 1, 1, 12, 0, tzinfo=UTC),
+    ],
+    ids=lambda value: type(value).__name__,
+)
+def test_values_keep_their_type_like_the_default_serializer(serde, value):
+    state = {"value": value, "messages": MESSAGES[:1]}
+
+    restored = serde.loads_typed(serde.dumps_typed(state))
+
+    assert restored == state
+    assert type(restored["value"]) is type(value)
+    assert restored == MemorySaver().serde.loads_typed(
+        MemorySaver().serde.dumps_typed(state)
+    )
+
+
+def test_blob_is_smaller_than_default(serde):
+    default = MemorySaver().serde
+
+    assert len(serde.dumps_typed(MESSAGES)[1]) < len(default.dumps_typed(MESSAGES)[1])
+
+
+def test_checkpointer_uses_serializer(serde):
+    class State(TypedDict):
+        messages: Annotated[list[BaseMessage], add_messages]
+
+    def respond(state: State) -> dict:
+        return {"messages": [AIMessage(content="reply")]}
+
+    builder = StateGraph(State)
+    builder.add_node("respond", respond)
+    builder.add_edge(START, "respond")
+    builder.add_edge("respond", END)
+    graph = builder.compile(checkpointer=MemorySaver(serde=serde))
+    config = {"configurable": {"thread_id": "1"}}
+
+    graph.invoke({"messages": [HumanMessage(content="hi")]}, config)
+    result = graph.invoke({"messages": [HumanMessage(content="again")]}, config)
+
+    assert [m.content for m in result["messages"]] == [
+        "hi",
+        "reply",
+        "again",
+        "reply",
+    ]
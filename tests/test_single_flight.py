@@ -0,0 +1,130 @@
+"""Tests for single-flight coalescing in src/single_flight.py."""
+
+import asyncio
+import gc
+
+import pytest
+
+from src.single_flight import SingleFlight, coalesced, tool_call_key
+
+
+def search(call_id, query):
+    return {"id": call_id, "tool_name": "TavilySearchResults", "args": {"query": query}}
+
+
+def test_tool_call_key_ignores_ids_and_normalizes_args():
+    assert tool_call_key(search("a", "Capital of France?")) == tool_call_key(
+        search("b", "capital of france")
+    )
+    assert tool_call_key(search("a", "x")) != tool_call_key(search("a", "y"))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_run_once():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {"calls": 1, "coalesced": 4, "inflight": 0}
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_are_not_cached():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return len(calls)
+
+    assert await flight.do("key", fetch) == 1
+    assert await flight.do("key", fetch) == 2
+
+
+@pytest.mark.asyncio
+async def test_exceptions_reach_every_waiter():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ConnectionError("upstream down")
+
+    outcomes = await asyncio.gather(
+        *(flight.do("key", fail) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(outcome, ConnectionError) for outcome in outcomes)
+    assert flight.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_the_call():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("key", fetch))
+    second = asyncio.ensure_future(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
+
+
+@pytest.mark.asyncio
+async def test_failure_after_every_waiter_left_is_not_reported():
+    flight = SingleFlight()
+    reported = []
+    asyncio.get_running_loop().set_exception_handler(
+        lambda loop, context: reported.append(context)
+    )
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise TimeoutError("search timed out")
+
+    waiter = asyncio.ensure_future(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0.02)
+    del waiter  # asyncio reports unretrieved exceptions when the task is freed
+    gc.collect()
+
+    assert flight.inflight == 0
+    assert reported == []
+
+
+@pytest.mark.asyncio
+async def test_coalesced_executor_keeps_per_id_attribution():
+    flight = SingleFlight()
+    executed = []
+
+    async def execute_tool(tool_call):
+        executed.append(tool_call["id"])
+        await asyncio.sleep(0.01)
+        return tool_call["id"], f"results for {tool_call['args']['query']}"
+
+    execute = coalesced(execute_tool, flight)
+    pending = [
+        search("search_1", "capital of France"),
+        search("search_2", "Capital of France?"),
+        search("search_3", "capital of Spain"),
+    ]
+    pairs = await asyncio.gather(*(execute(call) for call in pending))
+
+    assert dict(pairs) == {
+        "search_1": "results for capital of France",
+        "search_2": "results for capital of France",
+        "search_3": "results for capital of Spain",
+    }
+    assert executed == ["search_1", "search_3"]
@@ -0,0 +1,114 @@
+"""Tests for the delta-only update helpers in src/state_updates.py."""
+
+from typing import Annotated, TypedDict
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from src.serde import MessagePackSerializer, checkpoint_serializer
+from src.state_updates import DELETE, changes, delta_node, diff_maps, merge_maps
+
+
+def test_merge_maps_shares_untouched_submaps():
+    left = {"usage": {"calculator": 1}, "limits": {"calculator": 5}}
+
+    merged = merge_maps(left, {"usage": {"search": 1}})
+
+    assert merged == {
+        "usage": {"calculator": 1, "search": 1},
+        "limits": {"calculator": 5},
+    }
+    assert merged["limits"] is left["limits"]
+    assert left["usage"] == {"calculator": 1}
+
+
+def test_merge_maps_deletes_keys():
+    assert merge_maps({"a": 1, "b": 2}, {"a": DELETE}) == {"b": 2}
+
+
+def test_strings_are_never_deletions():
+    assert merge_maps({"a": 1}, {"a": "__delete__"}) == {"a": "__delete__"}
+    assert merge_maps({"a": 1}, {"a": "delete"}) == {"a": "delete"}
+
+
+@pytest.mark.parametrize("serde", [checkpoint_serializer(), MessagePackSerializer()])
+def test_delete_survives_checkpoint_serialization(serde):
+    restored = serde.loads_typed(serde.dumps_typed({"a": DELETE}))
+
+    assert restored["a"] is DELETE
+
+
+def test_empty_updates_do_not_reset_merged_maps():
+    usage = {"calculator": 2, "search": 1}
+
+    assert merge_maps(usage, {}) == usage
+    assert merge_maps(usage, dict.fromkeys(usage, DELETE)) == {}
+
+
+def test_diff_maps_round_trips_through_merge():
+    old = {"a": 1, "b": {"c": 2, "d": 3}, "e": 4}
+    new = {"a": 1, "b": {"c": 2, "d": 30}, "f": 5}
+
+    delta = diff_maps(old, new)
+
+    assert delta == {"b": {"d": 30}, "e": DELETE, "f": 5}
+    assert merge_maps(old, delta) == new
+
+
+def test_changes_drops_carried_over_keys():
+    state = {"messages": [HumanMessage(content="hi")], "tool_usage": {"a": 0}}
+
+    update = changes(
+        state,
+        {**state, "tool_usage": {"a": 1}, "tool_name": "a"},
+        map_keys=["tool_usage"],
+    )
+
+    assert update == {"tool_usage": {"a": 1}, "tool_name": "a"}
+
+
+@pytest.mark.asyncio
+async def test_delta_node_wraps_async_nodes():
+    @delta_node
+    async def node(state):
+        return {**state, "tool_name": "search"}
+
+    assert await node({"messages": [], "tool_name": None}) == {"tool_name": "search"}
+
+
+def test_delta_nodes_in_graph():
+    class State(TypedDict):
+        messages: Annotated[list[BaseMessage], add_messages]
+        tool_usage: Annotated[dict[str, int], merge_maps]
+        tool_name: str | None
+
+    @delta_node(map_keys=["tool_usage"])
+    def select(state: State) -> State:
+        usage = {**state["tool_usage"], "search": state["tool_usage"]["search"] + 1}
+        return {**state, "tool_usage": usage, "tool_name": "search"}
+
+    def respond(state: State) -> dict:
+        return {"messages": [AIMessage(content=f"used {state['tool_name']}")]}
+
+    builder = StateGraph(State)
+    builder.add_node("select", select)
+    builder.add_node("respond", respond)
+    builder.add_edge(START, "select")
+    builder.add_edge("select", "respond")
+    builder.add_edge("respond", END)
+
+    result = builder.compile().invoke(
+        {
+            "messages": [HumanMessage(content="search something")],
+            "tool_usage": {"search": 0, "calculator": 2},
+            "tool_name": None,
+        }
+    )
+
+    assert result["tool_usage"] == {"search": 1, "calculator": 2}
+    assert [m.content for m in result["messages"]] == [
+        "search something",
+        "used search",
+    ]
@@ -0,0 +1,95 @@
+"""Tests for the incremental rolling summary in src/summary.py."""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.summary import (
+    MIN_SUMMARY_CHARS,
+    SUMMARY_PREFIX,
+    fold_summary,
+    make_summary_node,
+)
+
+
+def conversation(*contents):
+    return [
+        (HumanMessage if index % 2 == 0 else AIMessage)(content=text, id=f"m{index}")
+        for index, text in enumerate(contents)
+    ]
+
+
+def test_first_fold_includes_every_message():
+    summary, cursor = fold_summary("", None, conversation("Hello!", "How are you?"))
+
+    assert summary == "Conversation summary: Hello! -> How are you?"
+    assert cursor == "m1"
+
+
+def test_fold_appends_only_new_messages():
+    messages = conversation("Hello!", "How are you?", "Goodbye!")
+    summary, cursor = fold_summary("", None, messages[:2])
+
+    summary, cursor = fold_summary(summary, cursor, messages)
+
+    assert summary == "Conversation summary: Hello! -> How are you? -> Goodbye!"
+    assert cursor == "m2"
+    assert fold_summary(summary, cursor, messages) == (summary, cursor)
+
+
+def test_evicted_messages_stay_in_the_summary():
+    messages = conversation("a", "b", "c", "d", "e")
+    summary, cursor = fold_summary("", None, messages[:3])
+
+    # The window has moved past the cursor; only the newer messages remain
+    summary, cursor = fold_summary(summary, cursor, messages[3:])
+
+    assert summary == SUMMARY_PREFIX + "a -> b -> c -> d -> e"
+    assert cursor == "m4"
+
+
+def test_summary_is_bounded():
+    messages = conversation(*(f"message {i}" for i in range(1000)))
+    summary, cursor = "", None
+    for end in range(1, len(messages) + 1):
+        summary, cursor = fold_summary(summary, cursor, messages[:end], max_chars=200)
+
+    assert len(summary) <= 200
+    assert summary.startswith(SUMMARY_PREFIX + "...")
+    assert summary.endswith("message 999")
+
+
+def test_trimming_drops_whole_entries():
+    messages = conversation("first entry", "second entry", "third entry")
+    limit = len(SUMMARY_PREFIX + "... -> third entry")
+
+    summary, _ = fold_summary("", None, messages, max_chars=limit)
+
+    assert summary == SUMMARY_PREFIX + "... -> third entry"
+
+
+def test_an_entry_longer_than_the_limit_is_replaced_by_the_marker():
+    messages = conversation("short", "x" * 500)
+
+    summary, cursor = fold_summary("", None, messages, max_chars=MIN_SUMMARY_CHARS)
+
+    assert summary == SUMMARY_PREFIX + "..."
+    assert cursor == "m1"
+
+
+def test_max_chars_must_fit_the_prefix_and_marker():
+    with pytest.raises(ValueError, match="max_chars"):
+        fold_summary("", None, conversation("Hello!"), max_chars=10)
+    with pytest.raises(ValueError, match="max_chars"):
+        make_summary_node(max_chars=MIN_SUMMARY_CHARS - 1)
+
+
+def test_summary_node_waits_for_min_messages():
+    node = make_summary_node(min_messages=3)
+    messages = conversation("Hello!", "How are you?", "Goodbye!")
+
+    assert node({"messages": messages[:2], "summary": ""}) == {}
+    update = node({"messages": messages, "summary": ""})
+    assert update == {
+        "summary": "Conversation summary: Hello! -> How are you? -> Goodbye!",
+        "summary_cursor": "m2",
+    }
@@ -0,0 +1,133 @@
+"""Tests for the local Tavily stand-in in src/tavily_server.py."""
+
+import random
+import statistics
+
+import pytest
+import requests
+
+from src import clients, config
+from src.tavily import TAVILY_API_URL, PooledTavilySearchAPIWrapper
+from src.tavily_server import (
+    ServerProfile,
+    StandInServer,
+    generate_results,
+    load_fixtures,
+    sample_latency,
+)
+
+
+def wrapper_for(server: StandInServer) -> PooledTavilySearchAPIWrapper:
+    return PooledTavilySearchAPIWrapper(tavily_api_key="tvly-test", api_url=server.url)
+
+
+def test_profile_validation():
+    with pytest.raises(ValueError, match="latency must be one of"):
+        ServerProfile(latency="gamma")
+    with pytest.raises(ValueError, match="error_rate"):
+        ServerProfile(error_rate=1.5)
+    with pytest.raises(ValueError, match="rate_limit"):
+        ServerProfile(rate_limit=0)
+
+
+@pytest.mark.parametrize("latency", ["uniform", "lognormal", "exponential"])
+def test_latency_distributions_have_the_requested_median(latency):
+    profile = ServerProfile(latency=latency, latency_ms=100, latency_spread=0.5)
+    rng = random.Random(0)
+    samples = [sample_latency(profile, rng) for _ in range(5000)]
+
+    assert statistics.median(samples) == pytest.approx(0.1, rel=0.1)
+    assert min(samples) >= 0
+
+
+def test_generated_results_are_deterministic():
+    first = generate_results("Weather in Paris?", max_results=3)
+
+    assert first == generate_results("weather in paris", max_results=3)
+    assert len(first) == 3
+    assert {"title", "url", "content", "score"} <= set(first[0])
+    assert first != generate_results("weather in Rome", max_results=3)
+
+
+def test_load_fixtures_normalizes_queries(tmp_path):
+    path = tmp_path / "fixtures.json"
+    path.write_text('{"Who is Ada?": [{"title": "Ada"}]}')
+
+    assert load_fixtures(path) == {"who is ada": [{"title": "Ada"}]}
+
+
+@pytest.mark.enable_socket
+def test_search_returns_fixtures_and_generated_results():
+    with StandInServer() as server:
+        wrapper = wrapper_for(server)
+        paris = wrapper.results("Capital of France?", max_results=5)
+        other = wrapper.raw_results("langgraph reducers", max_results=2)
+
+    assert paris[0]["url"] == "https://en.wikipedia.org/wiki/Paris"
+    assert other["results"] == generate_results("langgraph reducers", 2)
+    assert server.stats["ok"] == 2
+
+
+@pytest.mark.enable_socket
+def test_injected_errors():
+    with StandInServer(ServerProfile(error_rate=1.0, error_status=503)) as server:
+        with pytest.raises(requests.HTTPError, match="503"):
+            wrapper_for(server).raw_results("anything")
+
+    assert server.stats["errors"] == 1
+
+
+@pytest.mark.enable_socket
+def test_rate_limit_answers_429_with_retry_after():
+    profile = ServerProfile(rate_limit=0.5, burst=2)
+    with StandInServer(profile) as server:
+        session = clients.registry.http_session()
+        statuses = [
+            session.post(f"{server.url}/search", json={"query": "q"})
+            for _ in range(3)
+        ]
+
+    assert [response.status_code for response in statuses] == [200, 200, 429]
+    assert int(statuses[-1].headers["Retry-After"]) >= 1
+    assert server.stats["rate_limited"] == 1
+
+
+@pytest.mark.enable_socket
+@pytest.mark.asyncio
+async def test_async_search_through_the_shared_session():
+    with StandInServer() as server:
+        results = await wrapper_for(server).results_async("capital of france")
+        await clients.registry.aclose()
+
+    assert results[0]["title"] == "Paris - Wikipedia"
+
+
+@pytest.fixture
+def tavily_env(monkeypatch):
+    """Set TAVILY_* variables with the settings caches cleared around the test."""
+
+    def clear():
+        config.clear_settings_cache()
+        # test_config reloads src.config; clients keeps the original function
+        clients.get_secret.cache_clear()
+
+    monkeypatch.setenv("TAVILY_API_KEY", "tvly-test")
+    clear()
+    yield monkeypatch
+    clear()
+
+
+def test_tavily_api_url_switch(tavily_env):
+    tavily_env.setenv("TAVILY_API_URL", "http://127.0.0.1:8765")
+
+    tool = clients._create_tavily_tool()
+
+    assert tool.api_wrapper.api_url == "http://127.0.0.1:8765"
+
+
+def test_empty_tavily_api_url_uses_the_default(tavily_env):
+    tavily_env.setenv("TAVILY_API_URL", "")
+
+    tool = clients._create_tavily_tool()
+
+    assert tool.api_wrapper.api_url == TAVILY_API_URL
@@ -0,0 +1,185 @@
+"""Tests for the tool result cache in src/tool_cache.py."""
+
+import asyncio
+import math
+
+import pytest
+
+from src.tool_cache import ToolResultCache, cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingTool:
+    name = "tavily_search_results_json"
+
+    def __init__(self, result=None):
+        self.calls = []
+        self.result = result
+
+    def invoke(self, args):
+        self.calls.append(args)
+        return self.result or [{"url": "https://example.com", "content": "Paris"}]
+
+    async def ainvoke(self, args):
+        await asyncio.sleep(0)
+        return self.invoke(args)
+
+
+def test_cache_key_normalizes_string_arguments():
+    assert cache_key("search", {"query": "Capital of  France?"}) == cache_key(
+        "search", {"query": "capital of france"}
+    )
+    assert cache_key("search", {"a": 1, "b": 2}) == cache_key(
+        "search", {"b": 2, "a": 1}
+    )
+    assert cache_key("search", {"query": "x"}) != cache_key("other", {"query": "x"})
+
+
+def test_repeated_queries_call_the_tool_once():
+    tool = CountingTool()
+    cache = ToolResultCache()
+
+    first = cache.invoke(tool, {"query": "capital of France"})
+    second = cache.invoke(tool, {"query": "Capital of France?"})
+
+    assert first == second
+    assert len(tool.calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_expire_after_their_ttl():
+    clock = FakeClock()
+    cache = ToolResultCache(ttl=60, clock=clock)
+    cache.put("search", {"query": "a"}, ["default ttl"])
+    cache.put("search", {"query": "b"}, ["short ttl"], ttl=5)
+
+    clock.now += 10
+    assert cache.get("search", {"query": "a"}) == ["default ttl"]
+    assert cache.get("search", {"query": "b"}) is None
+
+    clock.now += 60
+    assert cache.get("search", {"query": "a"}) is None
+    assert cache.expirations == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ToolResultCache(maxsize=2)
+    cache.put("search", {"query": "a"}, 1)
+    cache.put("search", {"query": "b"}, 2)
+    cache.get("search", {"query": "a"})
+    cache.put("search", {"query": "c"}, 3)
+
+    assert cache.get("search", {"query": "b"}) is None
+    assert cache.get("search", {"query": "a"}) == 1
+    assert cache.evictions == 1
+
+
+def test_error_strings_are_not_cached():
+    tool = CountingTool(result="HTTPError('429 Too Many Requests')")
+    cache = ToolResultCache()
+
+    cache.invoke(tool, {"query": "q"})
+    cache.invoke(tool, {"query": "q"})
+
+    assert len(tool.calls) == 2
+    assert len(cache) == 0
+
+
+def test_sqlite_tier_survives_a_new_cache(tmp_path):
+    path = tmp_path / "tools.sqlite"
+    tool = CountingTool()
+    first = ToolResultCache(path=path)
+    first.invoke(tool, {"query": "capital of France"})
+    first.close()
+
+    second = ToolResultCache(path=path)
+    result = second.invoke(tool, {"query": "capital of france"})
+
+    assert result == [{"url": "https://example.com", "content": "Paris"}]
+    assert len(tool.calls) == 1
+    assert (second.hits, second.disk_hits) == (1, 1)
+    assert len(second) == 1  # promoted into memory
+    second.close()
+
+
+def test_sqlite_tier_honours_ttl(tmp_path):
+    clock = FakeClock()
+    path = tmp_path / "tools.sqlite"
+    writer = ToolResultCache(ttl=30, path=path, clock=clock)
+    writer.put("search", {"query": "a"}, ["old"])
+    writer.put("search", {"query": "b"}, ["forever"], ttl=math.inf)
+    writer.close()
+
+    clock.now += 60
+    reader = ToolResultCache(ttl=None, path=path, clock=clock)
+    assert reader.get("search", {"query": "a"}) is None
+    assert reader.get("search", {"query": "b"}) == ["forever"]
+    assert reader.purge_expired() == 0  # "a" was already dropped by get()
+    reader.close()
+
+
+def test_purge_expired_and_clear(tmp_path):
+    clock = FakeClock()
+    cache = ToolResultCache(ttl=10, path=tmp_path / "tools.sqlite", clock=clock)
+    cache.put("search", {"query": "a"}, 1)
+    cache.put("search", {"query": "b"}, 2, ttl=100)
+    clock.now += 20
+
+    assert cache.purge_expired() == 2  # memory and disk copies of "a"
+    assert cache.get("search", {"query": "b"}) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()["hits"] == 0
+    assert cache.get("search", {"query": "b"}) is None
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_caches_async_results():
+    tool = CountingTool()
+    cache = ToolResultCache()
+
+    results = [await cache.ainvoke(tool, {"query": "q"}) for _ in range(3)]
+
+    assert results[0] == results[2]
+    assert len(tool.calls) == 1
+    assert cache.hit_rate == pytest.approx(2 / 3)
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_uses_a_worker_thread_for_sqlite(tmp_path, monkeypatch):
+    tool = CountingTool()
+    cache = ToolResultCache(path=tmp_path / "tools.sqlite")
+    offloaded = []
+
+    async def to_thread(func, *args):
+        offloaded.append(func.__name__)
+        return func(*args)
+
+    monkeypatch.setattr("src.tool_cache.asyncio.to_thread", to_thread)
+    await cache.ainvoke(tool, {"query": "q"})
+
+    assert offloaded == ["_get_disk", "_persist"]
+    cache.close()
+
+
+def test_unserializable_results_stay_in_memory(tmp_path, caplog):
+    result = {"when": object()}
+    cache = ToolResultCache(path=tmp_path / "tools.sqlite")
+
+    assert cache.get_or_call("search", {"query": "q"}, lambda args: result) is result
+    assert cache.get("search", {"query": "q"}) is result
+    assert "Not persisting" in caplog.text
+    cache.close()
+
+    reopened = ToolResultCache(path=tmp_path / "tools.sqlite")
+    assert reopened.get("search", {"query": "q"}) is None
+    reopened.close()
@@ -0,0 +1,116 @@
+"""Tests for the memory-mapped transcript store in src/transcripts.py."""
+
+from typing import Annotated, TypedDict
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from src.transcripts import TranscriptStore, thread_id_from
+from src.trimming import make_trim_node
+
+
+def messages(count, start=0):
+    return [HumanMessage(content=f"m{i}", id=str(i)) for i in range(start, count)]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with TranscriptStore(tmp_path) as store:
+        yield store
+
+
+def test_append_and_read_slices(store):
+    store.append("thread", messages(3))
+    store.append("thread", messages(5, start=3))
+
+    assert store.count("thread") == 5
+    assert store.read("thread") == messages(5)
+    assert store.read("thread", -2) == messages(5, start=3)
+    assert [m.content for m in store.iter("thread", 1, 3)] == ["m1", "m2"]
+
+
+def test_threads_are_separate_and_unknown_threads_are_empty(store, tmp_path):
+    store.append("a/1", messages(1))
+
+    assert store.read("b") == []
+    assert store.count("b") == 0
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a%2F1.log"]
+
+
+def test_index_is_rebuilt_on_reopen(tmp_path):
+    with TranscriptStore(tmp_path) as store:
+        store.append("thread", messages(4))
+
+    with TranscriptStore(tmp_path) as store:
+        assert store.count("thread") == 4
+        store.append("thread", messages(6, start=4))
+        assert store.read("thread", 3) == messages(6, start=3)
+
+
+def test_open_logs_are_bounded_and_reopened_on_demand(tmp_path):
+    with TranscriptStore(tmp_path, max_open=2) as store:
+        for thread in "abc":
+            store.append(thread, messages(2))
+
+        assert list(store._transcripts) == ["b", "c"]
+        assert store.read("a") == messages(2)
+        assert list(store._transcripts) == ["c", "a"]
+
+
+def test_torn_tail_is_truncated_on_reopen(tmp_path):
+    with TranscriptStore(tmp_path) as store:
+        store.append("thread", messages(3))
+    log = tmp_path / "thread.log"
+    complete = log.stat().st_size
+    with log.open("ab") as file:
+        file.write(b"\x00\x20Human")  # header of a record cut short
+
+    with TranscriptStore(tmp_path) as store:
+        assert store.count("thread") == 3
+        assert log.stat().st_size == complete
+        store.append("thread", messages(4, start=3))
+        assert store.read("thread") == messages(4)
+
+
+def test_appends_skip_messages_already_stored(tmp_path):
+    with TranscriptStore(tmp_path) as store:
+        assert store.append("thread", messages(3)) == 3
+        assert store.append("thread", messages(4) + messages(4)) == 1
+
+    with TranscriptStore(tmp_path) as store:
+        store.spill(messages(4), {"configurable": {"thread_id": "thread"}})
+        assert store.read("thread") == messages(4)
+
+
+def test_thread_id_from_requires_thread():
+    assert thread_id_from({"configurable": {"thread_id": 7}}) == "7"
+    with pytest.raises(KeyError):
+        thread_id_from({})
+
+
+def test_trim_node_spills_evicted_messages(store):
+    class State(TypedDict):
+        messages: Annotated[list[BaseMessage], add_messages]
+
+    def respond(state: State) -> dict:
+        return {"messages": [AIMessage(content="reply")]}
+
+    builder = StateGraph(State)
+    builder.add_node("respond", respond)
+    builder.add_node("windowing", make_trim_node(2, on_evict=store.spill))
+    builder.add_edge(START, "respond")
+    builder.add_edge("respond", "windowing")
+    builder.add_edge("windowing", END)
+    graph = builder.compile(checkpointer=MemorySaver())
+    config = {"configurable": {"thread_id": "conversation"}}
+
+    for turn in range(3):
+        update = {"messages": [HumanMessage(content=f"turn {turn}")]}
+        state = graph.invoke(update, config)
+
+    spilled = store.read("conversation")
+    assert [m.content for m in state["messages"]] == ["turn 2", "reply"]
+    assert [m.content for m in spilled] == ["turn 0", "reply", "turn 1", "reply"]
@@ -0,0 +1,193 @@
+"""Tests for RemoveMessage-based window trimming in src/trimming.py."""
+
+from typing import Annotated, TypedDict
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, RemoveMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from src.trimming import (
+    TOKEN_COUNT_KEY,
+    budget_evicted_messages,
+    compact_checkpoints,
+    make_token_trim_node,
+    make_trim_node,
+    message_tokens,
+    window_removals,
+)
+
+WINDOW_SIZE = 3
+
+
+class State(TypedDict):
+    messages: Annotated[list[BaseMessage], add_messages]
+    window_size: int
+
+
+def respond(state: State) -> dict:
+    return {"messages": [AIMessage(content="reply")]}
+
+
+def build_graph(checkpointer):
+    builder = StateGraph(State)
+    builder.add_node("respond", respond)
+    builder.add_node("windowing", make_trim_node())
+    builder.add_edge(START, "respond")
+    builder.add_edge("respond", "windowing")
+    builder.add_edge("windowing", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+def saver_bytes(saver):
+    """Total serialized size of everything a MemorySaver holds."""
+    checkpoints = [
+        saved
+        for namespaces in saver.storage.values()
+        for checkpoints in namespaces.values()
+        for saved in checkpoints.values()
+    ]
+    writes = [write for stored in saver.writes.values() for write in stored.values()]
+    return (
+        sum(len(blob) for _, blob in saver.blobs.values())
+        + sum(len(c[1]) + len(m[1]) for c, m, _ in checkpoints)
+        + sum(len(blob) for _, _, (_, blob), _ in writes)
+    )
+
+
+def run_turns(turns, saver=None, compact=False):
+    """Run a conversation on one thread and yield (state, checkpoint bytes)."""
+    saver = saver or MemorySaver()
+    graph = build_graph(saver)
+    config = {"configurable": {"thread_id": "conversation"}}
+
+    for turn in range(turns):
+        state = graph.invoke(
+            {
+                "messages": [HumanMessage(content=f"turn {turn:04d}")],
+                "window_size": WINDOW_SIZE,
+            },
+            config,
+        )
+        if compact:
+            compact_checkpoints(saver, "conversation")
+        checkpoint = saver.get_tuple(config).checkpoint
+        _, blob = saver.serde.dumps_typed(checkpoint["channel_values"]["messages"])
+        yield state, len(blob)
+
+
+def test_window_removals():
+    messages = [HumanMessage(content=str(i), id=str(i)) for i in range(5)]
+
+    removals = window_removals(messages, 3)
+
+    assert [type(r) for r in removals] == [RemoveMessage, RemoveMessage]
+    assert [r.id for r in removals] == ["0", "1"]
+    assert window_removals(messages, 5) == []
+
+
+def test_trim_node_returns_only_deltas():
+    node = make_trim_node(2)
+    messages = [HumanMessage(content=str(i), id=str(i)) for i in range(3)]
+
+    assert node({"messages": messages[:2]}) == {}
+    assert [r.id for r in node({"messages": messages})["messages"]] == ["0"]
+
+
+def test_channel_stays_at_window_size():
+    for state, _ in run_turns(20):
+        assert len(state["messages"]) <= WINDOW_SIZE
+
+    assert [m.content for m in state["messages"]] == ["reply", "turn 0019", "reply"]
+
+
+def test_checkpoint_size_is_flat_past_the_window():
+    sizes = [size for _, size in run_turns(40)]
+
+    assert sizes[10] == sizes[39]
+    assert max(sizes) == sizes[-1]
+
+
+def test_compaction_keeps_total_saver_memory_flat():
+    saver = MemorySaver()
+    sizes = [saver_bytes(saver) for _ in run_turns(60, saver, compact=True)]
+
+    # Only checkpoint IDs and version strings vary in length
+    assert max(sizes[10:]) - min(sizes[10:]) < 32
+    assert len(saver.storage["conversation"][""]) == 1
+
+
+def test_compaction_keeps_other_threads_and_the_latest_state():
+    saver = MemorySaver()
+    graph = build_graph(saver)
+    config = {"configurable": {"thread_id": "conversation"}}
+    other = {"configurable": {"thread_id": "other"}}
+    for thread in (config, other):
+        for turn in range(3):
+            update = {"messages": [HumanMessage(f"turn {turn}")], "window_size": 3}
+            graph.invoke(update, thread)
+    before = graph.get_state(config).values
+
+    deleted = compact_checkpoints(saver, "conversation", keep=2)
+
+    assert deleted == len(list(saver.list(other))) - 2
+    assert len(list(saver.list(config))) == 2
+    assert graph.get_state(config).values == before
+    update = {"messages": [HumanMessage("turn 3")], "window_size": 3}
+    state = graph.invoke(update, config)
+    assert [m.content for m in state["messages"]] == ["reply", "turn 3", "reply"]
+
+
+def counting_counter(calls):
+    def counter(message):
+        calls.append(message.id)
+        return len(message.content)
+
+    return counter
+
+
+def test_token_counts_are_cached_on_the_message():
+    calls = []
+    message = HumanMessage(content="abcd", id="m")
+
+    assert message_tokens(message, counting_counter(calls)) == 4
+    assert message_tokens(message, counting_counter(calls)) == 4
+    assert calls == ["m"]
+    assert message.response_metadata[TOKEN_COUNT_KEY] == 4
+
+
+def test_budget_evicts_oldest_messages_over_budget():
+    messages = [HumanMessage(content="x" * n, id=str(n)) for n in (5, 3, 4)]
+
+    evicted = budget_evicted_messages(messages, 7, lambda m: len(m.content))
+
+    assert [m.id for m in evicted] == ["5"]
+
+
+def test_budget_keeps_newest_message_even_if_oversized():
+    messages = [HumanMessage(content="x" * n, id=str(n)) for n in (1, 2, 50)]
+
+    evicted = budget_evicted_messages(messages, 10, lambda m: len(m.content))
+
+    assert [m.id for m in evicted] == ["1", "2"]
+
+
+def test_token_trim_node_only_counts_new_messages():
+    calls = []
+    node = make_token_trim_node(6, token_counter=counting_counter(calls))
+    messages = [HumanMessage(content="xx", id=str(i)) for i in range(4)]
+
+    assert node({"messages": messages[:3]}) == {}
+    update = node({"messages": messages})
+
+    assert [r.id for r in update["messages"]] == ["0"]
+    assert sorted(calls) == ["0", "1", "2", "3"]
+
+
+def test_token_trim_node_reads_budget_from_state():
+    node = make_token_trim_node(token_counter=lambda m: len(m.content))
+    messages = [HumanMessage(content="x" * 4, id=str(i)) for i in range(3)]
+
+    update = node({"messages": messages, "token_budget": 8})
+
+    assert [r.id for r in update["messages"]] == ["0"]
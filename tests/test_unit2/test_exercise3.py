@@ -8,8 +8,6 @@ from typing import Any
 import pytest
 from langchain_core.messages import HumanMessage
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 